@@ -1,3 +1,4 @@
 from .collection import Collection, CollectionBase, CollectionGroup  # type: ignore # isort:skip # noqa: F401
 from .collection_aggregator import CollectionAggregator  # noqa: F401
 from .source_shell import Customize, SourceShell  # noqa: F401
+from .fetch_executor import FetchExecutor, FetchResult, fetch_all_async  # noqa: F401
@@ -0,0 +1,244 @@
+"""Record and replay HTTP traffic of sources.
+
+A cassette holds the requests and responses of one or more named runs
+(e.g. the TEST_CASES of a source). In record mode, requests are sent to the
+real servers and every response is stored. In replay mode, the stored
+responses are served without any network access, optionally delayed by an
+artificial latency.
+
+Cassette files are gzip compressed JSON, response bodies are stored as
+text if possible and base64 encoded otherwise.
+"""
+
+import base64
+import gzip
+import hashlib
+import io
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import requests
+from urllib3.response import HTTPResponse
+
+from . import http_client, tls
+
+_LOGGER = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+
+RECORD = "record"
+REPLAY = "replay"
+
+# headers which don't apply to the stored (decoded) body
+_DROPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+def _body_digest(body) -> Optional[str]:
+    if body is None:
+        return None
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    elif not isinstance(body, bytes):
+        # file like object or generator, can't be matched
+        return None
+    return hashlib.sha1(body).hexdigest()
+
+
+def _encode_body(body: bytes) -> dict:
+    try:
+        return {"text": body.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"base64": base64.b64encode(body).decode("ascii")}
+
+
+def _decode_body(item: dict) -> bytes:
+    if "text" in item:
+        return item["text"].encode("utf-8")
+    return base64.b64decode(item.get("base64", ""))
+
+
+class Cassette:
+    """Recorded interactions of one run.
+
+    Interactions are matched by method, URL and request body. Identical
+    requests are answered in recording order; if a request is repeated
+    more often than recorded, the last response is served again.
+    """
+
+    def __init__(self, interactions: Optional[List[dict]] = None):
+        self._interactions = list(interactions or [])
+        self._lock = threading.Lock()
+        self._played: Dict[tuple, int] = defaultdict(int)
+
+    @property
+    def interactions(self) -> List[dict]:
+        return self._interactions
+
+    def __len__(self):
+        return len(self._interactions)
+
+    @staticmethod
+    def _key(method: str, url: str, body_digest: Optional[str]):
+        return (method.upper(), url, body_digest)
+
+    def record(self, request: requests.PreparedRequest, response, elapsed: float):
+        raw_headers = getattr(response.raw, "headers", None) or response.headers
+        interaction = {
+            "request": {
+                "method": request.method,
+                "url": request.url,
+                "body": _body_digest(request.body),
+            },
+            "response": {
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": [
+                    [name, value]
+                    for name, value in raw_headers.items()
+                    if name.lower() not in _DROPPED_HEADERS
+                ],
+                "body": _encode_body(response.content),
+                "elapsed": round(elapsed, 4),
+            },
+        }
+        with self._lock:
+            self._interactions.append(interaction)
+
+    def play(self, request: requests.PreparedRequest) -> Optional[dict]:
+        """Return the recorded response for request, None if there is none."""
+        key = self._key(request.method, request.url, _body_digest(request.body))
+        with self._lock:
+            matches = [
+                i
+                for i in self._interactions
+                if self._key(
+                    i["request"]["method"], i["request"]["url"], i["request"]["body"]
+                )
+                == key
+            ]
+            if not matches:
+                # e.g. a request body containing a timestamp
+                matches = [
+                    i
+                    for i in self._interactions
+                    if self._key(i["request"]["method"], i["request"]["url"], None)
+                    == key[:2] + (None,)
+                ]
+            if not matches:
+                return None
+            index = min(self._played[key], len(matches) - 1)
+            self._played[key] += 1
+        return matches[index]["response"]
+
+    def rewind(self):
+        with self._lock:
+            self._played.clear()
+
+
+def load_cassettes(filename: str) -> Dict[str, Cassette]:
+    """Load all named cassettes from a cassette file."""
+    with gzip.open(filename, "rt", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != CASSETTE_VERSION:
+        raise ValueError(f"unsupported cassette version in {filename}")
+    return {name: Cassette(items) for name, items in data["cassettes"].items()}
+
+
+def save_cassettes(filename: str, cassettes: Dict[str, Cassette]):
+    """Save named cassettes to a cassette file."""
+    data = {
+        "version": CASSETTE_VERSION,
+        "cassettes": {name: c.interactions for name, c in cassettes.items()},
+    }
+    with gzip.open(filename, "wt", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
+
+
+class CassetteAdapter(http_client.SourceAdapter):
+    """SourceAdapter which records to or replays from a cassette.
+
+    In replay mode, every response is delayed by latency seconds plus
+    latency_scale times the recorded response time. Requests without a
+    recorded response raise requests.ConnectionError.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        mode: str = REPLAY,
+        latency: float = 0.0,
+        latency_scale: float = 0.0,
+        **kwargs,
+    ):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"invalid cassette mode: {mode}")
+        self._cassette = cassette
+        self._mode = mode
+        self._latency = latency
+        self._latency_scale = latency_scale
+        super().__init__(**kwargs)
+
+    def transport_send(self, request, **kwargs):
+        if self._mode == RECORD:
+            start = time.monotonic()
+            response = super().transport_send(request, **kwargs)
+            # reads the whole body, streaming responses are served from memory
+            self._cassette.record(request, response, time.monotonic() - start)
+            return response
+
+        recorded = self._cassette.play(request)
+        if recorded is None:
+            raise requests.ConnectionError(
+                f"no recorded response for {request.method} {request.url}",
+                request=request,
+            )
+        delay = self._latency + self._latency_scale * recorded.get("elapsed", 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        raw = HTTPResponse(
+            body=io.BytesIO(_decode_body(recorded["body"])),
+            headers=recorded["headers"],
+            status=recorded["status"],
+            reason=recorded.get("reason"),
+            preload_content=False,
+            decode_content=False,
+        )
+        return self.build_response(request, raw)
+
+
+@contextmanager
+def use_cassette(
+    cassette: Cassette,
+    mode: str = REPLAY,
+    latency: float = 0.0,
+    latency_scale: float = 0.0,
+):
+    """Route all requests of http_client through cassette within the block."""
+    client = http_client.HttpClient()
+    for name in (http_client.DEFAULT_ADAPTER, http_client.LEGACY_SSL_ADAPTER):
+        client.register_adapter(
+            name,
+            CassetteAdapter(
+                cassette,
+                mode=mode,
+                latency=latency,
+                latency_scale=latency_scale,
+                default_timeout=client.timeout,
+                tls_profile=(
+                    tls.LEGACY
+                    if name == http_client.LEGACY_SSL_ADAPTER
+                    else tls.DEFAULT
+                ),
+            ),
+        )
+    previous = http_client.get_http_client()
+    http_client.set_http_client(client)
+    try:
+        yield cassette
+    finally:
+        http_client.set_http_client(previous)
@@ -8,8 +8,24 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class CollectionAggregator:
-    def __init__(self, shells):
+    def __init__(
+        self,
+        shells,
+        executor=None,
+        max_age=None,
+        retry_interval=timedelta(minutes=5),
+    ):
+        """Aggregate entries of several SourceShell's.
+
+        If executor and max_age are given, queries trigger a background
+        refresh of all shells whose entries are older than max_age
+        (stale-while-revalidate). Queries never wait for these refreshes.
+        Shells whose last fetch failed are retried after retry_interval.
+        """
         self._shells = shells
+        self._executor = executor
+        self._max_age = max_age
+        self._retry_interval = retry_interval
 
     @property
     def _entries(self):
@@ -21,6 +37,21 @@ class CollectionAggregator:
         """Simply return the timestamp of the first source."""
         return self._shells[0].refreshtime
 
+    @property
+    def stale(self):
+        """Return True if any source serves stale entries."""
+        return any(s.stale for s in self._shells)
+
+    def revalidate(self):
+        """Trigger background refresh of outdated sources."""
+        if self._executor is None or self._max_age is None:
+            return
+        for s in self._shells:
+            if not s.refreshing and s.needs_refresh(
+                self._max_age, self._retry_interval
+            ):
+                s.fetch_in_background(self._executor)
+
     @property
     def types(self):
         """Return set() of all collection types."""
@@ -40,6 +71,7 @@ class CollectionAggregator:
         count -- limits the number of returned entries (default=10)
         leadtime -- limits the timespan in days of returned entries (default=7, 0 = today)
         """
+        self.revalidate()
         return self._filter(
             self._entries,
             count=count,
@@ -58,6 +90,7 @@ class CollectionAggregator:
         include_today=False,
     ):
         """Return list of all entries, grouped by day, limited by count and/or leadtime."""
+        self.revalidate()
         entries = []
 
         iterator = itertools.groupby(
@@ -0,0 +1,72 @@
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+from .exceptions import FetchTimeoutError
+
+# default budget for one SourceShell fetch, including all requests and retries
+DEFAULT_FETCH_TIMEOUT = 120.0  # seconds
+
+# (connect, read) timeout for requests without explicit timeout
+DEFAULT_REQUEST_TIMEOUT = (10.0, 60.0)
+
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "wcs_deadline", default=None
+)
+
+
+@contextmanager
+def fetch_deadline(timeout: Optional[float]):
+    """Limit all requests within the block to timeout seconds in total.
+
+    Nested deadlines can only shorten the budget, never extend it.
+    """
+    if timeout is None:
+        yield
+        return
+    deadline = time.monotonic() + timeout
+    current = _deadline.get()
+    if current is not None:
+        deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Return remaining seconds of the current deadline, None if there is none."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def check():
+    """Raise FetchTimeoutError if the current deadline has passed."""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise FetchTimeoutError()
+
+
+def request_timeout(timeout=None, default=DEFAULT_REQUEST_TIMEOUT):
+    """Return timeout for one request, limited by the current deadline.
+
+    timeout is the value passed to requests, i.e. None, a number or a
+    (connect, read) tuple; default is used if it is None. Raises
+    FetchTimeoutError if the deadline has already passed.
+    """
+    if timeout is None:
+        timeout = default
+
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise FetchTimeoutError()
+
+    if isinstance(timeout, tuple):
+        return tuple(left if t is None else min(t, left) for t in timeout)
+    return min(timeout, left)
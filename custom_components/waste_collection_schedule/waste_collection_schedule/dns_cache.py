@@ -0,0 +1,163 @@
+"""Process wide DNS cache for source requests.
+
+Addresses are resolved with socket.getaddrinfo(), so /etc/hosts and the
+system's address ordering are respected. If dnspython is installed, the TTL
+of the A record is used as cache lifetime, otherwise default_ttl.
+
+If a host can't be resolved anymore, its expired addresses are still used
+for up to max_stale seconds.
+"""
+
+import concurrent.futures
+import ipaddress
+import logging
+import socket
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import dns.resolver
+except ImportError:
+    dns = None
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_TTL = 300.0  # seconds
+MIN_TTL = 30.0
+MAX_TTL = 3600.0
+MAX_STALE = 3600.0
+
+
+def is_ip_address(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host.strip("[]"))
+        return True
+    except ValueError:
+        return False
+
+
+class DnsCache:
+    """Cache of resolved addresses per host name."""
+
+    def __init__(
+        self,
+        default_ttl: float = DEFAULT_TTL,
+        min_ttl: float = MIN_TTL,
+        max_ttl: float = MAX_TTL,
+        max_stale: float = MAX_STALE,
+    ):
+        self._default_ttl = default_ttl
+        self._min_ttl = min_ttl
+        self._max_ttl = max_ttl
+        self._max_stale = max_stale
+        self._lock = threading.Lock()
+        # host -> (addresses, expiry time)
+        self._entries: Dict[str, Tuple[List[str], float]] = {}
+
+        # statistics
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+        self._lookup_time = 0.0
+
+    def _ttl(self, host: str) -> float:
+        if dns is None:
+            return self._default_ttl
+        try:
+            answer = dns.resolver.resolve(host, "A", lifetime=5.0)
+            ttl = answer.rrset.ttl
+        except Exception:
+            return self._default_ttl
+        return min(max(ttl, self._min_ttl), self._max_ttl)
+
+    def _lookup(self, host: str, port: Optional[int]) -> List[str]:
+        addresses = []
+        for *_, sockaddr in socket.getaddrinfo(host, port, type=socket.SOCK_STREAM):
+            if sockaddr[0] not in addresses:
+                addresses.append(sockaddr[0])
+        return addresses
+
+    def resolve(self, host: str, port: Optional[int] = None) -> List[str]:
+        """Return addresses of host, resolve it if it isn't cached.
+
+        Raises socket.gaierror if the host can't be resolved and no stale
+        addresses are available.
+        """
+        host = host.lower().rstrip(".")
+        if is_ip_address(host):
+            return [host.strip("[]")]
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(host)
+            if entry is not None and entry[1] > now:
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+
+        start = time.perf_counter()
+        try:
+            addresses = self._lookup(host, port)
+        except OSError as error:
+            if entry is not None and now - entry[1] < self._max_stale:
+                _LOGGER.debug(f"using stale addresses for {host}: {error}")
+                with self._lock:
+                    self._stale += 1
+                return entry[0]
+            raise
+        ttl = self._ttl(host)
+        with self._lock:
+            self._lookup_time += time.perf_counter() - start
+            self._entries[host] = (addresses, time.monotonic() + ttl)
+        return addresses
+
+    def prefetch(
+        self,
+        hosts: Iterable[str],
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> Dict[str, Optional[List[str]]]:
+        """Resolve hosts concurrently, return addresses or None per host."""
+        hosts = set(hosts)
+        if not hosts:
+            return {}
+
+        def resolve(host):
+            try:
+                return self.resolve(host)
+            except OSError as error:
+                _LOGGER.debug(f"failed to resolve {host}: {error}")
+                return None
+
+        if executor is not None:
+            return dict(zip(hosts, executor.map(resolve, hosts)))
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(hosts), 16), thread_name_prefix="wcs_dns"
+        ) as pool:
+            return dict(zip(hosts, pool.map(resolve, hosts)))
+
+    def invalidate(self, host: Optional[str] = None):
+        """Remove host, or all hosts if None, from the cache."""
+        with self._lock:
+            if host is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(host.lower().rstrip("."), None)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "hosts": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "stale": self._stale,
+                "lookup_time": self._lookup_time,
+            }
+
+
+_dns_cache = DnsCache()
+
+
+def get_dns_cache() -> DnsCache:
+    """Return the process wide DNS cache."""
+    return _dns_cache
@@ -0,0 +1,27 @@
+class SourceArgumentNotFound(ValueError):
+    """Raised by sources if a configured argument, e.g. a street, is unknown.
+
+    This is a permanent error: fetching again with the same arguments will
+    fail again, therefore the framework doesn't retry it immediately.
+    """
+
+    def __init__(self, argument: str, value, message: str = None):
+        self.argument = argument
+        self.value = value
+        super().__init__(message or f"{argument} not found: {value}")
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider which is known to be down."""
+
+    def __init__(self, key: str, retry_in: float):
+        self.key = key
+        self.retry_in = retry_in
+        super().__init__(f"circuit open for {key}, retry in {retry_in:.0f}s")
+
+
+class FetchTimeoutError(TimeoutError):
+    """Raised if a fetch exceeds its deadline, see deadline.fetch_deadline()."""
+
+    def __init__(self, message: str = "fetch deadline exceeded"):
+        super().__init__(message)
@@ -0,0 +1,294 @@
+import asyncio
+import concurrent.futures
+import logging
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .exceptions import FetchTimeoutError
+from .network_stats import get_network_stats
+from .prewarm import DEFAULT_PREWARM_TIMEOUT, prewarm
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_MAX_BATCH_SIZE = 1  # no batching
+
+
+class FetchResult:
+    """Outcome of one SourceShell refresh."""
+
+    def __init__(
+        self,
+        shell,
+        success: bool,
+        error: Optional[BaseException] = None,
+        duration: Optional[float] = None,
+        timed_out: bool = False,
+    ):
+        self._shell = shell
+        self._success = success
+        self._error = error
+        self._duration = duration
+        self._timed_out = timed_out
+
+    @property
+    def shell(self):
+        return self._shell
+
+    @property
+    def unique_id(self):
+        return self._shell.unique_id
+
+    @property
+    def success(self):
+        return self._success
+
+    @property
+    def error(self):
+        return self._error
+
+    @property
+    def duration(self):
+        """Return wall time of the fetch in seconds, None if it didn't finish."""
+        return self._duration
+
+    @property
+    def timed_out(self):
+        return self._timed_out
+
+    def __repr__(self):
+        return f"FetchResult{{unique_id={self.unique_id}, success={self._success}, error={self._error!r}, duration={self._duration}, timed_out={self._timed_out}}}"
+
+
+def flush_snapshots(shells: Iterable):
+    """Write the buffered snapshots of shells, see FileSnapshotStore.
+
+    Snapshots saved later by fetches which are still running, e.g. after a
+    timeout, are written by the next flush.
+    """
+    stores = {}
+    for shell in shells:
+        store = getattr(shell, "snapshot_store", None)
+        if store is not None:
+            stores[id(store)] = store
+    for store in stores.values():
+        try:
+            store.flush()
+        except Exception as error:
+            _LOGGER.warning(f"writing snapshots failed: {error}")
+
+
+class FetchExecutor:
+    """Refresh many SourceShell's concurrently on a bounded thread pool.
+
+    If max_batch_size is larger than 1, the shared setup of up to
+    max_batch_size shells of a source supporting prepare_many() is done
+    once, see SourceShell.prepare_batch(). The shells are then fetched
+    concurrently like all others.
+
+    If prewarm is set, the servers of the shells are resolved and connected
+    before the first refresh of several shells, e.g. the refresh burst on
+    startup, see prewarm.prewarm(). The fetches wait for it, at most
+    prewarm.DEFAULT_PREWARM_TIMEOUT seconds, so that they reuse the
+    connections instead of opening their own. Later refreshes reuse the
+    connections kept alive in the pools.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        prewarm: bool = True,
+    ):
+        self._max_workers = max_workers
+        self._max_batch_size = max_batch_size
+        self._prewarm = prewarm
+        self._prewarmed = False
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="wcs_fetch"
+        )
+
+    @property
+    def max_workers(self):
+        return self._max_workers
+
+    def fetch_all(
+        self, shells: Iterable, timeout: Optional[float] = None
+    ) -> List[FetchResult]:
+        """Fetch all shells and return a FetchResult per shell.
+
+        The snapshot stores of the shells are flushed afterwards.
+
+        Results are returned in the same order as the shells. Several shells
+        may share the same unique_id if they are configured identically.
+
+        Returns when all shells are done or when timeout (in seconds) has
+        passed. Shells which didn't finish in time are reported as timed out;
+        the ones which haven't started yet are cancelled.
+        """
+        shells = list(shells)
+        end = None if timeout is None else time.monotonic() + timeout
+
+        def remaining():
+            return None if end is None else max(end - time.monotonic(), 0)
+
+        if self._prewarm and not self._prewarmed and len(shells) > 1:
+            self._prewarmed = True
+            left = remaining()
+            prewarm(
+                shells,
+                timeout=(
+                    DEFAULT_PREWARM_TIMEOUT
+                    if left is None
+                    else min(left, DEFAULT_PREWARM_TIMEOUT)
+                ),
+            )
+
+        singles, batches = self._group(shells)
+        # batches are prepared first, their shells are fetched afterwards
+        preparing = {
+            self._executor.submit(batch[0].prepare_batch, batch): batch
+            for batch in batches
+        }
+        futures = {
+            self._executor.submit(self._fetch_one, shell): shell for shell in singles
+        }
+
+        # fetch the shells of a batch as soon as it is prepared
+        dispatched = set()
+        try:
+            for future in concurrent.futures.as_completed(
+                preparing, timeout=remaining()
+            ):
+                prepared = future.result()
+                for shell in preparing[future]:
+                    futures[
+                        self._executor.submit(
+                            self._fetch_one, shell, prepared.get(shell.unique_id)
+                        )
+                    ] = shell
+                dispatched.add(future)
+        except concurrent.futures.TimeoutError:
+            pass
+        # batches which weren't dispatched in time, including the ones
+        # finished right after the timeout
+        not_prepared: List = []
+        for future, batch in preparing.items():
+            if future not in dispatched:
+                future.cancel()
+                not_prepared.extend(batch)
+
+        _, not_done = concurrent.futures.wait(futures, timeout=remaining())
+
+        results: Dict[int, FetchResult] = {}
+        timed_out = not_prepared + [futures[f] for f in not_done]
+        for future in not_done:
+            future.cancel()
+        for shell in timed_out:
+            _LOGGER.warning(f"fetch timed out for source {shell.title}")
+            results[id(shell)] = FetchResult(shell=shell, success=False, timed_out=True)
+        for future, shell in futures.items():
+            if future not in not_done:
+                results[id(shell)] = future.result()
+
+        flush_snapshots(shells)
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            report = get_network_stats().report(shell.unique_id for shell in shells)
+            _LOGGER.debug(f"network statistics:\n{report}")
+
+        return [results[id(shell)] for shell in shells]
+
+    def _group(self, shells: List) -> Tuple[List, List[List]]:
+        """Split shells into single shells and batches to prepare together."""
+        singles = []
+        batches: Dict[type, List] = {}
+        for shell in shells:
+            if self._max_batch_size > 1 and shell.batchable:
+                batches.setdefault(shell.batch_key, []).append(shell)
+            else:
+                singles.append(shell)
+
+        groups = []
+        for batch in batches.values():
+            for i in range(0, len(batch), self._max_batch_size):
+                groups.append(batch[i : i + self._max_batch_size])
+        return singles, groups
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.shutdown()
+
+    @staticmethod
+    def _fetch_one(shell, prepared=None) -> FetchResult:
+        start = time.monotonic()
+        try:
+            shell.fetch(prepared)
+            error = shell.last_error
+        except Exception as e:
+            # SourceShell catches source errors itself, this is only a safety
+            # net for errors in the shell itself
+            error = e
+        return FetchResult(
+            shell=shell,
+            success=error is None,
+            error=error,
+            duration=time.monotonic() - start,
+            timed_out=isinstance(error, FetchTimeoutError),
+        )
+
+
+async def fetch_all_async(
+    shells: Iterable,
+    max_concurrency: int = DEFAULT_MAX_WORKERS,
+    timeout: Optional[float] = None,
+    executor=None,
+) -> List[FetchResult]:
+    """Fetch all shells from one event loop, see FetchExecutor.fetch_all().
+
+    Native async sources are awaited directly, legacy sync sources are run
+    in the given executor. max_concurrency limits the number of fetches in
+    flight at the same time.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch_one(shell):
+        async with semaphore:
+            start = time.monotonic()
+            try:
+                await shell.fetch_async(executor)
+                error = shell.last_error
+            except Exception as e:
+                error = e
+            return FetchResult(
+                shell=shell,
+                success=error is None,
+                error=error,
+                duration=time.monotonic() - start,
+                timed_out=isinstance(error, FetchTimeoutError),
+            )
+
+    shells = list(shells)
+    tasks = [(shell, asyncio.ensure_future(fetch_one(shell))) for shell in shells]
+    if not tasks:
+        return []
+
+    _, not_done = await asyncio.wait([task for _, task in tasks], timeout=timeout)
+
+    results = []
+    for shell, task in tasks:
+        if task in not_done:
+            task.cancel()
+            _LOGGER.warning(f"fetch timed out for source {shell.title}")
+            results.append(FetchResult(shell=shell, success=False, timed_out=True))
+        else:
+            results.append(task.result())
+
+    # file I/O, don't block the event loop
+    await asyncio.get_running_loop().run_in_executor(executor, flush_snapshots, shells)
+    return results
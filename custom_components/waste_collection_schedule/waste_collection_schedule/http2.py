@@ -0,0 +1,257 @@
+"""HTTP/2 capable transport adapter.
+
+Http2Adapter sends requests with httpx, which multiplexes all requests to a
+host over one connection and compresses headers (HPACK). httpx with HTTP/2
+support is an optional dependency (see requirements.txt) of the integration;
+without it, Http2Adapter behaves exactly like SourceAdapter.
+
+HTTP/2 is negotiated per connection (ALPN), servers without HTTP/2 support
+are transparently accessed with HTTP/1.1. Requests with client
+certificates, via proxies or with streamed bodies are always sent over the
+HTTP/1.1 connection pools of SourceAdapter.
+
+The HTTP/2 connections of httpx can't be shared between threads, therefore
+all requests of Http2Adapter are run on one event loop thread and the
+calling threads wait for their results.
+"""
+
+import asyncio
+import http.client
+import io
+import logging
+import socket
+import threading
+from collections import Counter
+from typing import Dict, Optional
+
+import requests
+from requests.utils import select_proxy
+from urllib3.response import HTTPResponse
+
+from . import tls
+from .http_client import SourceAdapter
+
+try:
+    import h2  # noqa: F401
+    import httpx
+except ImportError:
+    httpx = None
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def is_available() -> bool:
+    """Return True if httpx with HTTP/2 support is installed."""
+    return httpx is not None
+
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _run(coro):
+    """Run coro on the HTTP/2 event loop thread and return its result."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="wcs_http2", daemon=True
+            ).start()
+    return asyncio.run_coroutine_threadsafe(coro, _loop).result()
+
+
+class _RawStream(io.RawIOBase):
+    """File like object over the undecoded body of a httpx response."""
+
+    def __init__(self, response):
+        self._response = response
+        self._chunks = response.aiter_raw()
+        self._buffer = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        try:
+            while not self._buffer:
+                self._buffer = _run(self._chunks.__anext__())
+        except StopAsyncIteration:
+            return 0
+        except httpx.TimeoutException as error:
+            # mapped to requests.ConnectionError by urllib3 and requests
+            raise socket.timeout(str(error)) from error
+        except httpx.TransportError as error:
+            raise OSError(str(error)) from error
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+    def close(self):
+        if not self.closed:
+            _run(self._response.aclose())
+        super().close()
+
+
+class _OriginalResponse:
+    """Stand-in for the http.client.HTTPResponse urllib3 expects.
+
+    requests extracts cookies from its msg attribute.
+    """
+
+    def __init__(self, method: str, headers, stream: io.IOBase):
+        self._method = method
+        self._stream = stream
+        self.msg = http.client.HTTPMessage()
+        for name, value in headers:
+            self.msg[name] = value
+
+    def isclosed(self):
+        return self._stream.closed
+
+    def close(self):
+        self._stream.close()
+
+
+def _timeout(timeout):
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+class Http2Adapter(SourceAdapter):
+    """SourceAdapter which sends requests over HTTP/2 if the server supports it.
+
+    Set prior_knowledge to speak HTTP/2 without negotiation, which is the
+    only way to use HTTP/2 over plain http (e.g. with local test servers).
+    """
+
+    def __init__(self, prior_knowledge: bool = False, **kwargs):
+        self._prior_knowledge = prior_knowledge
+        self._transports: Dict[tls.Verify, "httpx.AsyncHTTPTransport"] = {}
+        self._transports_lock = threading.Lock()
+        # number of requests per HTTP version
+        self._versions: Counter = Counter()
+        super().__init__(**kwargs)
+
+    @staticmethod
+    async def _send(transport, h_request, preload: bool):
+        """Send h_request, read the whole body unless streaming.
+
+        Reading the body on the event loop saves a thread switch per chunk.
+        """
+        h_response = await transport.handle_async_request(h_request)
+        if not preload:
+            return h_response, None
+        try:
+            body = b"".join([chunk async for chunk in h_response.aiter_raw()])
+        finally:
+            await h_response.aclose()
+        return h_response, body
+
+    def _transport(self, verify: tls.Verify) -> "httpx.AsyncHTTPTransport":
+        with self._transports_lock:
+            transport = self._transports.get(verify)
+            if transport is None:
+                transport = httpx.AsyncHTTPTransport(
+                    # httpx sets the ALPN protocols, the context can't be shared
+                    verify=tls.get_tls_registry().new_context(self.tls_profile, verify),
+                    http1=not self._prior_knowledge,
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=None,
+                        max_keepalive_connections=self._pool_connections,
+                    ),
+                    trust_env=False,
+                )
+                self._transports[verify] = transport
+            return transport
+
+    def transport_send(
+        self,
+        request,
+        stream=False,
+        timeout=None,
+        verify=True,
+        cert=None,
+        proxies=None,
+        **kwargs,
+    ):
+        body = request.body
+        if (
+            httpx is None
+            or cert
+            or select_proxy(request.url, proxies or {})
+            or not isinstance(body, (bytes, str, type(None)))
+        ):
+            return super().transport_send(
+                request,
+                stream=stream,
+                timeout=timeout,
+                verify=verify,
+                cert=cert,
+                proxies=proxies,
+                **kwargs,
+            )
+
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        h_request = httpx.Request(
+            request.method,
+            request.url,
+            headers=list(request.headers.items()),
+            content=body,
+            extensions={"timeout": _timeout(timeout).as_dict()},
+        )
+        try:
+            h_response, body = _run(
+                self._send(self._transport(verify), h_request, preload=not stream)
+            )
+        except httpx.ConnectTimeout as error:
+            raise requests.ConnectTimeout(error, request=request)
+        except httpx.TimeoutException as error:
+            raise requests.ReadTimeout(error, request=request)
+        except httpx.TransportError as error:
+            raise requests.ConnectionError(error, request=request)
+
+        with self._transports_lock:
+            self._versions[h_response.http_version] += 1
+        headers = [
+            (name, value)
+            for name, value in h_response.headers.multi_items()
+            # the body is already de-chunked
+            if name.lower() != "transfer-encoding"
+        ]
+        body_stream = _RawStream(h_response) if body is None else io.BytesIO(body)
+        raw = HTTPResponse(
+            body=body_stream,
+            headers=headers,
+            status=h_response.status_code,
+            version=20 if h_response.http_version == "HTTP/2" else 11,
+            version_string=h_response.http_version,
+            reason=h_response.reason_phrase,
+            preload_content=False,
+            decode_content=False,
+            original_response=_OriginalResponse(request.method, headers, body_stream),
+            request_method=request.method,
+            request_url=request.url,
+        )
+        return self.build_response(request, raw)
+
+    def shutdown(self):
+        with self._transports_lock:
+            transports, self._transports = list(self._transports.values()), {}
+        for transport in transports:
+            _run(transport.aclose())
+        super().shutdown()
+
+    def stats(self) -> Dict[str, int]:
+        """Return statistics of SourceAdapter plus requests per HTTP version."""
+        stats = super().stats()
+        with self._transports_lock:
+            versions = dict(self._versions)
+        stats["requests"] += sum(versions.values())
+        stats["http2"] = versions.get("HTTP/2", 0)
+        return stats
@@ -0,0 +1,491 @@
+"""Private HTTP cache for calendar downloads.
+
+Responses are cached according to RFC 9111: fresh responses (Cache-Control
+max-age, Expires or heuristic freshness from Last-Modified) are served from
+the cache, stale responses are revalidated with a conditional GET using
+If-None-Match / If-Modified-Since.
+
+The cache also remembers the parsed result per response body and day. If
+the server answers with 304 Not Modified, or sends an identical body again,
+the parse function is not called at all and the result parsed earlier the
+same day is returned. Results are not reused on another day, because parse
+functions like ICS.convert() return the dates of a window starting today.
+
+Bodies are streamed to a temporary file (or the disk tier) while they are
+downloaded and handed to the parse function as a stream, so large files are
+never held in memory more than once.
+"""
+
+import copy
+import datetime
+import email.utils
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import IO, Callable, Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from . import http_client
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256  # number of responses kept in memory
+DEFAULT_MAX_PARSED = 256  # number of parsed results kept in memory
+
+# larger bodies are not kept by the memory tier, only their validators
+DEFAULT_MAX_MEMORY_BODY = 1024 * 1024  # bytes
+
+# headers which don't apply to the stored (decoded) body
+_BODY_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+# heuristic freshness for responses with Last-Modified but without explicit
+# expiration: 10% of the time since the last modification, but at most 1 day
+HEURISTIC_FRACTION = 0.1
+HEURISTIC_MAX = 24 * 3600  # seconds
+
+
+def _parse_http_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Return directives of a Cache-Control header, keys in lower case."""
+    directives: Dict[str, Optional[str]] = {}
+    for part in (value or "").split(","):
+        name, sep, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') if sep else None
+    return directives
+
+
+def freshness_lifetime(headers, now: Optional[float] = None) -> float:
+    """Return freshness lifetime of a response in seconds, 0 if it is stale."""
+    cc = parse_cache_control(headers.get("Cache-Control"))
+    if "no-cache" in cc:
+        return 0
+    if "max-age" in cc:
+        try:
+            return max(int(cc["max-age"]), 0)
+        except (TypeError, ValueError):
+            return 0
+
+    date = _parse_http_date(headers.get("Date")) or now or time.time()
+    if "Expires" in headers:
+        expires = _parse_http_date(headers.get("Expires"))
+        # invalid dates, e.g. "0", mean already expired
+        return max(expires - date, 0) if expires is not None else 0
+
+    last_modified = _parse_http_date(headers.get("Last-Modified"))
+    if last_modified is not None and last_modified < date:
+        return min((date - last_modified) * HEURISTIC_FRACTION, HEURISTIC_MAX)
+    return 0
+
+
+class CacheEntry:
+    """Cached response: URL, status, headers and body.
+
+    The body is either kept in memory (body), stored in a file of the disk
+    tier (body_file) or not stored at all. Entries without body can only be
+    used as long as their parsed result of today is remembered.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        headers: Dict[str, str],
+        stored_at: float,
+        digest: str,
+        vary: Optional[Dict[str, Optional[str]]] = None,
+        body: Optional[bytes] = None,
+        body_file: Optional[str] = None,
+    ):
+        self.url = url
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(
+            {k: v for k, v in headers.items() if k.lower() not in _BODY_HEADERS}
+        )
+        self.stored_at = stored_at
+        self.digest = digest
+        self.vary = vary or {}
+        self.body = body
+        self.body_file = body_file
+
+    @property
+    def has_body(self) -> bool:
+        return self.body is not None or self.body_file is not None
+
+    @property
+    def age(self) -> float:
+        age = time.time() - self.stored_at
+        try:
+            age += int(self.headers.get("Age", 0))
+        except ValueError:
+            pass
+        return max(age, 0)
+
+    @property
+    def fresh(self) -> bool:
+        return self.age < freshness_lifetime(self.headers, self.stored_at)
+
+    def update(self, response: requests.Response):
+        """Merge headers of a 304 response, see RFC 9111 section 4.3.4."""
+        for name, value in response.headers.items():
+            if name.lower() not in _BODY_HEADERS:
+                self.headers[name] = value
+        self.stored_at = time.time()
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if "ETag" in self.headers:
+            headers["If-None-Match"] = self.headers["ETag"]
+        if "Last-Modified" in self.headers:
+            headers["If-Modified-Since"] = self.headers["Last-Modified"]
+        return headers
+
+    def to_response(self, fileobj: Optional[IO[bytes]] = None) -> requests.Response:
+        """Return the entry as response, the body is read from fileobj if given.
+
+        Bodies from files are not read into memory, iter_content() and
+        http_client.iter_lines() stream them.
+        """
+        response = requests.Response()
+        response.url = self.url
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = requests.utils.get_encoding_from_headers(self.headers)
+        if fileobj is not None:
+            response.raw = fileobj
+        elif self.body is not None:
+            response._content = self.body
+            response._content_consumed = True
+        elif self.body_file is not None:
+            response.raw = open(self.body_file, "rb")
+        else:
+            raise ValueError(f"no cached body for {self.url}")
+        return response
+
+
+class HttpCache:
+    """HTTP cache with an in-memory and an optional on-disk tier.
+
+    Without directory, responses up to max_memory_body bytes are kept in
+    memory, larger ones only with their validators. With directory, every
+    response is stored as <key>.json (metadata) and <key>.body, so
+    revalidation also works after a restart.
+
+    At most max_entries responses are kept in memory, the least recently
+    used ones are dropped first. Dropped responses of the disk tier are
+    loaded again when they are requested.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_parsed: int = DEFAULT_MAX_PARSED,
+        max_memory_body: int = DEFAULT_MAX_MEMORY_BODY,
+    ):
+        self._directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self._max_entries = max_entries
+        self._max_parsed = max_parsed
+        self._max_memory_body = max_memory_body
+        self._lock = threading.Lock()
+        # key -> entry, least recently used first
+        self._entries: OrderedDict = OrderedDict()
+        # (key, parse) -> (body digest, day of parsing, parsed result)
+        self._parsed: OrderedDict = OrderedDict()
+
+        # statistics
+        self._hits = 0
+        self._revalidated = 0
+        self._misses = 0
+        self._parses_skipped = 0
+
+    @staticmethod
+    def key(method: str, url: str) -> str:
+        return hashlib.sha256(f"{method.upper()} {url}".encode()).hexdigest()
+
+    def get(
+        self,
+        url: str,
+        parse: Callable[[requests.Response], object],
+        params=None,
+        headers: Optional[Dict[str, str]] = None,
+        session: Optional[requests.Session] = None,
+        **kwargs,
+    ):
+        """GET url through the cache and return parse(response).
+
+        parse is called with a successful response and its result is
+        remembered. If the body did not change since the last call with
+        the same parse function on the same day, the remembered result is
+        returned without calling parse again. Non-successful responses raise HTTPError.
+
+        parse should read the body with response.iter_content() or
+        http_client.iter_lines() to benefit from streaming.
+        """
+        url = requests.Request("GET", url, params=params).prepare().url
+        key = self.key("GET", url)
+        headers = dict(headers or {})
+
+        entry = self._load(key)
+        if entry is not None and not self._vary_matches(entry, headers, session):
+            entry = None
+        if entry is not None and not (
+            entry.has_body or self._is_parsed(key, parse, entry.digest)
+        ):
+            # neither body nor parsed result available, nothing to revalidate
+            entry = None
+
+        if entry is not None and entry.fresh:
+            with self._lock:
+                self._hits += 1
+            return self._parse(key, entry, parse)
+
+        if entry is not None:
+            headers.update(entry.conditional_headers())
+        kwargs["stream"] = True
+        if session is None:
+            r = http_client.get(url, headers=headers, **kwargs)
+        else:
+            r = session.get(url, headers=headers, **kwargs)
+
+        with r:
+            if r.status_code == 304 and entry is not None:
+                _LOGGER.debug(f"{url} not modified")
+                entry.update(r)
+                self._store(key, entry)
+                with self._lock:
+                    self._revalidated += 1
+                return self._parse(key, entry, parse)
+
+            r.raise_for_status()
+            with self._lock:
+                self._misses += 1
+            return self._download(key, url, r, headers, session, parse)
+
+    def _download(self, key: str, url: str, r, headers, session, parse):
+        """Stream the body of r to a temporary file, store it and parse it."""
+        if self._directory is None:
+            f = tempfile.SpooledTemporaryFile(max_size=self._max_memory_body)
+        else:
+            f = tempfile.NamedTemporaryFile(
+                dir=self._directory, suffix=".tmp", delete=False
+            )
+        try:
+            digest = hashlib.sha256()
+            size = 0
+            for chunk in r.iter_content(http_client.STREAM_CHUNK_SIZE):
+                digest.update(chunk)
+                f.write(chunk)
+                size += len(chunk)
+            f.seek(0)
+
+            entry = CacheEntry(
+                url=url,
+                status_code=r.status_code,
+                headers=dict(r.headers),
+                stored_at=time.time(),
+                digest=digest.hexdigest(),
+                vary=self._vary_values(r.headers, headers, session),
+            )
+            if "no-store" in parse_cache_control(r.headers.get("Cache-Control")):
+                self._remove(key)
+            elif self._directory is not None:
+                f.close()
+                entry.body_file = self._path(key, ".body")
+                os.replace(f.name, entry.body_file)
+                f = open(entry.body_file, "rb")
+                self._store(key, entry)
+            else:
+                if size <= self._max_memory_body:
+                    entry.body = f.read()
+                    f.seek(0)
+                self._store(key, entry)
+            return self._parse(key, entry, parse, fileobj=f)
+        finally:
+            f.close()
+            if self._directory is not None and f.name.endswith(".tmp"):
+                try:
+                    os.unlink(f.name)
+                except FileNotFoundError:
+                    pass
+
+    def _is_parsed(self, key: str, parse, digest: str) -> bool:
+        with self._lock:
+            item = self._parsed.get((key, parse))
+        return item is not None and item[:2] == (digest, datetime.date.today())
+
+    def _parse(self, key: str, entry: CacheEntry, parse, fileobj=None):
+        today = datetime.date.today()
+        with self._lock:
+            item = self._parsed.get((key, parse))
+            if item is not None and item[:2] == (entry.digest, today):
+                self._parsed.move_to_end((key, parse))
+                self._parses_skipped += 1
+                return copy.copy(item[2])
+
+        with entry.to_response(fileobj) as response:
+            result = parse(response)
+
+        with self._lock:
+            self._parsed[(key, parse)] = (entry.digest, today, result)
+            self._parsed.move_to_end((key, parse))
+            while len(self._parsed) > self._max_parsed:
+                self._parsed.popitem(last=False)
+        return copy.copy(result)
+
+    @staticmethod
+    def _request_header(name: str, headers, session) -> Optional[str]:
+        value = CaseInsensitiveDict(headers).get(name)
+        if value is None and session is not None:
+            value = session.headers.get(name)
+        return value
+
+    def _vary_values(self, response_headers, headers, session):
+        names = [
+            n.strip() for n in response_headers.get("Vary", "").split(",") if n.strip()
+        ]
+        return {n.lower(): self._request_header(n, headers, session) for n in names}
+
+    def _vary_matches(self, entry: CacheEntry, headers, session) -> bool:
+        if "*" in entry.vary:
+            return False
+        return all(
+            self._request_header(name, headers, session) == value
+            for name, value in entry.vary.items()
+        )
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self._directory, key + suffix)
+
+    def _load(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is not None or self._directory is None:
+            return entry
+
+        try:
+            with open(self._path(key, ".json"), encoding="utf-8") as f:
+                meta = json.load(f)
+            entry = CacheEntry(body_file=self._path(key, ".body"), **meta)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as error:
+            _LOGGER.warning(f"ignoring corrupt http cache entry {key}: {error}")
+            return None
+        if not os.path.exists(entry.body_file):
+            return None
+
+        with self._lock:
+            entry = self._entries.setdefault(key, entry)
+            self._evict()
+        return entry
+
+    def _evict(self):
+        """Drop the least recently used entries beyond max_entries from memory."""
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _store(self, key: str, entry: CacheEntry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._evict()
+        if self._directory is None:
+            return
+
+        meta = {
+            "url": entry.url,
+            "status_code": entry.status_code,
+            "headers": dict(entry.headers),
+            "stored_at": entry.stored_at,
+            "digest": entry.digest,
+            "vary": entry.vary,
+        }
+        try:
+            self._write(self._path(key, ".json"), json.dumps(meta).encode())
+        except OSError as error:
+            _LOGGER.warning(f"failed to write http cache entry {key}: {error}")
+
+    def _write(self, filename: str, data: bytes):
+        # write to temporary file first to never leave a truncated file behind
+        fd, tmpname = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmpname, filename)
+        except Exception:
+            os.unlink(tmpname)
+            raise
+
+    def _remove(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+        if self._directory is not None:
+            for suffix in (".json", ".body"):
+                try:
+                    os.unlink(self._path(key, suffix))
+                except FileNotFoundError:
+                    pass
+
+    def clear(self):
+        with self._lock:
+            keys = set(self._entries)
+            self._entries.clear()
+            self._parsed.clear()
+        if self._directory is not None:
+            # including the entries which were dropped from memory
+            keys.update(
+                os.path.splitext(name)[0]
+                for name in os.listdir(self._directory)
+                if name.endswith((".json", ".body"))
+            )
+        for key in keys:
+            self._remove(key)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "revalidated": self._revalidated,
+                "misses": self._misses,
+                "parses_skipped": self._parses_skipped,
+            }
+
+
+_http_cache = HttpCache()
+
+
+def get_http_cache() -> HttpCache:
+    """Return the process wide HttpCache."""
+    return _http_cache
+
+
+def set_http_cache(cache: HttpCache):
+    """Replace the process wide HttpCache, e.g. to enable the disk tier."""
+    global _http_cache
+    _http_cache = cache
+
+
+def get(url: str, parse: Callable[[requests.Response], object], **kwargs):
+    """GET url through the process wide cache, see HttpCache.get()."""
+    return get_http_cache().get(url, parse, **kwargs)
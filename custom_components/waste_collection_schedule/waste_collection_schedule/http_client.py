@@ -0,0 +1,673 @@
+"""HTTP entry point for sources.
+
+Sources should use the functions of this module instead of the module level
+functions of requests, e.g. http_client.get() instead of requests.get(). The
+signatures are the same, but all requests go through the framework's shared
+HttpClient: connections are kept alive and pooled per host across requests
+and sources, and every request passes the transport adapters (e.g. the
+per-host rate limiter).
+"""
+
+import codecs
+import contextvars
+import heapq
+import itertools
+import logging
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.request import ACCEPT_ENCODING
+
+from . import deadline, tls
+from .dns_cache import get_dns_cache
+from .exceptions import FetchTimeoutError
+from .network_stats import ERROR, get_network_stats
+from .rate_limiter import get_rate_limiter
+from .resilience import TRANSIENT_STATUS_CODES, get_resilience
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_POOL_CONNECTIONS = 100  # number of hosts with pooled connections
+DEFAULT_POOL_MAXSIZE = 10  # number of pooled connections per host
+
+# names of the adapters of HttpClient
+DEFAULT_ADAPTER = "default"
+LEGACY_SSL_ADAPTER = "legacy_ssl"
+HTTP2_ADAPTER = "http2"
+
+STREAM_CHUNK_SIZE = 64 * 1024  # bytes
+
+# content codings urllib3 can decode: gzip and deflate, plus br and zstd if
+# brotli and zstandard are installed
+DEFAULT_HEADERS = {"Accept-Encoding": ACCEPT_ENCODING}
+
+# (scheme, host, port) of a server
+Origin = Tuple[str, str, int]
+
+# unique_id's of the sources on whose behalf requests are sent
+_current_sources: contextvars.ContextVar[Tuple[str, ...]] = contextvars.ContextVar(
+    "wcs_sources", default=()
+)
+
+
+@contextmanager
+def source_context(*unique_ids: str):
+    """Attribute all requests within the block to the given sources."""
+    token = _current_sources.set(unique_ids)
+    try:
+        yield
+    finally:
+        _current_sources.reset(token)
+
+
+class _CachedDnsMixin:
+    """Connect to the addresses of the process wide DNS cache.
+
+    The addresses are tried in order. If the host can't be resolved, the
+    default resolution of urllib3 reports the error.
+    """
+
+    def _new_conn(self):
+        host = self._dns_host
+        try:
+            addresses = get_dns_cache().resolve(host, self.port)
+        except OSError:
+            addresses = None
+        if not addresses:
+            return super()._new_conn()
+
+        error = None
+        for address in addresses:
+            self._dns_host = address
+            try:
+                return super()._new_conn()
+            except (NewConnectionError, ConnectTimeoutError) as e:
+                error = e
+            finally:
+                self._dns_host = host
+        raise error
+
+
+class _CachedDnsHTTPConnection(_CachedDnsMixin, HTTPConnection):
+    pass
+
+
+class _CachedDnsHTTPSConnection(_CachedDnsMixin, HTTPSConnection):
+    pass
+
+
+class _WarmPoolMixin:
+    """Open connections of a pool ahead of the requests, see prewarm."""
+
+    def idle_connections(self) -> int:
+        """Return number of open connections waiting in the pool."""
+        if self.pool is None:
+            return 0
+        with self.pool.mutex:
+            return sum(
+                1
+                for conn in self.pool.queue
+                if conn is not None and conn.sock is not None
+            )
+
+    def warm(self, timeout: float) -> bool:
+        """Open a connection and keep it in the pool, return True if opened.
+
+        Only the TCP connection and the TLS handshake are made, no request is
+        sent. Nothing is done if all connections of the pool are in use.
+        """
+        if self.pool is None or self.pool.empty():
+            return False
+        conn = self._get_conn()
+        try:
+            if conn.sock is not None:
+                return False
+            conn.timeout = timeout
+            conn.connect()
+            return True
+        except BaseException:
+            conn.close()
+            raise
+        finally:
+            self._put_conn(conn)
+
+
+class _CachedDnsHTTPConnectionPool(_WarmPoolMixin, HTTPConnectionPool):
+    ConnectionCls = _CachedDnsHTTPConnection
+
+
+class _CachedDnsHTTPSConnectionPool(_WarmPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = _CachedDnsHTTPSConnection
+
+
+def _request_size(request: requests.PreparedRequest) -> int:
+    """Return approximate number of bytes sent for request."""
+    size = len(request.method) + len(request.path_url) + 12
+    size += sum(len(k) + len(v) + 4 for k, v in request.headers.items()) + 2
+    body = request.body
+    if isinstance(body, (bytes, str)):
+        size += len(body)
+    elif body is not None:
+        size += int(request.headers.get("Content-Length", 0))
+    return size
+
+
+class _Watchdog:
+    """Call functions at monotonic times on one background thread.
+
+    Functions are called with the lock held: once cancel() returns, the
+    function of the entry is guaranteed not to run.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._heap: List[list] = []
+        self._counter = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, when: float, fn: Callable[[], None]) -> list:
+        entry = [when, next(self._counter), fn]
+        with self._cond:
+            heapq.heappush(self._heap, entry)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="wcs_watchdog", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+        return entry
+
+    def cancel(self, entry: list):
+        with self._cond:
+            entry[2] = None
+
+    def _run(self):
+        with self._cond:
+            while True:
+                while self._heap and self._heap[0][2] is None:
+                    heapq.heappop(self._heap)
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                left = self._heap[0][0] - time.monotonic()
+                if left > 0:
+                    self._cond.wait(left)
+                    continue
+                fn = heapq.heappop(self._heap)[2]
+                try:
+                    fn()
+                except Exception:
+                    _LOGGER.debug("watchdog function failed", exc_info=True)
+
+
+_watchdog = _Watchdog()
+
+
+def _limit_body(response: requests.Response, end: float):
+    """Stop reading the body of response at the monotonic time end.
+
+    The read timeout applies to every socket read, so a server trickling
+    bytes could otherwise exceed the deadline of the fetch. If a read is
+    still running at end, its socket is shut down.
+    """
+    raw = response.raw
+    if raw is None or not hasattr(raw, "read"):
+        return
+    read = raw.read
+
+    def abort():
+        sock = getattr(getattr(raw, "connection", None), "sock", None)
+        if sock is not None:
+            sock.shutdown(socket.SHUT_RDWR)
+
+    def limited_read(*args, **kwargs):
+        if time.monotonic() >= end:
+            response.close()
+            raise FetchTimeoutError()
+        entry = _watchdog.schedule(end, abort)
+        try:
+            data = read(*args, **kwargs)
+        except Exception as error:
+            if time.monotonic() >= end:
+                raise FetchTimeoutError() from error
+            raise
+        finally:
+            _watchdog.cancel(entry)
+        if time.monotonic() >= end:
+            # the data may be truncated by abort()
+            response.close()
+            raise FetchTimeoutError()
+        return data
+
+    raw.read = limited_read
+
+
+def _track_body(response: requests.Response, done):
+    """Call done(bytes_in) once the body of response is read or closed."""
+    raw = response.raw
+    size = len(response.reason or "") + 15
+    size += sum(len(k) + len(v) + 4 for k, v in response.headers.items()) + 2
+    if raw is None or not hasattr(raw, "tell"):
+        done(size)
+        return
+    if response._content_consumed or getattr(raw, "closed", False):
+        # already read by the transport, e.g. when recording a cassette
+        done(size + raw.tell())
+        return
+
+    read, close = raw.read, raw.close
+    finished = False
+
+    def finish():
+        nonlocal finished
+        if not finished:
+            finished = True
+            done(size + raw.tell())
+
+    def tracked_read(*args, **kwargs):
+        data = read(*args, **kwargs)
+        if not data or getattr(raw, "closed", False):
+            finish()
+        return data
+
+    def tracked_close():
+        finish()
+        close()
+
+    # urllib3 calls self.read() in stream(), which is used by iter_content()
+    raw.read = tracked_read
+    raw.close = tracked_close
+
+
+class SourceAdapter(requests.adapters.HTTPAdapter):
+    """Transport adapter used for all source requests.
+
+    Requests to a host which is known to be down fail immediately with
+    CircuitOpenError (per-host circuit breaker). All other requests wait
+    for the per-host rate limiter.
+
+    Requests are accounted per source and host, see network_stats.
+
+    Requests without Accept-Encoding header (e.g. because a source replaced
+    the headers of its session) get the default one. Responses are decoded
+    while they are read.
+
+    Every request gets a timeout, which is limited by the deadline of the
+    current fetch, and reading the body stops at the deadline. Requests
+    which time out because the deadline is exhausted raise
+    FetchTimeoutError, also while waiting for the rate limiter.
+
+    HTTPS connections use the shared TLS contexts of tls_profile, see
+    tls.TlsContextRegistry, instead of building a new context for every
+    connection.
+
+    The adapter is shared by all sessions of a HttpClient, therefore
+    close() keeps the connection pools open, see shutdown().
+    """
+
+    def __init__(
+        self,
+        default_timeout=deadline.DEFAULT_REQUEST_TIMEOUT,
+        tls_profile: str = tls.DEFAULT,
+        **kwargs,
+    ):
+        self._default_timeout = default_timeout
+        self._tls_profile = tls_profile
+        self._stats_lock = threading.Lock()
+        # statistics of connection pools which have already been disposed
+        self._disposed_requests = 0
+        self._disposed_connections = 0
+        # origins requested per source unique_id
+        self._origins: Dict[str, Set[Origin]] = {}
+        super().__init__(**kwargs)
+
+    @property
+    def tls_profile(self) -> str:
+        return self._tls_profile
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CachedDnsHTTPConnectionPool,
+            "https": _CachedDnsHTTPSConnectionPool,
+        }
+
+        # keep statistics of pools evicted from the pool manager
+        pools = self.poolmanager.pools
+        dispose = pools.dispose_func
+
+        def dispose_and_count(pool):
+            with self._stats_lock:
+                self._disposed_requests += pool.num_requests
+                self._disposed_connections += pool.num_connections
+            if dispose is not None:
+                dispose(pool)
+
+        pools.dispose_func = dispose_and_count
+
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(
+            request, verify, cert
+        )
+        # client certificates would modify the shared context, urllib3 builds
+        # a separate context for them
+        if host_params["scheme"] == "https" and not cert:
+            pool_kwargs["ssl_context"] = tls.get_tls_registry().context(
+                self._tls_profile, verify=verify
+            )
+            pool_kwargs.pop("ca_certs", None)
+            pool_kwargs.pop("ca_cert_dir", None)
+        return host_params, pool_kwargs
+
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, verify, cert)
+        if verify and getattr(conn, "ssl_context", None) is not None:
+            # the CA bundle is already loaded into the shared context
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+
+    def send(self, request, timeout=None, **kwargs):
+        url = urlparse(request.url)
+        host = url.hostname or ""
+        sources = _current_sources.get()
+        if sources:
+            origin = (
+                url.scheme,
+                host,
+                url.port or (443 if url.scheme == "https" else 80),
+            )
+            with self._stats_lock:
+                for unique_id in sources:
+                    self._origins.setdefault(unique_id, set()).add(origin)
+        if "Accept-Encoding" not in request.headers:
+            request.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        breaker = get_resilience().host_breaker(host)
+        trial = breaker.before_call()
+        try:
+            return self._send_request(
+                request, host, sources, breaker, timeout, **kwargs
+            )
+        finally:
+            if trial:
+                # no-op if the trial recorded its outcome
+                breaker.cancel_trial()
+
+    def _send_request(self, request, host, sources, breaker, timeout, **kwargs):
+        network_stats = get_network_stats()
+        bytes_out = _request_size(request)
+        with get_rate_limiter().acquire(host) as waited:
+            if waited > 0.1:
+                _LOGGER.debug(f"request to {host} waited {waited:.2f}s for rate limit")
+            start = time.perf_counter()
+            timeout = deadline.request_timeout(timeout, self._default_timeout)
+            try:
+                response = self.transport_send(request, timeout=timeout, **kwargs)
+            except Exception as error:
+                elapsed = time.perf_counter() - start
+                network_stats.record_response(sources, host, bytes_out, elapsed, ERROR)
+                network_stats.record_body(sources, host, 0, elapsed)
+                if isinstance(error, requests.Timeout):
+                    left = deadline.remaining()
+                    if left is not None and left <= 0:
+                        # the fetch ran out of time, this is not the host's fault
+                        raise FetchTimeoutError() from error
+                breaker.record_failure()
+                raise
+            ttfb = time.perf_counter() - start
+        network_stats.record_response(
+            sources, host, bytes_out, ttfb, response.status_code
+        )
+        left = deadline.remaining()
+        if left is not None:
+            _limit_body(response, time.monotonic() + left)
+        _track_body(
+            response,
+            lambda bytes_in: network_stats.record_body(
+                sources, host, bytes_in, time.perf_counter() - start
+            ),
+        )
+        if response.status_code in TRANSIENT_STATUS_CODES:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    def transport_send(self, request, **kwargs):
+        """Send request over the network, overridden e.g. by cassette replay."""
+        return super().send(request, **kwargs)
+
+    def origins(self, unique_id: str) -> Set[Origin]:
+        """Return origins requested by the source with the given unique_id."""
+        with self._stats_lock:
+            return set(self._origins.get(unique_id, ()))
+
+    def close(self):
+        # called by Session.close(), but the pools are shared with other sessions
+        pass
+
+    def shutdown(self):
+        """Close all pooled connections."""
+        super().close()
+
+    def stats(self) -> Dict[str, int]:
+        """Return number of requests, opened connections and reused connections."""
+        pools = self.poolmanager.pools
+        with self._stats_lock:
+            num_requests = self._disposed_requests
+            num_connections = self._disposed_connections
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                num_requests += pool.num_requests
+                num_connections += pool.num_connections
+        return {
+            "requests": num_requests,
+            "connections": num_connections,
+            "reused": max(num_requests - num_connections, 0),
+        }
+
+
+class HttpClient:
+    """Pooled HTTP client shared by all sources.
+
+    The client owns named transport adapters, each with its own keep-alive
+    connection pools. Sessions returned by session() only hold cookies and
+    headers and send all requests through the shared adapters. Sessions start
+    with DEFAULT_HEADERS, updated by headers.
+
+    If http2 is set, all adapters send requests over HTTP/2 where the server
+    supports it, see http2.Http2Adapter. Otherwise, sources can opt in with
+    the adapter HTTP2_ADAPTER.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        headers: Optional[Dict[str, str]] = None,
+        timeout=deadline.DEFAULT_REQUEST_TIMEOUT,
+        http2: bool = False,
+    ):
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._headers = CaseInsensitiveDict(DEFAULT_HEADERS)
+        self._headers.update(headers or {})
+        self._timeout = timeout
+        self._http2 = http2
+        self._lock = threading.Lock()
+        self._adapters: Dict[str, SourceAdapter] = {
+            DEFAULT_ADAPTER: self.create_adapter()
+        }
+
+    @property
+    def headers(self) -> CaseInsensitiveDict:
+        return self._headers
+
+    @property
+    def timeout(self):
+        return self._timeout
+
+    def create_adapter(
+        self, tls_profile: str = tls.DEFAULT, http2: Optional[bool] = None
+    ) -> SourceAdapter:
+        """Return a new SourceAdapter with the pool settings of this client."""
+        adapter_cls = SourceAdapter
+        if self._http2 if http2 is None else http2:
+            from .http2 import Http2Adapter
+
+            adapter_cls = Http2Adapter
+        return adapter_cls(
+            default_timeout=self._timeout,
+            tls_profile=tls_profile,
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+        )
+
+    def register_adapter(self, name: str, adapter: SourceAdapter):
+        """Add or replace a named adapter, see session()."""
+        with self._lock:
+            old = self._adapters.get(name)
+            self._adapters[name] = adapter
+        if old is not None and old is not adapter:
+            old.shutdown()
+
+    def adapter(self, name: str = DEFAULT_ADAPTER) -> SourceAdapter:
+        with self._lock:
+            adapter = self._adapters.get(name)
+            if adapter is None and name == LEGACY_SSL_ADAPTER:
+                # created on first use, only few sources need it
+                adapter = self.create_adapter(tls_profile=tls.LEGACY)
+                self._adapters[name] = adapter
+            elif adapter is None and name == HTTP2_ADAPTER:
+                adapter = self.create_adapter(http2=True)
+                self._adapters[name] = adapter
+        if adapter is None:
+            raise KeyError(f"unknown http adapter: {name}")
+        return adapter
+
+    def session(
+        self, adapter: str = DEFAULT_ADAPTER, headers: Optional[Dict[str, str]] = None
+    ) -> requests.Session:
+        """Return a new session which uses the shared adapter with the given name.
+
+        headers are added to the default headers of the session.
+        """
+        s = requests.Session()
+        s.headers.update(self._headers)
+        s.headers.update(headers or {})
+        a = self.adapter(adapter)
+        s.mount("https://", a)
+        s.mount("http://", a)
+        return s
+
+    def request(self, method, url, **kwargs) -> requests.Response:
+        with self.session() as s:
+            return s.request(method=method, url=url, **kwargs)
+
+    def origins(self, unique_id: str) -> Set[Tuple[str, str, str, int]]:
+        """Return (adapter name, scheme, host, port) requested by a source."""
+        with self._lock:
+            adapters = dict(self._adapters)
+        return {
+            (name,) + origin
+            for name, adapter in adapters.items()
+            for origin in adapter.origins(unique_id)
+        }
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return connection reuse statistics per adapter."""
+        with self._lock:
+            adapters = dict(self._adapters)
+        return {name: adapter.stats() for name, adapter in adapters.items()}
+
+    def close(self):
+        """Close all pooled connections."""
+        with self._lock:
+            adapters = list(self._adapters.values())
+        for adapter in adapters:
+            adapter.shutdown()
+
+
+_http_client: Optional[HttpClient] = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Return the process wide HttpClient."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = HttpClient()
+        return _http_client
+
+
+def set_http_client(client: HttpClient):
+    """Replace the process wide HttpClient, e.g. to change pool sizes."""
+    global _http_client
+    with _http_client_lock:
+        old, _http_client = _http_client, client
+    if old is not None and old is not client:
+        old.close()
+
+
+def iter_lines(
+    response: requests.Response,
+    encoding: Optional[str] = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Decode the body of response incrementally and yield it line by line.
+
+    Unlike response.iter_lines(), multi-byte characters and \\r\\n split
+    across chunks are handled correctly. Lines are split like
+    str.splitlines(). encoding defaults to the encoding of the response.
+    """
+    decoder = codecs.getincrementaldecoder(encoding or response.encoding or "utf-8")(
+        errors="replace"
+    )
+    pending = ""
+    for chunk in response.iter_content(chunk_size):
+        lines = (pending + decoder.decode(chunk)).splitlines(keepends=True)
+        pending = ""
+        # keep incomplete last line, and a trailing \r which may be part of \r\n
+        if lines and (
+            lines[-1].endswith("\r") or lines[-1].splitlines()[0] == lines[-1]
+        ):
+            pending = lines.pop()
+        for line in lines:
+            yield line.splitlines()[0]
+    yield from (pending + decoder.decode(b"", final=True)).splitlines()
+
+
+def session(
+    adapter: str = DEFAULT_ADAPTER, headers: Optional[Dict[str, str]] = None
+) -> requests.Session:
+    """Return a new session, replacement for requests.Session().
+
+    headers are added to the default headers, e.g. a source specific
+    User-Agent.
+    """
+    return get_http_client().session(adapter, headers)
+
+
+def request(method, url, **kwargs) -> requests.Response:
+    """Replacement for requests.request()."""
+    return get_http_client().request(method, url, **kwargs)
+
+
+def get(url, params=None, **kwargs) -> requests.Response:
+    """Replacement for requests.get()."""
+    return request("get", url, params=params, **kwargs)
+
+
+def post(url, data=None, json=None, **kwargs) -> requests.Response:
+    """Replacement for requests.post()."""
+    return request("post", url, data=data, json=json, **kwargs)
@@ -0,0 +1,189 @@
+"""Content addressed cache of parsed ICS calendars.
+
+ICS.convert() and ICS_v1.convert() remember their result per calendar
+body, parser settings (offset, regex, split_at) and start of the date
+window. An identical calendar, e.g. the same ics URL configured by many
+users or an unchanged file downloaded again, is only parsed once per day.
+
+Results are kept in a bounded LRU in memory and optionally in a SQLite
+database, so they also survive a restart.
+"""
+
+import datetime
+import hashlib
+import json
+import logging
+import mmap
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1024  # number of results kept in memory
+
+# results are keyed by the start of the window, which moves every day,
+# older rows of the disk tier are never used again
+DEFAULT_MAX_AGE = 2 * 24 * 3600  # seconds
+PRUNE_INTERVAL = 3600  # seconds
+
+Entries = List[Tuple[datetime.date, str]]
+
+
+class IcsCache:
+    """Thread safe LRU of convert() results, with optional SQLite disk tier."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        filename: Optional[str] = None,
+        max_age: float = DEFAULT_MAX_AGE,
+    ):
+        self._max_entries = max_entries
+        self._max_age = max_age
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+        self._conn = None
+        self._last_prune = 0.0
+        if filename is not None:
+            self._conn = sqlite3.connect(filename, check_same_thread=False)
+            with self._conn:
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS ics_cache ("
+                    "key TEXT PRIMARY KEY, stored_at REAL, entries TEXT)"
+                )
+            self._prune()
+
+        # statistics
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def key(
+        parser: str,
+        ics_data: Union[str, bytes, bytearray, memoryview, mmap.mmap],
+        settings: tuple,
+        window_start: datetime.date,
+    ) -> str:
+        """Return the cache key of a calendar body parsed with settings."""
+        # buffers like memoryview and mmap are hashed in place
+        if isinstance(ics_data, str):
+            ics_data = ics_data.encode("utf-8")
+        digest = hashlib.sha256(ics_data).hexdigest()
+        return hashlib.sha256(
+            f"{parser} {settings!r} {window_start.isoformat()} {digest}".encode()
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[Entries]:
+        with self._lock:
+            entries = self._entries.get(key)
+            if entries is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return list(entries)
+            if self._conn is None:
+                self._misses += 1
+                return None
+            row = self._conn.execute(
+                "SELECT entries FROM ics_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            self._disk_hits += 1
+
+        entries = [
+            (datetime.date.fromordinal(ordinal), waste_type)
+            for ordinal, waste_type in json.loads(row[0])
+        ]
+        self._put_memory(key, entries)
+        return list(entries)
+
+    def put(self, key: str, entries: Entries):
+        self._put_memory(key, entries)
+        if self._conn is None:
+            return
+        try:
+            rows = [(date.toordinal(), waste_type) for date, waste_type in entries]
+        except AttributeError:
+            # not a list of (date, str), keep it in memory only
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ics_cache VALUES (?, ?, ?)",
+                (
+                    key,
+                    time.time(),
+                    json.dumps(rows, separators=(",", ":"), ensure_ascii=False),
+                ),
+            )
+        if time.monotonic() - self._last_prune > PRUNE_INTERVAL:
+            self._prune()
+
+    def _put_memory(self, key: str, entries: Entries):
+        if self._max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = list(entries)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def _prune(self):
+        """Remove rows of the disk tier older than max_age."""
+        with self._lock, self._conn:
+            self._last_prune = time.monotonic()
+            self._conn.execute(
+                "DELETE FROM ics_cache WHERE stored_at < ?",
+                (time.time() - self._max_age,),
+            )
+
+    def get_or_convert(self, key: str, convert: Callable[[], Entries]) -> Entries:
+        """Return the cached result for key, call convert() if there is none."""
+        entries = self.get(key)
+        if entries is None:
+            entries = convert()
+            self.put(key, entries)
+        return entries
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM ics_cache")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_ics_cache = IcsCache()
+
+
+def get_ics_cache() -> IcsCache:
+    """Return the process wide IcsCache."""
+    return _ics_cache
+
+
+def set_ics_cache(cache: IcsCache):
+    """Replace the process wide IcsCache, e.g. to enable the disk tier."""
+    global _ics_cache
+    _ics_cache = cache
@@ -0,0 +1,158 @@
+"""Network accounting per source and host.
+
+SourceAdapter records every request sent on behalf of a source, see
+http_client.source_context(). Requests sent outside of a source context are
+accounted to the unique_id "". Requests of a batch preparation are accounted
+to every source of the batch.
+
+Sizes are approximations: bytes out are the request line, headers and body,
+bytes in are the status line, headers and the body as transferred (e.g.
+compressed). Time to first byte is measured from sending the request until
+the response headers are received, after waiting for the rate limiter.
+Duration ends when the body has been read completely or the response is
+closed.
+"""
+
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# unique_id of requests which are not sent on behalf of a source
+UNATTRIBUTED = ""
+
+# status code key of requests which failed without a response
+ERROR = "error"
+
+
+class HostStats:
+    """Accumulated statistics of the requests of one source to one host."""
+
+    def __init__(self):
+        self.requests = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.ttfb = 0.0
+        self.max_ttfb = 0.0
+        self.duration = 0.0
+        self.status_codes: Counter = Counter()
+
+    def as_dict(self) -> Dict:
+        return {
+            "requests": self.requests,
+            "bytes_out": self.bytes_out,
+            "bytes_in": self.bytes_in,
+            "avg_ttfb": self.ttfb / self.requests if self.requests else 0.0,
+            "max_ttfb": self.max_ttfb,
+            "duration": self.duration,
+            "status_codes": dict(self.status_codes),
+        }
+
+
+class NetworkStats:
+    """Thread safe collection of HostStats per (unique_id, host)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], HostStats] = {}
+
+    def _get(self, unique_id: str, host: str) -> HostStats:
+        stats = self._stats.get((unique_id, host))
+        if stats is None:
+            stats = self._stats[(unique_id, host)] = HostStats()
+        return stats
+
+    def record_response(
+        self,
+        unique_ids: Iterable[str],
+        host: str,
+        bytes_out: int,
+        ttfb: float,
+        status_code,
+    ):
+        """Count a request whose response headers were received (or ERROR)."""
+        with self._lock:
+            for unique_id in unique_ids or (UNATTRIBUTED,):
+                stats = self._get(unique_id, host)
+                stats.requests += 1
+                stats.bytes_out += bytes_out
+                stats.ttfb += ttfb
+                stats.max_ttfb = max(stats.max_ttfb, ttfb)
+                stats.status_codes[status_code] += 1
+
+    def record_body(
+        self, unique_ids: Iterable[str], host: str, bytes_in: int, duration: float
+    ):
+        """Add the size and total duration of a completed response."""
+        with self._lock:
+            for unique_id in unique_ids or (UNATTRIBUTED,):
+                stats = self._get(unique_id, host)
+                stats.bytes_in += bytes_in
+                stats.duration += duration
+
+    def stats(self, unique_id: Optional[str] = None) -> Dict[str, Dict]:
+        """Return statistics per host of one source, or of all sources if None."""
+        with self._lock:
+            if unique_id is not None:
+                return {
+                    host: stats.as_dict()
+                    for (uid, host), stats in self._stats.items()
+                    if uid == unique_id
+                }
+            result: Dict[str, Dict] = {}
+            for (uid, host), stats in self._stats.items():
+                result.setdefault(uid, {})[host] = stats.as_dict()
+            return result
+
+    def report(self, unique_ids: Optional[Iterable[str]] = None) -> str:
+        """Return a table of the statistics, heaviest sources first."""
+        all_stats = self.stats()
+        if unique_ids is not None:
+            unique_ids = set(unique_ids)
+            all_stats = {k: v for k, v in all_stats.items() if k in unique_ids}
+
+        rows: List[Tuple] = []
+        for unique_id, hosts in all_stats.items():
+            for host, s in hosts.items():
+                codes = " ".join(
+                    f"{code}:{n}"
+                    for code, n in sorted(s["status_codes"].items(), key=str)
+                )
+                rows.append(
+                    (
+                        unique_id or "(none)",
+                        host,
+                        s["requests"],
+                        s["bytes_out"],
+                        s["bytes_in"],
+                        s["avg_ttfb"],
+                        s["duration"],
+                        codes,
+                    )
+                )
+        rows.sort(key=lambda r: (-r[4], -r[6], r[0], r[1]))
+
+        lines = [
+            f"{'source':<40} {'host':<32} {'req':>5} {'out':>9} {'in':>11} {'ttfb':>7} {'time':>8}  status"
+        ]
+        for uid, host, requests, out, in_, ttfb, duration, codes in rows:
+            lines.append(
+                f"{uid:<40} {host:<32} {requests:>5} {out:>9} {in_:>11} {ttfb:>7.3f} {duration:>8.3f}  {codes}"
+            )
+        return "\n".join(lines)
+
+    def reset(self, unique_id: Optional[str] = None):
+        """Remove statistics of one source, or of all sources if None."""
+        with self._lock:
+            if unique_id is None:
+                self._stats.clear()
+            else:
+                for key in [k for k in self._stats if k[0] == unique_id]:
+                    del self._stats[key]
+
+
+_network_stats = NetworkStats()
+
+
+def get_network_stats() -> NetworkStats:
+    """Return the process wide network statistics."""
+    return _network_stats
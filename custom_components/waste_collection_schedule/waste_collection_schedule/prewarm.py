@@ -0,0 +1,151 @@
+"""Resolve and connect to the servers of sources ahead of a refresh.
+
+Only the TCP connection and the TLS handshake are made, no request is sent.
+The connections are kept in the shared connection pools, where the first
+requests of the refresh pick them up.
+
+The servers of a source are the ones it requested in earlier fetches. For
+sources which haven't been fetched yet, they are guessed from the URL
+constants of the source module (e.g. API_URL) and from URL arguments.
+"""
+
+import concurrent.futures
+import logging
+import re
+import sys
+from typing import Dict, Iterable, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+from . import http_client
+from .dns_cache import get_dns_cache
+from .rate_limiter import get_rate_limiter
+from .resilience import get_resilience
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PREWARM_TIMEOUT = 5.0  # seconds
+DEFAULT_CONNECT_TIMEOUT = 5.0  # seconds
+
+# URL constants of source modules, without str.format() placeholders
+_URL_REGEX = re.compile(r"https?://[^\s{}]+")
+
+# (adapter name, scheme, host, port)
+Target = Tuple[str, str, str, int]
+
+
+def _origin(url: str) -> Optional[Tuple[str, str, int]]:
+    if not _URL_REGEX.fullmatch(url):
+        return None
+    parsed = urlparse(url)
+    if not parsed.hostname:
+        return None
+    default_port = 443 if parsed.scheme == "https" else 80
+    return (parsed.scheme, parsed.hostname, parsed.port or default_port)
+
+
+def source_targets(shell) -> Set[Target]:
+    """Return the servers a SourceShell is expected to request."""
+    client = http_client.get_http_client()
+    targets = client.origins(shell.unique_id)
+    if targets:
+        return targets
+
+    urls = []
+    module = sys.modules.get(type(shell.source).__module__)
+    if module is not None:
+        for name, value in vars(module).items():
+            # URL is the homepage of the service provider, not its API
+            if name.isupper() and name != "URL" and isinstance(value, str):
+                urls.append(value)
+    for value in (shell.source_args or {}).values():
+        if isinstance(value, str):
+            urls.append(value)
+
+    origins = filter(None, map(_origin, urls))
+    return {(http_client.DEFAULT_ADAPTER,) + origin for origin in origins}
+
+
+def warm_connection(target: Target, timeout: float = DEFAULT_CONNECT_TIMEOUT):
+    """Open a keep-alive connection to target in the shared connection pool.
+
+    The connection passes the rate limiter of the host. Nothing is done if
+    the pool already has an idle connection. Return True if a connection
+    was opened.
+    """
+    name, scheme, host, port = target
+    client = http_client.get_http_client()
+    adapter = client.adapter(name)
+    url = f"{scheme}://{host}:{port}/"
+    with client.session(name) as s:
+        settings = s.merge_environment_settings(url, {}, None, None, None)
+    if settings["proxies"]:
+        # connections to proxies are not pooled per target
+        return False
+
+    pool = adapter.get_connection_with_tls_context(
+        requests.Request("GET", url).prepare(), settings["verify"]
+    )
+    adapter.cert_verify(pool, url, settings["verify"], None)
+    if pool.idle_connections() > 0:
+        return False
+    with get_rate_limiter().acquire(host):
+        return pool.warm(timeout)
+
+
+def prewarm(
+    shells: Iterable,
+    executor: Optional[concurrent.futures.Executor] = None,
+    timeout: Optional[float] = DEFAULT_PREWARM_TIMEOUT,
+    connect: bool = True,
+) -> Dict[str, int]:
+    """Resolve and connect to the servers of shells.
+
+    Waits at most timeout seconds, unfinished connection attempts continue
+    in the background. Servers whose circuit breaker isn't closed are
+    skipped, a half-open circuit is left to the trial request.
+    """
+    targets: Set[Target] = set()
+    for shell in shells:
+        targets |= source_targets(shell)
+    resilience = get_resilience()
+    targets = {t for t in targets if resilience.host_breaker(t[2]).state == "closed"}
+    if not targets:
+        return {"targets": 0, "resolved": 0, "connected": 0}
+
+    own_executor = executor is None
+    if own_executor:
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(targets), 16), thread_name_prefix="wcs_prewarm"
+        )
+
+    def warm(target: Target):
+        try:
+            get_dns_cache().resolve(target[2], target[3])
+        except OSError as error:
+            _LOGGER.debug(f"failed to resolve {target[2]}: {error}")
+            return None
+        if not connect:
+            return False
+        try:
+            return warm_connection(target)
+        except Exception as error:
+            _LOGGER.debug(f"failed to connect to {target[2]}: {error}")
+            return False
+
+    try:
+        futures = [executor.submit(warm, target) for target in targets]
+        done, _ = concurrent.futures.wait(futures, timeout=timeout)
+    finally:
+        if own_executor:
+            executor.shutdown(wait=False)
+
+    results = [f.result() for f in done]
+    stats = {
+        "targets": len(targets),
+        "resolved": sum(1 for r in results if r is not None),
+        "connected": sum(1 for r in results if r),
+    }
+    _LOGGER.debug(f"prewarmed {stats}")
+    return stats
@@ -0,0 +1,203 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from . import deadline
+from .exceptions import FetchTimeoutError
+
+_LOGGER = logging.getLogger(__name__)
+
+# defaults for hosts without explicit configuration
+DEFAULT_RATE = 10.0  # requests per second
+DEFAULT_BURST = 10
+DEFAULT_MAX_CONNECTIONS = 8
+
+
+class HostLimit:
+    """Token bucket and connection cap for one upstream host.
+
+    The limit applies to the configured host name and all of its
+    subdomains, e.g. a limit for "regioit.de" is shared by all
+    "<service>-abfallapp.regioit.de" hosts.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        rate: Optional[float] = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+    ):
+        self._host = host
+        self._rate = rate
+        self._burst = burst
+        self._max_connections = max_connections
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._connections = (
+            threading.BoundedSemaphore(max_connections)
+            if max_connections is not None
+            else None
+        )
+
+        # statistics
+        self._requests = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    def host(self):
+        return self._host
+
+    def _reserve_token(self) -> float:
+        """Take one token and return how long the caller has to wait for it."""
+        if self._rate is None:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._last_refill) * self._rate
+            )
+            self._last_refill = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            # token is borrowed from the future
+            return -self._tokens / self._rate
+
+    def _refund_token(self):
+        """Return the token of a request which is not sent."""
+        if self._rate is None:
+            return
+
+        with self._lock:
+            self._tokens = min(self._burst, self._tokens + 1)
+
+    @contextmanager
+    def acquire(self):
+        """Wait for a free token and connection slot, yield the wait time.
+
+        Raises FetchTimeoutError if the deadline of the current fetch passes
+        while waiting. The token is returned then, the request isn't sent.
+        """
+        start = time.monotonic()
+        delay = self._reserve_token()
+        if delay > 0:
+            left = deadline.remaining()
+            if left is not None and left < delay:
+                self._refund_token()
+                raise FetchTimeoutError()
+            time.sleep(delay)
+        if self._connections is not None:
+            left = deadline.remaining()
+            if left is None:
+                self._connections.acquire()
+            elif left <= 0 or not self._connections.acquire(timeout=left):
+                self._refund_token()
+                raise FetchTimeoutError()
+        waited = time.monotonic() - start
+
+        with self._lock:
+            self._requests += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+
+        try:
+            yield waited
+        finally:
+            if self._connections is not None:
+                self._connections.release()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "total_wait": self._total_wait,
+                "max_wait": self._max_wait,
+                "avg_wait": (
+                    self._total_wait / self._requests if self._requests else 0.0
+                ),
+            }
+
+
+class HostRateLimiter:
+    """Process wide registry of per-host limits."""
+
+    def __init__(
+        self,
+        default_rate: Optional[float] = DEFAULT_RATE,
+        default_burst: int = DEFAULT_BURST,
+        default_max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+    ):
+        self._default_rate = default_rate
+        self._default_burst = default_burst
+        self._default_max_connections = default_max_connections
+        self._configured: Dict[str, HostLimit] = {}
+        self._limits: Dict[str, HostLimit] = {}
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        host: str,
+        rate: Optional[float] = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+    ):
+        """Set limit for host and its subdomains. rate=None means unlimited."""
+        host = host.lower()
+        with self._lock:
+            self._configured[host] = HostLimit(
+                host, rate=rate, burst=burst, max_connections=max_connections
+            )
+            # re-resolve hosts which may be affected by the new limit
+            self._limits = {
+                h: limit
+                for h, limit in self._limits.items()
+                if not (h == host or h.endswith("." + host))
+            }
+
+    def get_limit(self, host: str) -> HostLimit:
+        host = host.lower()
+        with self._lock:
+            limit = self._limits.get(host)
+            if limit is None:
+                limit = self._find_configured(host)
+                if limit is None:
+                    limit = HostLimit(
+                        host,
+                        rate=self._default_rate,
+                        burst=self._default_burst,
+                        max_connections=self._default_max_connections,
+                    )
+                self._limits[host] = limit
+            return limit
+
+    def _find_configured(self, host: str) -> Optional[HostLimit]:
+        # walk up the domain hierarchy: a.b.example.com -> b.example.com -> ...
+        parts = host.split(".")
+        for i in range(len(parts)):
+            limit = self._configured.get(".".join(parts[i:]))
+            if limit is not None:
+                return limit
+        return None
+
+    def acquire(self, host: str):
+        return self.get_limit(host).acquire()
+
+    def stats(self) -> Dict[str, Dict]:
+        """Return statistics per configured host resp. per unconfigured host."""
+        with self._lock:
+            limits = {limit.host: limit for limit in self._limits.values()}
+        return {host: limit.stats() for host, limit in limits.items()}
+
+
+_rate_limiter = HostRateLimiter()
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """Return the process wide rate limiter."""
+    return _rate_limiter
@@ -0,0 +1,124 @@
+"""Incrementally expanded recurrence rules.
+
+A Recurrence keeps a compiled dateutil rule together with the occurrences
+expanded so far. between() only expands the rule beyond the last expanded
+occurrence, so moving the window forward by a day costs one day of
+expansion instead of a whole window.
+
+Recurrences are shared process wide by key, see get_recurrence(): many
+addresses with the same weekly rule expand it only once.
+"""
+
+import bisect
+import datetime
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Iterable, List
+
+DEFAULT_MAX_RECURRENCES = 4096  # number of shared recurrences
+
+
+class Recurrence:
+    """Occurrence dates of a rule, expanded on demand.
+
+    rule is an iterable of datetime's in ascending order, e.g. a dateutil
+    rrule or rruleset, which may be infinite.
+    """
+
+    def __init__(self, rule: Iterable[datetime.datetime]):
+        self._rule = rule
+        self._iterator = iter(rule)
+        self._lock = threading.Lock()
+        # expanded occurrences, ascending
+        self._dates: List[datetime.date] = []
+        self._exhausted = False
+
+    @property
+    def rule(self):
+        return self._rule
+
+    @property
+    def expanded(self) -> int:
+        """Return number of occurrences expanded so far."""
+        return len(self._dates)
+
+    def _expand(self, end: datetime.date):
+        while not self._exhausted and (not self._dates or self._dates[-1] <= end):
+            try:
+                date = next(self._iterator).date()
+            except StopIteration:
+                self._exhausted = True
+                return
+            if not self._dates or date > self._dates[-1]:
+                self._dates.append(date)
+
+    def between(self, start: datetime.date, end: datetime.date) -> List[datetime.date]:
+        """Return the occurrences from start to end, both inclusive."""
+        with self._lock:
+            self._expand(end)
+            return self._dates[
+                bisect.bisect_left(self._dates, start) : bisect.bisect_right(
+                    self._dates, end
+                )
+            ]
+
+
+class RecurrenceCache:
+    """Bounded LRU of shared Recurrence's."""
+
+    def __init__(self, max_recurrences: int = DEFAULT_MAX_RECURRENCES):
+        self._max_recurrences = max_recurrences
+        self._lock = threading.Lock()
+        self._recurrences: OrderedDict = OrderedDict()
+
+        # statistics
+        self._hits = 0
+        self._misses = 0
+
+    def get(
+        self, key: Hashable, factory: Callable[[], Iterable[datetime.datetime]]
+    ) -> Recurrence:
+        """Return the Recurrence of key, compile it with factory() if needed."""
+        with self._lock:
+            recurrence = self._recurrences.get(key)
+            if recurrence is not None:
+                self._recurrences.move_to_end(key)
+                self._hits += 1
+                return recurrence
+            self._misses += 1
+
+        recurrence = Recurrence(factory())
+        with self._lock:
+            recurrence = self._recurrences.setdefault(key, recurrence)
+            self._recurrences.move_to_end(key)
+            while len(self._recurrences) > self._max_recurrences:
+                self._recurrences.popitem(last=False)
+        return recurrence
+
+    def clear(self):
+        with self._lock:
+            self._recurrences.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "recurrences": len(self._recurrences),
+                "hits": self._hits,
+                "misses": self._misses,
+                "expanded": sum(r.expanded for r in self._recurrences.values()),
+            }
+
+
+_recurrence_cache = RecurrenceCache()
+
+
+def get_recurrence_cache() -> RecurrenceCache:
+    """Return the process wide RecurrenceCache."""
+    return _recurrence_cache
+
+
+def get_recurrence(
+    key: Hashable, factory: Callable[[], Iterable[datetime.datetime]]
+) -> Recurrence:
+    """Return the shared Recurrence of key, see RecurrenceCache.get()."""
+    return _recurrence_cache.get(key, factory)
@@ -0,0 +1,151 @@
+import datetime
+import logging
+import random
+import threading
+from collections import deque
+from typing import Dict, List, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+# fetches slower than this are considered expensive and refreshed less often
+SLOW_FETCH_DURATION = 30.0  # seconds
+
+# assumed probability that a refresh changes the entries if there is no history
+INITIAL_VOLATILITY = 0.5
+
+
+class _ShellState:
+    def __init__(self, shell, next_refresh: datetime.datetime, history: int):
+        self.shell = shell
+        self.next_refresh = next_refresh
+        self.changes: deque = deque(maxlen=history)
+        self.durations: deque = deque(maxlen=history)
+        self.fingerprint: Optional[int] = None
+
+
+def fingerprint(entries) -> int:
+    """Return hash over dates and types of entries, ignoring the order."""
+    return hash(frozenset((e.date, e.type) for e in entries))
+
+
+class RefreshScheduler:
+    """Compute individual refresh times for SourceShell's.
+
+    The refresh interval of a shell is derived from:
+    - the horizon of its data: a shell with dates for the next year doesn't
+      need to be refreshed as often as one which only knows the next week.
+      The base interval is a quarter of the horizon.
+    - the volatility: the share of recent refreshes which changed the
+      entries. The interval moves towards min_interval the more volatile
+      a shell is.
+    - the fetch duration: slow fetches get up to twice the interval.
+
+    The result is clamped to [min_interval, max_interval] and randomized by
+    +/- jitter to avoid synchronized refreshes.
+    """
+
+    def __init__(
+        self,
+        min_interval: datetime.timedelta = datetime.timedelta(hours=1),
+        max_interval: datetime.timedelta = datetime.timedelta(days=7),
+        jitter: float = 0.1,
+        history: int = 10,
+    ):
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._jitter = jitter
+        self._history = history
+        self._lock = threading.Lock()
+        self._states: Dict[int, _ShellState] = {}
+
+    def add(self, shell, now: Optional[datetime.datetime] = None):
+        """Add shell to the scheduler.
+
+        Shells without data are due immediately, shells with data (e.g.
+        restored from a snapshot) are spread over their first interval to
+        avoid a refresh storm on startup.
+        """
+        now = now or datetime.datetime.now()
+        state = _ShellState(shell, now, self._history)
+        if shell.refreshtime is not None:
+            state.fingerprint = fingerprint(shell.entries)
+            state.next_refresh = now + random.random() * self.interval(shell, now)
+        with self._lock:
+            self._states[id(shell)] = state
+
+    def remove(self, shell):
+        with self._lock:
+            self._states.pop(id(shell), None)
+
+    def next_refresh(self, shell) -> Optional[datetime.datetime]:
+        state = self._states.get(id(shell))
+        return state.next_refresh if state is not None else None
+
+    def due(self, now: Optional[datetime.datetime] = None) -> List:
+        """Return all shells whose refresh time has been reached."""
+        now = now or datetime.datetime.now()
+        with self._lock:
+            return [s.shell for s in self._states.values() if s.next_refresh <= now]
+
+    def volatility(self, shell) -> float:
+        state = self._states.get(id(shell))
+        if state is None or len(state.changes) == 0:
+            return INITIAL_VOLATILITY
+        return sum(state.changes) / len(state.changes)
+
+    def interval(
+        self, shell, now: Optional[datetime.datetime] = None
+    ) -> datetime.timedelta:
+        """Return refresh interval for shell at now, without jitter."""
+        today = (now or datetime.datetime.now()).date()
+        last_date = max((e.date for e in shell.entries), default=None)
+        if last_date is None or last_date <= today:
+            return self._min_interval
+
+        base = (last_date - today) / 4
+        base = min(max(base, self._min_interval), self._max_interval)
+
+        v = self.volatility(shell)
+        interval = base * (1 - v) + self._min_interval * v
+
+        state = self._states.get(id(shell))
+        if state is not None and len(state.durations) > 0:
+            avg_duration = sum(state.durations) / len(state.durations)
+            interval *= 1 + min(avg_duration / SLOW_FETCH_DURATION, 1)
+
+        return min(max(interval, self._min_interval), self._max_interval)
+
+    def record_fetch(
+        self,
+        shell,
+        duration: Optional[float],
+        now: Optional[datetime.datetime] = None,
+    ):
+        """Update statistics after a fetch and schedule the next refresh.
+
+        Failed fetches are retried after min_interval.
+        """
+        now = now or datetime.datetime.now()
+        state = self._states.get(id(shell))
+        if state is None:
+            return
+
+        if shell.last_error is not None or duration is None:
+            interval = self._min_interval
+        else:
+            new_fingerprint = fingerprint(shell.entries)
+            if state.fingerprint is not None:
+                state.changes.append(new_fingerprint != state.fingerprint)
+            state.fingerprint = new_fingerprint
+            state.durations.append(duration)
+            interval = self.interval(shell, now)
+
+        interval *= 1 + random.uniform(-self._jitter, self._jitter)
+        state.next_refresh = now + interval
+
+    def refresh_due(self, executor, timeout: Optional[float] = None) -> List:
+        """Fetch all due shells with a FetchExecutor and reschedule them."""
+        results = executor.fetch_all(self.due(), timeout=timeout)
+        for result in results:
+            self.record_fetch(result.shell, result.duration)
+        return results
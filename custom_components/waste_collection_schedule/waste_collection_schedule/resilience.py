@@ -0,0 +1,269 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import requests
+
+from . import deadline
+from .exceptions import CircuitOpenError, SourceArgumentNotFound
+
+_LOGGER = logging.getLogger(__name__)
+
+# HTTP status codes which indicate a temporary problem of the provider
+TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def is_transient(error: BaseException) -> bool:
+    """Return True if retrying the failed call might succeed."""
+    if isinstance(error, requests.HTTPError):
+        return (
+            error.response is not None
+            and error.response.status_code in TRANSIENT_STATUS_CODES
+        )
+    return isinstance(
+        error,
+        (
+            requests.ConnectionError,
+            requests.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+        ),
+    )
+
+
+def is_permanent(error: BaseException) -> bool:
+    """Return True if retrying the failed call with the same args is pointless."""
+    return isinstance(error, SourceArgumentNotFound)
+
+
+class CircuitBreaker:
+    """Stop calling a provider after consecutive failures.
+
+    After failure_threshold consecutive failures the circuit opens and all
+    calls fail immediately with CircuitOpenError. After reset_timeout one
+    trial call is let through (half-open): success closes the circuit,
+    failure opens it again.
+    """
+
+    def __init__(self, key: str, failure_threshold: int = 5, reset_timeout=300.0):
+        self._key = key
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+
+    @property
+    def key(self):
+        return self._key
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at >= self._reset_timeout:
+                return "half-open"
+            return "open"
+
+    def before_call(self) -> bool:
+        """Raise CircuitOpenError if the call shall not be made.
+
+        Return True if the call is the trial call of a half-open circuit.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            elapsed = time.monotonic() - self._opened_at
+            if elapsed >= self._reset_timeout and not self._trial_running:
+                self._trial_running = True
+                return True
+            raise CircuitOpenError(self._key, max(self._reset_timeout - elapsed, 0))
+
+    def cancel_trial(self):
+        """Let the next call be the trial if the trial call ended unrecorded.
+
+        E.g. the fetch ran out of time, which says nothing about the provider.
+        """
+        with self._lock:
+            self._trial_running = False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_running or self._failures >= self._failure_threshold:
+                if self._opened_at is None:
+                    _LOGGER.warning(f"opening circuit for {self._key}")
+                self._opened_at = time.monotonic()
+            self._trial_running = False
+
+
+class Resilience:
+    """Retry, circuit breaker and negative cache for source fetches.
+
+    Circuit breakers are kept per upstream host only (for single requests,
+    see http_client). A source module like ics talks to many unrelated
+    hosts, one of them being down must not stop the fetches of the others.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 300.0,
+        negative_ttl: float = 24 * 3600.0,
+    ):
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        # unique_id -> (expiry, error)
+        self._negative_cache: Dict[str, Tuple[float, BaseException]] = {}
+
+    def breaker(self, key: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    key,
+                    failure_threshold=self._failure_threshold,
+                    reset_timeout=self._reset_timeout,
+                )
+                self._breakers[key] = breaker
+            return breaker
+
+    def host_breaker(self, host: str) -> CircuitBreaker:
+        return self.breaker(f"host:{host.lower()}")
+
+    def backoff(self, attempt: int) -> float:
+        """Return delay before retry number attempt (exponential, full jitter)."""
+        return random.uniform(0, min(self._max_delay, self._base_delay * 2**attempt))
+
+    def cached_failure(self, unique_id: str) -> Optional[BaseException]:
+        """Return cached permanent failure for unique_id, if any."""
+        with self._lock:
+            cached = self._negative_cache.get(unique_id)
+            if cached is None:
+                return None
+            if cached[0] <= time.monotonic():
+                del self._negative_cache[unique_id]
+                return None
+            return cached[1]
+
+    def remember_failure(self, unique_id: str, error: BaseException):
+        """Cache error for unique_id if it is permanent."""
+        if not is_permanent(error):
+            return
+        with self._lock:
+            self._negative_cache[unique_id] = (
+                time.monotonic() + self._negative_ttl,
+                error,
+            )
+
+    def _retry_delay(
+        self, unique_id: Optional[str], error: Exception, attempt: int
+    ) -> Optional[float]:
+        """Return delay before retry number attempt after error, None to give up."""
+        if isinstance(error, CircuitOpenError):
+            # the circuit of an upstream host is open, no point in retrying
+            return None
+        if is_permanent(error):
+            # the provider answered, it is the configuration which is wrong
+            if unique_id is not None:
+                self.remember_failure(unique_id, error)
+            return None
+        if not is_transient(error):
+            # e.g. a parse error: the provider is up, don't retry
+            return None
+        if attempt >= self._max_attempts:
+            return None
+        delay = self.backoff(attempt)
+        left = deadline.remaining()
+        if left is not None and left <= delay:
+            # no time left for another attempt
+            return None
+        what = "" if unique_id is None else f" {unique_id}"
+        _LOGGER.info(f"retrying{what} in {delay:.1f}s after error: {error}")
+        return delay
+
+    def call(self, unique_id: Optional[str], fn: Callable[[], Any]) -> Any:
+        """Call fn with retries and negative cache.
+
+        The negative cache is skipped if unique_id is None. Failing hosts
+        are tracked by the host circuit breakers of the requests made by fn.
+        """
+        if unique_id is not None:
+            cached = self.cached_failure(unique_id)
+            if cached is not None:
+                raise cached
+
+        attempt = 0
+        while True:
+            try:
+                return fn()
+            except Exception as error:
+                attempt += 1
+                delay = self._retry_delay(unique_id, error, attempt)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+
+    async def call_async(
+        self, unique_id: Optional[str], fn: Callable[[], Awaitable]
+    ) -> Any:
+        """Await fn() with retries and negative cache, see call()."""
+        if unique_id is not None:
+            cached = self.cached_failure(unique_id)
+            if cached is not None:
+                raise cached
+
+        attempt = 0
+        while True:
+            try:
+                return await fn()
+            except Exception as error:
+                attempt += 1
+                delay = self._retry_delay(unique_id, error, attempt)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+
+    def clear_negative_cache(self, unique_id: Optional[str] = None):
+        """Forget cached permanent failures, e.g. after a configuration change."""
+        with self._lock:
+            if unique_id is None:
+                self._negative_cache.clear()
+            else:
+                self._negative_cache.pop(unique_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            breakers = list(self._breakers.values())
+            negative = len(self._negative_cache)
+        return {
+            "open_circuits": [b.key for b in breakers if b.state != "closed"],
+            "negative_cache": negative,
+        }
+
+
+_resilience = Resilience()
+
+
+def get_resilience() -> Resilience:
+    """Return the process wide resilience layer used by SourceShell."""
+    return _resilience
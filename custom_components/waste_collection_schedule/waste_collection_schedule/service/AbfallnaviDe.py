@@ -3,7 +3,7 @@
 import datetime
 import json
 
-import requests
+from waste_collection_schedule import http_client
 
 SERVICE_DOMAINS = {
     "aachen": "Aachen",
@@ -38,7 +38,7 @@ class AbfallnaviDe:
         self._service_url = f"https://{service_domain}-abfallapp.regioit.de/abfall-app-{service_domain}/rest"
 
     def _fetch(self, path, params=None):
-        r = requests.get(f"{self._service_url}/{path}", params=params)
+        r = http_client.get(f"{self._service_url}/{path}", params=params)
         r.encoding = "utf-8"  # requests doesn't guess the encoding correctly
         return r.text
 
@@ -111,14 +111,20 @@ class AbfallnaviDe:
             entries.append([date, fraktion])
         return entries
 
-    def get_dates_by_street_id(self, street_id):
-        return self._get_dates("strassen", street_id, waste_types=None)
+    def get_dates_by_street_id(self, street_id, waste_types=None):
+        return self._get_dates("strassen", street_id, waste_types=waste_types)
 
-    def get_dates_by_house_number_id(self, house_number_id):
-        return self._get_dates("hausnummern", house_number_id, waste_types=None)
+    def get_dates_by_house_number_id(self, house_number_id, waste_types=None):
+        return self._get_dates(
+            "hausnummern", house_number_id, waste_types=waste_types
+        )
 
-    def get_dates(self, city, street, house_number=None):
-        """Get dates by strings only for convenience."""
+    def get_dates(self, city, street, house_number=None, waste_types=None):
+        """Get dates by strings only for convenience.
+
+        waste_types can be passed to reuse the result of get_waste_types()
+        for many addresses of the same service domain.
+        """
         # find city_id
         city_id = self.get_city_id(city)
         if city_id is None:
@@ -135,9 +141,9 @@ class AbfallnaviDe:
         # return dates for specific house number of street if house number
         # doesn't have an own id
         if house_number_id is not None:
-            return self.get_dates_by_house_number_id(house_number_id)
+            return self.get_dates_by_house_number_id(house_number_id, waste_types)
         else:
-            return self.get_dates_by_street_id(street_id)
+            return self.get_dates_by_street_id(street_id, waste_types)
 
     def _find_in_inverted_dict(self, mydict, value):
         inverted_dict = dict(map(reversed, mydict.items()))
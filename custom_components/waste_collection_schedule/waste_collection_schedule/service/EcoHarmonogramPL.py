@@ -1,6 +1,6 @@
 import sys
 
-import requests
+from waste_collection_schedule import http_client
 
 towns_url = "https://ecoharmonogram.pl/api/api.php?action=getTowns"
 community_towns_url = "https://ecoharmonogram.pl/api/api.php?action=getTownsForCommunity"
@@ -18,7 +18,7 @@ class Ecoharmonogram:
     @staticmethod
     def fetch_schedules(sp, street):
         payload = {'streetId': street.get("id"), 'schedulePeriodId': sp.get("id")}
-        schedules_response = requests.get(
+        schedules_response = http_client.get(
             schedules_url,
             headers=headers, params=payload)
         schedules_response.encoding = "utf-8-sig"
@@ -30,7 +30,7 @@ class Ecoharmonogram:
         payload = {'streetName': str(street), 'number': str(house_number), 'townId': town.get("id"),
                    'schedulePeriodId': sp.get("id")}
 
-        streets_response = requests.get(
+        streets_response = http_client.get(
             streets_url, headers=headers, params=payload)
         streets_response.encoding = "utf-8-sig"
         streets = streets_response.json().get("streets")
@@ -39,14 +39,14 @@ class Ecoharmonogram:
     @staticmethod
     def fetch_scheduled_periods(town):
         payload = {'townId': town.get("id")}
-        scheduled_perionds_response = requests.get(scheduled_periods_url, headers=headers, params=payload)
+        scheduled_perionds_response = http_client.get(scheduled_periods_url, headers=headers, params=payload)
         scheduled_perionds_response.encoding = "utf-8-sig"
         schedule_periods_data = scheduled_perionds_response.json()
         return schedule_periods_data
 
     @staticmethod
     def fetch_town():
-        town_response = requests.get(towns_url, headers=headers)
+        town_response = http_client.get(towns_url, headers=headers)
         town_response.encoding = "utf-8-sig"
         town_data = town_response.json()
         return town_data
@@ -54,7 +54,7 @@ class Ecoharmonogram:
     @staticmethod
     def fetch_town_with_community(community):
         payload = {'communityId': community}
-        town_response = requests.get(community_towns_url, headers=headers, params=payload)
+        town_response = http_client.get(community_towns_url, headers=headers, params=payload)
         town_response.encoding = "utf-8-sig"
         town_data = town_response.json()
         return town_data
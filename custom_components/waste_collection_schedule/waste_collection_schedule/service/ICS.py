@@ -1,12 +1,332 @@
 import datetime
 import logging
+import mmap
 import re
-from typing import Any, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+import icalendar
+import recurring_ical_events
+from dateutil.rrule import rrulestr
 from icalevents import icalevents
+from waste_collection_schedule.ics_cache import get_ics_cache
+from waste_collection_schedule.recurrence import get_recurrence
 
 _LOGGER = logging.getLogger(__name__)
 
+# calendar body: text, or the undecoded bytes of a response or file, also as
+# memoryview or mmap, which are decoded by the parser only
+IcsData = Union[str, bytes, bytearray, memoryview, mmap.mmap]
+
+# VEVENT properties which need the recurrence or exception handling of
+# icalevents, see _scan()
+_FULL_ENGINE_PROPERTIES = {
+    "RDATE",
+    "EXRULE",
+    "RECURRENCE-ID",
+    "DURATION",
+}
+
+# VEVENT properties evaluated by _scan(), each must appear at most once
+_SCANNED_PROPERTIES = {"DTSTART", "DTEND", "SUMMARY", "RRULE"}
+
+# rules of all-day events expanded by _scan(), anything else (e.g. UNTIL
+# with a time, which icalevents moves to the next day) is left to icalevents
+_SCANNED_RRULE = re.compile(
+    r"FREQ=(YEARLY|MONTHLY|WEEKLY|DAILY)"
+    r"(;(UNTIL=\d{8}|(?!UNTIL)[A-Z]+=[A-Z0-9,+-]+))*",
+    re.IGNORECASE,
+)
+
+
+_ESCAPES = {"n": "\n", "N": "\n", ",": ",", ";": ";", "\\": "\\"}
+_ESCAPE_REGEX = re.compile(r"\\(.)", re.DOTALL)
+
+
+def _unescape(text: str) -> str:
+    """Unescape an iCalendar TEXT value like icalendar does."""
+    if "\\" not in text:
+        return text
+    # one pass: an escaped backslash followed by n is not a newline
+    return _ESCAPE_REGEX.sub(lambda m: _ESCAPES.get(m.group(1), m.group(0)), text)
+
+
+def _parse_date(params: str, value: str) -> Union[datetime.date, None]:
+    """Parse a DATE or floating DATE-TIME value, None if it isn't one."""
+    if params not in ("", ";VALUE=DATE", ";VALUE=DATE-TIME"):
+        # e.g. TZID, which needs the timezone handling of icalevents
+        return None
+    try:
+        if len(value) == 8 and params != ";VALUE=DATE-TIME":
+            return datetime.date(int(value[:4]), int(value[4:6]), int(value[6:]))
+        if len(value) == 15 and value[8] == "T" and params != ";VALUE=DATE":
+            return datetime.datetime(
+                int(value[:4]),
+                int(value[4:6]),
+                int(value[6:8]),
+                int(value[9:11]),
+                int(value[11:13]),
+                int(value[13:]),
+            )
+    except ValueError:
+        pass
+    # e.g. UTC times, which are converted to the calendar's timezone
+    return None
+
+
+def _parse_exdate(params: str, value: str) -> Optional[List[datetime.date]]:
+    """Parse the dates of an EXDATE of an all-day event, None if it isn't one."""
+    dates = []
+    for v in value.split(","):
+        date = _parse_date(params, v)
+        if type(date) is not datetime.date:
+            return None
+        dates.append(date)
+    return dates
+
+
+def _occurrences(
+    rule: str, dtstart: datetime.date, first: datetime.date, last: datetime.date
+) -> Optional[List[datetime.date]]:
+    """Return the occurrences of an all-day event from first to last.
+
+    The rule is compiled once and expanded incrementally, shared by all
+    calendars with the same rule and start, see recurrence.
+    """
+    if not _SCANNED_RRULE.fullmatch(rule):
+        return None
+    try:
+        recurrence = get_recurrence(
+            ("RRULE", rule.upper(), dtstart),
+            lambda: rrulestr(
+                rule,
+                dtstart=datetime.datetime.combine(dtstart, datetime.time()),
+            ),
+        )
+        return recurrence.between(first, last)
+    except ValueError:
+        return None
+
+
+def _lines(text: str):
+    """Yield the unfolded content lines of text."""
+    line = None
+    for raw in text.split("\n"):
+        if raw[:1] in (" ", "\t") and line is not None:
+            line += raw[1:]
+            continue
+        if line:
+            yield line
+        line = raw
+    if line:
+        yield line
+
+
+def _decode(ics_data: IcsData) -> str:
+    """Decode a calendar body as utf-8, like requests' Response.text does.
+
+    Invalid bytes, e.g. a latin-1 umlaut, are replaced instead of failing
+    the whole calendar. Buffers are decoded without copying them to bytes.
+    """
+    if isinstance(ics_data, str):
+        return ics_data
+    return str(ics_data, "utf-8", errors="replace")
+
+
+def _scan(
+    ics_data: IcsData,
+    start_date: datetime.datetime,
+    end_date: datetime.datetime,
+) -> Optional[List[Tuple[datetime.date, str]]]:
+    """Return (start, summary) of the events within start_date and end_date.
+
+    Single pass over calendars of plain events with date or floating
+    date-time DTSTART's and of all-day events with simple RRULE's and
+    EXDATE's, which covers most waste collection calendars. The events are
+    selected like icalevents.events() does.
+
+    Returns None for everything else (other recurrences, modified
+    occurrences, timezones, anything unusual), which must be parsed by
+    icalevents instead.
+    """
+    text = _decode(ics_data).replace("\r", "")
+
+    first_date = start_date.date()
+    last_date = end_date.date()
+    found: List[Tuple[datetime.date, str]] = []
+    stack: List[str] = []
+    calendars = 0
+    event: dict = {}
+    exdates: set = set()
+
+    for line in _lines(text):
+        colon = line.find(":")
+        if colon < 0:
+            return None
+        head, value = line[:colon], line[colon + 1 :]
+        if '"' in head:
+            # quoted parameter values may contain colons
+            return None
+        semicolon = head.find(";")
+        if semicolon < 0:
+            name, params = head.upper(), ""
+        else:
+            name, params = head[:semicolon].upper(), head[semicolon:].upper()
+
+        if name == "BEGIN":
+            component = value.upper()
+            if component == "VCALENDAR":
+                calendars += 1
+                if stack or calendars > 1:
+                    return None
+            elif not stack:
+                return None
+            elif component == "VEVENT":
+                if stack != ["VCALENDAR"]:
+                    return None
+                event = {}
+                exdates = set()
+            stack.append(component)
+            continue
+
+        if name == "END":
+            if not stack or stack.pop() != value.upper():
+                return None
+            if value.upper() != "VEVENT":
+                continue
+
+            if "DTSTART" not in event:
+                return None
+            params, value = event["DTSTART"]
+            start = _parse_date(params, value)
+            if start is None:
+                return None
+            end = start
+            if "DTEND" in event:
+                end = _parse_date(*event["DTEND"])
+                if type(end) is not type(start):
+                    return None
+
+            summary = event.get("SUMMARY")
+            summary = str(None) if summary is None else _unescape(summary[1])
+
+            if "RRULE" in event:
+                params, rule = event["RRULE"]
+                if params or type(start) is not datetime.date:
+                    return None
+                dates = _occurrences(rule, start, first_date, last_date)
+                if dates is None:
+                    return None
+                found.extend((d, summary) for d in dates if d not in exdates)
+                continue
+
+            # non-recurring events overlapping the window, see icalevents
+            if type(start) is datetime.date:
+                selected = end >= first_date and start <= last_date
+            else:
+                selected = end >= start_date and start <= end_date
+            day = start if type(start) is datetime.date else start.date()
+            if selected and day not in exdates:
+                found.append((start, summary))
+            continue
+
+        if stack == ["VCALENDAR", "VEVENT"]:
+            if name in _FULL_ENGINE_PROPERTIES:
+                return None
+            if name == "EXDATE":
+                dates = _parse_exdate(params, value)
+                if dates is None:
+                    return None
+                exdates.update(dates)
+                continue
+            if name in _SCANNED_PROPERTIES:
+                if name in event:
+                    return None
+                event[name] = (params, value)
+        elif not stack:
+            return None
+
+    if stack or calendars != 1:
+        return None
+    return found
+
+
+# (start, summary) of an event, start is a date or datetime
+Event = Tuple[Any, str]
+
+# parse(ics_data, start_date, end_date) returns the events in the window
+Backend = Callable[[IcsData, datetime.datetime, datetime.datetime], List[Event]]
+
+
+def parse_icalevents(
+    ics_data: IcsData,
+    start_date: datetime.datetime,
+    end_date: datetime.datetime,
+) -> List[Event]:
+    """Return (start, summary) of the events parsed by icalevents."""
+    events: List[Any] = icalevents.events(
+        start=start_date, end=end_date, string_content=_decode(ics_data)
+    )
+    return [(e.start, str(e.summary)) for e in events]
+
+
+def parse_recurring_ical_events(
+    ics_data: IcsData,
+    start_date: datetime.datetime,
+    end_date: datetime.datetime,
+) -> List[Event]:
+    """Return (start, summary) of the events parsed by recurring_ical_events."""
+    calendar = icalendar.Calendar.from_ical(_decode(ics_data))
+    events = recurring_ical_events.of(calendar).between(start_date, end_date)
+    return [
+        (e.get("dtstart").dt, str(e.get("summary")))
+        for e in events
+        if e.name == "VEVENT"
+    ]
+
+
+def parse_native(
+    ics_data: IcsData,
+    start_date: datetime.datetime,
+    end_date: datetime.datetime,
+) -> List[Event]:
+    """Return (start, summary) of the events, see _scan().
+
+    Calendars the scanner can't handle are parsed by icalevents.
+    """
+    # decode only once for both parsers
+    text = _decode(ics_data)
+    events = _scan(text, start_date, end_date)
+    if events is None:
+        events = parse_icalevents(text, start_date, end_date)
+    return events
+
+
+_BACKENDS: Dict[str, Backend] = {}
+
+DEFAULT_BACKEND = "native"
+
+
+def register_backend(name: str, parse: Backend):
+    """Add or replace an ICS parser backend."""
+    _BACKENDS[name] = parse
+
+
+def get_backend(name: str) -> Backend:
+    try:
+        return _BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"unknown ICS backend: {name}") from None
+
+
+def backends() -> List[str]:
+    """Return names of all registered backends."""
+    return list(_BACKENDS)
+
+
+register_backend("native", parse_native)
+register_backend("icalevents", parse_icalevents)
+register_backend("recurring_ical_events", parse_recurring_ical_events)
+
 
 class ICS:
     def __init__(
@@ -14,10 +334,13 @@ class ICS:
         offset: Optional[int] = None,
         regex: Optional[str] = None,
         split_at: Optional[str] = None,
+        backend: str = DEFAULT_BACKEND,
     ):
         self._offset = offset
         self._regex = None
         self._split_at = None
+        self._backend = backend
+        self._parse = get_backend(backend)
 
         if regex is not None:
             self._regex = re.compile(regex)
@@ -25,7 +348,14 @@ class ICS:
         if split_at is not None:
             self._split_at = re.compile(split_at)
 
-    def convert(self, ics_data: str) -> List[Tuple[datetime.date, str]]:
+        # part of the key of cached results, see ics_cache
+        self._settings = (offset, regex, split_at)
+
+    @property
+    def backend(self) -> str:
+        return self._backend
+
+    def convert(self, ics_data: IcsData) -> List[Tuple[datetime.date, str]]:
         # calculate start- and end-date for recurring events
         start_date = datetime.datetime.now().replace(
             hour=0, minute=0, second=0, microsecond=0
@@ -34,21 +364,33 @@ class ICS:
             start_date -= datetime.timedelta(days=self._offset)
         end_date = start_date.replace(year=start_date.year + 1)
 
-        # parse ics data
-        events: List[Any] = icalevents.events(
-            start=start_date, end=end_date, string_content=ics_data.encode()
+        # identical calendars are only parsed once per day
+        cache = get_ics_cache()
+        key = cache.key(
+            f"ICS {self._backend}", ics_data, self._settings, start_date.date()
+        )
+        return cache.get_or_convert(
+            key, lambda: self._convert(ics_data, start_date, end_date)
         )
 
+    def _convert(
+        self,
+        ics_data: IcsData,
+        start_date: datetime.datetime,
+        end_date: datetime.datetime,
+    ) -> List[Tuple[datetime.date, str]]:
+        events = self._parse(ics_data, start_date, end_date)
+
         entries: List[Tuple[datetime.date, str]] = []
 
-        for e in events:
+        for start, summary in events:
             # calculate date
             dtstart: Optional[datetime.date] = None
 
-            if isinstance(e.start, datetime.datetime):
-                dtstart = e.start.date()
-            elif isinstance(e.start, datetime.date):
-                dtstart = e.start
+            if isinstance(start, datetime.datetime):
+                dtstart = start.date()
+            elif isinstance(start, datetime.date):
+                dtstart = start
 
             # Only continue if a start date can be found in the entry
             if dtstart is not None:
@@ -56,8 +398,6 @@ class ICS:
                     dtstart += datetime.timedelta(days=self._offset)
 
                 # calculate waste type
-                summary = str(e.summary)
-
                 if self._regex is not None:
                     if match := self._regex.match(summary):
                         summary = match.group(1)
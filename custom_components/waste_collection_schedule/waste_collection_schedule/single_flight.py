@@ -0,0 +1,121 @@
+import asyncio
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Any = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Share one in-flight call between concurrent callers with the same key.
+
+    The first caller for a key executes the function, all callers arriving
+    while it is still running wait for and share its result (or exception).
+    Results are not cached: a call arriving after completion runs again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        # (event loop, key) -> future of the in-flight call, see do_async()
+        self._async_calls: Dict[Tuple[asyncio.AbstractEventLoop, str], Any] = {}
+
+        # statistics
+        self._executed = 0
+        self._shared = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Return (result of fn, True if the result was shared)."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._shared += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+            if call.waiters > 0:
+                _LOGGER.debug(f"shared fetch for {key} with {call.waiters} waiters")
+
+        return call.result, False
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable]) -> Tuple[Any, bool]:
+        """Await fn() and return (result, shared), see do().
+
+        Calls are shared between the coroutines of one event loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            future = self._async_calls.get((loop, key))
+            if future is not None:
+                self._shared += 1
+                leader = False
+            else:
+                future = loop.create_future()
+                self._async_calls[(loop, key)] = future
+                self._executed += 1
+                leader = True
+
+        if not leader:
+            # a cancelled waiter must not cancel the call of the leader
+            return await asyncio.shield(future), True
+
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as error:
+            future.set_exception(error)
+            # don't log the exception if there are no waiters
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with self._lock:
+                del self._async_calls[(loop, key)]
+        return result, False
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "executed": self._executed,
+                "shared": self._shared,
+                "in_flight": len(self._calls) + len(self._async_calls),
+            }
+
+
+_single_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """Return the process wide single-flight group used by SourceShell."""
+    return _single_flight
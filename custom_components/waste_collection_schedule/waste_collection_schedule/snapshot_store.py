@@ -0,0 +1,180 @@
+import datetime
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from .collection import Collection
+
+_LOGGER = logging.getLogger(__name__)
+
+# (refreshtime, raw entries as returned by the source)
+Snapshot = Tuple[datetime.datetime, List[Collection]]
+
+
+def encode_entries(entries: List[Collection]) -> list:
+    """Encode entries into a compact JSON serializable list.
+
+    Every entry is stored as [date ordinal, type, icon, picture] with
+    trailing None's stripped.
+    """
+    rows = []
+    for e in entries:
+        row = [e.date.toordinal(), e.type, e.icon, e.picture]
+        while row[-1] is None:
+            row.pop()
+        rows.append(row)
+    return rows
+
+
+def decode_entries(rows: list) -> List[Collection]:
+    entries = []
+    for row in rows:
+        entries.append(
+            Collection(
+                datetime.date.fromordinal(row[0]),
+                row[1],
+                icon=row[2] if len(row) > 2 else None,
+                picture=row[3] if len(row) > 3 else None,
+            )
+        )
+    return entries
+
+
+class SnapshotStore:
+    """Persist the raw entries of SourceShell's, keyed by unique_id."""
+
+    def load(self, unique_id: str) -> Optional[Snapshot]:
+        raise NotImplementedError
+
+    def save(
+        self,
+        unique_id: str,
+        refreshtime: datetime.datetime,
+        entries: List[Collection],
+    ):
+        raise NotImplementedError
+
+    def flush(self):
+        """Write pending changes, if the store buffers them."""
+
+    def close(self):
+        self.flush()
+
+
+class FileSnapshotStore(SnapshotStore):
+    """Store all snapshots in one JSON file.
+
+    The file is read once on first access. Changes are buffered in memory
+    and written atomically by flush(). FetchExecutor.fetch_all() flushes
+    after every refresh cycle; callers fetching shells themselves must
+    call flush().
+    """
+
+    def __init__(self, filename: str):
+        self._filename = filename
+        self._lock = threading.Lock()
+        self._data: Optional[Dict[str, list]] = None
+        self._dirty = False
+
+    def _get_data(self) -> Dict[str, list]:
+        if self._data is None:
+            try:
+                with open(self._filename, encoding="utf-8") as f:
+                    self._data = json.load(f)
+            except FileNotFoundError:
+                self._data = {}
+            except ValueError:
+                _LOGGER.warning(f"ignoring corrupt snapshot file {self._filename}")
+                self._data = {}
+        return self._data
+
+    def load(self, unique_id: str) -> Optional[Snapshot]:
+        with self._lock:
+            item = self._get_data().get(unique_id)
+        if item is None:
+            return None
+        refreshtime, entries = item
+        return (datetime.datetime.fromtimestamp(refreshtime), decode_entries(entries))
+
+    def save(
+        self,
+        unique_id: str,
+        refreshtime: datetime.datetime,
+        entries: List[Collection],
+    ):
+        item = [refreshtime.timestamp(), encode_entries(entries)]
+        with self._lock:
+            self._get_data()[unique_id] = item
+            self._dirty = True
+
+    def flush(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(self._data, separators=(",", ":"), ensure_ascii=False)
+            self._dirty = False
+
+        # write to temporary file first to never leave a truncated file behind
+        dirname = os.path.dirname(os.path.abspath(self._filename))
+        fd, tmpname = tempfile.mkstemp(dir=dirname, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmpname, self._filename)
+        except Exception:
+            os.unlink(tmpname)
+            raise
+
+
+class SqliteSnapshotStore(SnapshotStore):
+    """Store snapshots in a SQLite database, one row per unique_id."""
+
+    def __init__(self, filename: str):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(filename, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots ("
+                "unique_id TEXT PRIMARY KEY, refreshtime REAL, entries TEXT)"
+            )
+
+    def load(self, unique_id: str) -> Optional[Snapshot]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT refreshtime, entries FROM snapshots WHERE unique_id = ?",
+                (unique_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return (
+            datetime.datetime.fromtimestamp(row[0]),
+            decode_entries(json.loads(row[1])),
+        )
+
+    def save(
+        self,
+        unique_id: str,
+        refreshtime: datetime.datetime,
+        entries: List[Collection],
+    ):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?)",
+                (
+                    unique_id,
+                    refreshtime.timestamp(),
+                    json.dumps(
+                        encode_entries(entries),
+                        separators=(",", ":"),
+                        ensure_ascii=False,
+                    ),
+                ),
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,9 +1,8 @@
 import datetime
 from urllib.parse import parse_qs, urlparse
 
-import requests
 from bs4 import BeautifulSoup
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "A-Region"
 DESCRIPTION = "Source for A-Region, Switzerland waste collection."
@@ -83,7 +82,7 @@ class Source:
         municipalities = {}
 
         # get PHPSESSID
-        session = requests.session()
+        session = http_client.session()
         r = session.get(f"{BASE_URL}")
         r.raise_for_status()
 
@@ -126,7 +125,7 @@ class Source:
                     municipalities[title.string.removeprefix("Abfallkalender ")] = href
 
     def get_waste_types(self, link):
-        r = requests.get(f"{BASE_URL}{link}")
+        r = http_client.get(f"{BASE_URL}{link}")
         r.raise_for_status()
 
         waste_types = {}
@@ -144,7 +143,7 @@ class Source:
         return waste_types
 
     def get_dates(self, link):
-        r = requests.get(f"{BASE_URL}{link}")
+        r = http_client.get(f"{BASE_URL}{link}")
         r.raise_for_status()
 
         soup = BeautifulSoup(r.text, features="html.parser")
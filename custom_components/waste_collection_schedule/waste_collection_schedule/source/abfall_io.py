@@ -3,8 +3,7 @@ import logging
 import re
 from html.parser import HTMLParser
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Abfall.IO / AbfallPlus"
@@ -106,18 +105,27 @@ class Source:
         self._abfallarten = f_abfallarten  # list of integers
         self._ics = ICS()
 
-    def fetch(self):
+    @staticmethod
+    def fetch_init_args(key):
+        """Return hidden input fields of the init form for key."""
         # get token
-        params = {"key": self._key, "modus": MODUS_KEY, "waction": "init"}
+        params = {"key": key, "modus": MODUS_KEY, "waction": "init"}
 
-        r = requests.post("https://api.abfall.io", params=params, headers=HEADERS)
+        r = http_client.post("https://api.abfall.io", params=params, headers=HEADERS)
+        # an error page has no token, don't use it for the following requests
+        r.raise_for_status()
 
         # add all hidden input fields to form data
         # There is one hidden field which acts as a token:
         # It consists of a UUID key and a UUID value.
         p = HiddenInputParser()
         p.feed(r.text)
-        args = p.args
+        return p.args
+
+    def fetch(self, init_args=None):
+        if init_args is None:
+            init_args = self.fetch_init_args(self._key)
+        args = dict(init_args)
 
         args["f_id_kommune"] = self._kommune
         args["f_id_strasse"] = self._strasse
@@ -141,7 +149,7 @@ class Source:
         params = {"key": self._key, "modus": MODUS_KEY, "waction": "export_ics"}
 
         # get csv file
-        r = requests.post(
+        r = http_client.post(
             "https://api.abfall.io", params=params, data=args, headers=HEADERS
         )
 
@@ -166,3 +174,12 @@ class Source:
         for d in dates:
             entries.append(Collection(d[0], d[1]))
         return entries
+
+    @classmethod
+    def prepare_many(cls, args_list):
+        """Request the init form once per key for many addresses."""
+        init_args = {}
+        for args in args_list:
+            if args["key"] not in init_args:
+                init_args[args["key"]] = cls.fetch_init_args(args["key"])
+        return [init_args[args["key"]] for args in args_list]
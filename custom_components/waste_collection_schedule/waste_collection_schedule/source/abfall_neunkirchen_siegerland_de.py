@@ -1,6 +1,5 @@
 import logging
-import requests
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Neunkirchen Siegerland"
@@ -21,7 +20,7 @@ class Source:
 
         args = {"out":"json", "type": "abto", "select":"2", "refid": "3362.1", "term": self._strasse }
         header = {"referer": "https://www.neunkirchen-siegerland.de"}
-        r = requests.get("https://www.neunkirchen-siegerland.de/output/autocomplete.php", params=args,headers=header)
+        r = http_client.get("https://www.neunkirchen-siegerland.de/output/autocomplete.php", params=args,headers=header)
 
         if r.status_code != 200:
             _LOGGER.error("Error querying calender data")
@@ -36,7 +35,7 @@ class Source:
             raise Exception (" to many addresses found, specify more detailed street name")
 
         args = {"ModID":48, "call": "ical", "pois": ids[0][0], "kat": 1, "alarm":0}
-        r = requests.get("https://www.neunkirchen-siegerland.de/output/options.php", params=args,headers=header)
+        r = http_client.get("https://www.neunkirchen-siegerland.de/output/options.php", params=args,headers=header)
 
         if r.status_code != 200:
             _LOGGER.error("Error querying calender data")
@@ -1,7 +1,6 @@
 from datetime import datetime
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Abfallwirtschaft Zollernalbkreis"
@@ -86,7 +85,7 @@ class Source:
         }
 
         # get ics file
-        r = requests.get("https://www.abfallkalender-zak.de", params=args)
+        r = http_client.get("https://www.abfallkalender-zak.de", params=args)
 
         # parse ics file
         dates = self._ics.convert(r.text)
@@ -34,10 +34,22 @@ class Source:
         self._strasse = strasse
         self._hausnummer = hausnummer
 
-    def fetch(self):
-        dates = self._api.get_dates(self._ort, self._strasse, self._hausnummer)
+    def fetch(self, waste_types=None):
+        dates = self._api.get_dates(
+            self._ort, self._strasse, self._hausnummer, waste_types
+        )
 
         entries = []
         for d in dates:
             entries.append(Collection(d[0], d[1]))
         return entries
+
+    @classmethod
+    def prepare_many(cls, args_list):
+        """Retrieve the waste types once per service for many addresses."""
+        waste_types = {}
+        for args in args_list:
+            service = args["service"]
+            if service not in waste_types:
+                waste_types[service] = AbfallnaviDe(service).get_waste_types()
+        return [waste_types[args["service"]] for args in args_list]
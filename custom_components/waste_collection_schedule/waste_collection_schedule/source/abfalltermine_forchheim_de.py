@@ -1,7 +1,6 @@
 import urllib
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Abfalltermine Forchheim"
@@ -25,11 +24,10 @@ class Source:
 
     def fetch(self):
         place = urllib.parse.quote(self._city + " - " + self._area)
-        r = requests.get(
+        r = http_client.get(
             f"http://www.abfalltermine-forchheim.de/Forchheim/Landkreis/{place}/ics?RESTMUELL=true&RESTMUELL_SINGLE=true&BIO=true&YELLOW_SACK=true&PAPER=true"
         )
-        r.encoding = "utf-8"
-        dates = self._ics.convert(r.text)
+        dates = self._ics.convert(r.content)
 
         entries = []
         for d in dates:
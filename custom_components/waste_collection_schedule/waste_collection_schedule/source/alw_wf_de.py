@@ -2,8 +2,7 @@ import datetime
 import json
 
 import pytz
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 # With verify=True the POST fails due to a SSLCertVerificationError.
 # Using verify=False works, but is not ideal. The following links may provide a better way of dealing with this:
@@ -50,7 +49,7 @@ class Source:
         auth_params = json.dumps(AUTH_DATA)
 
         # ALW WF uses a self-signed certificate so we need to disable certificate verification
-        r = requests.post(f"{API_URL}/GetOrte.php", data=auth_params, verify=False)
+        r = http_client.post(f"{API_URL}/GetOrte.php", data=auth_params, verify=False)
         orte = r.json()
         if orte["result"][0]["StatusCode"] != 200:
             raise Exception(f"Error getting Orte: {orte['result'][0]['StatusMsg']}")
@@ -62,7 +61,7 @@ class Source:
         if ort_id is None:
             raise Exception(f"Error finding Ort {self._ort}")
 
-        r = requests.post(f"{API_URL}/GetStrassen.php", data=auth_params, verify=False)
+        r = http_client.post(f"{API_URL}/GetStrassen.php", data=auth_params, verify=False)
         strassen = r.json()
         if strassen["result"][0]["StatusCode"] != 200:
             raise Exception(
@@ -82,7 +81,7 @@ class Source:
         if strasse_id is None:
             raise Exception(f"Error finding Straße {self._strasse}")
 
-        r = requests.post(f"{API_URL}/GetArten.php", data=auth_params, verify=False)
+        r = http_client.post(f"{API_URL}/GetArten.php", data=auth_params, verify=False)
         arten = r.json()
         if arten["result"][0]["StatusCode"] != 200:
             raise Exception(f"Error getting Arten: {arten['result'][0]['StatusMsg']}")
@@ -92,7 +91,7 @@ class Source:
         arten = {int(i["Wertigkeit"]): i["Name"] for i in arten}
 
         entries = []
-        r = requests.post(
+        r = http_client.post(
             f"{API_URL}/GetTermine.php/{strasse_id}", data=auth_params, verify=False
         )
         termine = r.json()
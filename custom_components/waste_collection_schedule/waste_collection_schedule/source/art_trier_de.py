@@ -3,8 +3,7 @@ from datetime import datetime
 from typing import Optional
 from urllib.parse import quote
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "ART Trier"
@@ -69,7 +68,7 @@ class Source:
     def fetch(self):
         url = f"{API_URL}/{self._zip_code}_{self._district}_{REMINDER_DAY}-{REMINDER_TIME}.ics"
 
-        res = requests.get(url)
+        res = http_client.get(url)
         res.raise_for_status()
 
         schedule = self._ics.convert(res.text)
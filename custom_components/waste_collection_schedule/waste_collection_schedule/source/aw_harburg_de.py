@@ -1,6 +1,5 @@
-import requests
 from bs4 import BeautifulSoup
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_cache, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Abfallwirtschaft Landkreis Harburg"
@@ -29,7 +28,7 @@ class Source:
 
     def fetch(self):
         # Use a session to keep cookies and stuff
-        session = requests.Session()
+        session = http_client.session()
 
         # Get the IDs of the districts on the first level
         # Double loading is on purpose because sometimes the webpage has an overlay
@@ -101,19 +100,17 @@ class Source:
         # Get the final data for all links
         entries = []
         for ical_url in ical_urls:
-            r = requests.get(ical_url, headers=HEADERS)
-            r.raise_for_status()
-
-            # Parse ics file
+            # Get and parse ics file, unchanged files are not parsed again
             try:
-                dates = self._ics.convert(r.text)
-
-                for d in dates:
-                    entries.append(Collection(d[0], d[1]))
+                entries.extend(http_cache.get(ical_url, self._convert_ical, headers=HEADERS))
             except ValueError:
                 pass    # during year transition the ical for the next year may be empty
         return entries
 
+    def _convert_ical(self, r):
+        dates = self._ics.convert(r.text)
+        return [Collection(d[0], d[1]) for d in dates]
+
     def parse_level(self, response, level):
         soup = BeautifulSoup(response, features="html.parser")
         select_content = soup.find_all("select", id=f"strukturEbene{level}")
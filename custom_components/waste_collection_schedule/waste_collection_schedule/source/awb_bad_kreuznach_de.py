@@ -1,8 +1,7 @@
 import datetime
 import json
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "AWB Bad Kreuznach"
 DESCRIPTION = "Source for AWB Bad Kreuznach."
@@ -28,7 +27,7 @@ class Source:
         }
 
         # get latitude/longitude file
-        r = requests.post(
+        r = http_client.post(
             "https://app.awb-bad-kreuznach.de/api/checkAddress.php", data=args
         )
         data = json.loads(r.text)
@@ -38,7 +37,7 @@ class Source:
         args["mode"] = "web"
         args["lat"] = data["lat"]
         args["lon"] = data["lon"]
-        r = requests.post(
+        r = http_client.post(
             "https://app.awb-bad-kreuznach.de/api/loadDates.php", data=args
         )
         data = json.loads(r.text)
@@ -1,6 +1,5 @@
-import requests
 from bs4 import BeautifulSoup
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Abfallwirtschaftsbetrieb Esslingen"
@@ -22,7 +21,7 @@ class Source:
         self._ics = ICS()
 
     def fetch(self):
-        session = requests.Session()
+        session = http_client.session()
 
         params = {
             "city": self._city,
@@ -1,7 +1,6 @@
 import urllib
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "AWB Oldenburg"
@@ -41,7 +40,7 @@ class Source:
         args = urllib.parse.urlencode(args, quote_via=urllib.parse.quote)
 
         # post request
-        r = requests.get(API_URL, params=args)
+        r = http_client.get(API_URL, params=args)
 
         dates = self._ics.convert(r.text)
 
@@ -1,8 +1,7 @@
 import datetime
 import json
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "AWB Köln"
 DESCRIPTION = "Source for Abfallwirtschaftsbetriebe Köln waste collection."
@@ -28,7 +27,7 @@ class Source:
         args["end_month"] = now.month
 
         # get json file
-        r = requests.get("https://www.awbkoeln.de/api/calendar", params=args)
+        r = http_client.get("https://www.awbkoeln.de/api/calendar", params=args)
 
         data = json.loads(r.text)
 
@@ -2,8 +2,8 @@ import datetime
 import json
 import logging
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
+from waste_collection_schedule.exceptions import SourceArgumentNotFound
 
 TITLE = "AWIDO Online"
 DESCRIPTION = "Source for AWIDO waste collection."
@@ -41,7 +41,7 @@ class Source:
 
     def fetch(self):
         # Retrieve list of places
-        r = requests.get(
+        r = http_client.get(
             f"https://awido.cubefour.de/WebServices/Awido.Service.svc/secure/getPlaces/client={self._customer}"
         )
         places = json.loads(r.text)
@@ -50,15 +50,14 @@ class Source:
         city_to_oid = {place["value"].strip(): place["key"] for (place) in places}
 
         if self._city not in city_to_oid:
-            _LOGGER.error(f"city not found: {self._city}")
-            return []
+            raise SourceArgumentNotFound("city", self._city)
 
         oid = city_to_oid[self._city]
 
         if self._street is None:
             # test if we have to use city also as street name
             self._street = self._city
-            r = requests.get(
+            r = http_client.get(
                 f"https://awido.cubefour.de/WebServices/Awido.Service.svc/secure/getGroupedStreets/{oid}",
                 params={"client": self._customer},
             )
@@ -74,7 +73,7 @@ class Source:
 
         else:
             # street specified
-            r = requests.get(
+            r = http_client.get(
                 f"https://awido.cubefour.de/WebServices/Awido.Service.svc/secure/getGroupedStreets/{oid}",
                 params={"client": self._customer},
             )
@@ -86,13 +85,12 @@ class Source:
             }
 
             if self._street not in street_to_oid:
-                _LOGGER.error(f"street not found: {self._street}")
-                return []
+                raise SourceArgumentNotFound("street", self._street)
 
             oid = street_to_oid[self._street]
 
             if self._housenumber is not None:
-                r = requests.get(
+                r = http_client.get(
                     f"https://awido.cubefour.de/WebServices/Awido.Service.svc/secure/getStreetAddons/{oid}",
                     params={"client": self._customer},
                 )
@@ -104,13 +102,12 @@ class Source:
                 }
 
                 if self._housenumber not in hsnbr_to_oid:
-                    _LOGGER.error(f"housenumber not found: {self._housenumber}")
-                    return []
+                    raise SourceArgumentNotFound("housenumber", self._housenumber)
 
                 oid = hsnbr_to_oid[self._housenumber]
 
         # get calendar data
-        r = requests.get(
+        r = http_client.get(
             f"https://awido.cubefour.de/WebServices/Awido.Service.svc/secure/getData/{oid}",
             params={"fractions": "", "client": self._customer},
         )
@@ -1,8 +1,7 @@
 from html.parser import HTMLParser
 
-import requests
 
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Abfallwirtschaft Neckar-Odenwald-Kreis"
@@ -59,7 +58,7 @@ class Source:
         self._ics = ICS()
 
     def fetch(self):
-        session = requests.session()
+        session = http_client.session()
 
         r = session.get(
             SERVLET,
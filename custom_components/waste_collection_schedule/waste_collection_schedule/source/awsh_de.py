@@ -1,8 +1,7 @@
 import json
 import logging
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Abfallwirtschaft Südholstein"
@@ -23,7 +22,7 @@ class Source:
 
     def fetch(self):
         # retrieve list of cities
-        r = requests.get("https://www.awsh.de/api_v2/collection_dates/1/orte")
+        r = http_client.get("https://www.awsh.de/api_v2/collection_dates/1/orte")
         cities = json.loads(r.text)
 
         # create city to id map from retrieved cities
@@ -38,7 +37,7 @@ class Source:
         cityId = city_to_id[self._city]
 
         # retrieve list of streets
-        r = requests.get(
+        r = http_client.get(
             f"https://www.awsh.de/api_v2/collection_dates/1/ort/{cityId}/strassen"
         )
         streets = json.loads(r.text)
@@ -56,14 +55,14 @@ class Source:
         streetId = street_to_id[self._street]
 
         # retrieve list of waste types
-        r = requests.get(
+        r = http_client.get(
             f"https://www.awsh.de/api_v2/collection_dates/1/ort/{cityId}/abfallarten"
         )
         waste_types = json.loads(r.text)
         wt = "-".join([t["id"] for t in waste_types["abfallarten"]])
 
         # get ics file
-        r = requests.get(
+        r = http_client.get(
             f"https://www.awsh.de/api_v2/collection_dates/1/ort/{cityId}/strasse/{streetId}/hausnummern/0/abfallarten/{wt}/kalender.ics"
         )
 
@@ -3,9 +3,8 @@ import re
 import typing
 from datetime import datetime
 
-import requests
 from bs4 import BeautifulSoup
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 
 TITLE = 'Banyule City Council'
@@ -54,7 +53,7 @@ class Source:
     def geolocation_id(self) -> str:
         if self._geolocation_id is None:
             # Search for geolocation ID
-            geolocation_response = requests.get(
+            geolocation_response = http_client.get(
                 self.OC_GEOLOCATION_SEARCH_URL,
                 params={
                     'keywords': self._street_address,
@@ -87,7 +86,7 @@ class Source:
 
     def fetch(self) -> typing.List[Collection]:
         # Calendar lookup cares about a cookie, so a Session must be used
-        calendar_session = requests.Session()
+        calendar_session = http_client.session()
 
         calendar_request = calendar_session.get(self.OC_SESSION_URL)
         calendar_request.raise_for_status()
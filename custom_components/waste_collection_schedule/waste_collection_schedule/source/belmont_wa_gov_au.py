@@ -1,7 +1,6 @@
 import datetime
 
-import requests
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "Belmont City Council"
 DESCRIPTION = "Source for Belmont City Council rubbish collection."
@@ -19,7 +18,7 @@ class Source:
 
     def fetch(self):
         params = {"key": self._address}
-        r = requests.get(
+        r = http_client.get(
             "https://www.belmont.wa.gov.au/api/intramaps/getaddresses", params=params
         )
         r.raise_for_status()
@@ -32,7 +31,7 @@ class Source:
             raise Exception("multiple addresses found")
 
         params = {"mapkey": j[0]["mapkey"], "dbkey": j[0]["dbkey"]}
-        r = requests.get(
+        r = http_client.get(
             "https://www.belmont.wa.gov.au/api/intramaps/getpropertydetailswithlocalgov",
             params=params,
         )
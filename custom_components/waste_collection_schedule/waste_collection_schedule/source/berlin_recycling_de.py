@@ -2,8 +2,7 @@ import json
 from datetime import datetime
 from html.parser import HTMLParser
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 # With verify=True the POST fails due to a SSLCertVerificationError.
 # Using verify=False works, but is not ideal. The following links may provide a better way of dealing with this:
@@ -50,7 +49,7 @@ class Source:
         self._password = password
 
     def fetch(self):
-        session = requests.session()
+        session = http_client.session()
 
         # first get returns session specific url
         r = session.get(SERVICE_URL, allow_redirects=False, verify=False)
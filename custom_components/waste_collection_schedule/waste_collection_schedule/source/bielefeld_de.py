@@ -1,8 +1,7 @@
 from html.parser import HTMLParser
 
-import requests
 
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 from waste_collection_schedule.service.SSLError import get_legacy_session
 
@@ -47,7 +46,7 @@ class Source:
 
     def fetch(self):
         s = get_legacy_session()
-        # session = requests.session()
+        # session = http_client.session()
 
         r = s.get(
             SERVLET,
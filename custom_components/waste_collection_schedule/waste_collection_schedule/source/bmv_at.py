@@ -1,8 +1,7 @@
 import logging
 from html.parser import HTMLParser
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Burgenländischer Müllverband"
@@ -50,7 +49,7 @@ class Source:
         self._ics = ICS()
 
     def fetch(self):
-        session = requests.session()
+        session = http_client.session()
 
         r = session.get(
             "https://webudb.udb.at/WasteManagementUDB/WasteManagementServlet?SubmitAction=wasteDisposalServices&InFrameMode=TRUE"
@@ -1,8 +1,7 @@
 import json
 
-import requests
 from dateutil import parser
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "Bracknell Forest Council"
 DESCRIPTION = "Bracknell Forest Council, UK - Waste Collection"
@@ -42,7 +41,7 @@ class Source:
         self.house_number = house_number
 
     def fetch(self):
-        address_lookup = requests.post(
+        address_lookup = http_client.post(
             self.url,
             params=self.params,
             headers=self.headers,
@@ -56,7 +55,7 @@ class Source:
         addresses = address_lookup.json()["response"]["addresses"]["items"]
         id = next(address for address in addresses if address["Description"].startswith(f"{self.house_number} "))["Id"]
 
-        collection_lookup = requests.post(
+        collection_lookup = http_client.post(
             self.url,
             params=self.params,
             headers=self.headers,
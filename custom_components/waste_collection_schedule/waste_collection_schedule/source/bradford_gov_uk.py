@@ -1,15 +1,14 @@
 import json
 from datetime import datetime
 
-import requests
 from waste_collection_schedule import Collection  # type: ignore[attr-defined]
 
+# Include work around for SSL UNSAFE_LEGACY_RENEGOTIATION_DISABLED error
+from waste_collection_schedule.service.SSLError import get_legacy_session
+
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse
 import logging
-import http.client as http_client
-import ssl
-import urllib3
 
 TITLE = "Bradford Metropolitan District Council"
 DESCRIPTION = (
@@ -31,18 +30,6 @@ ICON_MAP = {
 
 from pprint import pprint
 
-class CustomHttpAdapter (requests.adapters.HTTPAdapter):
-    '''Transport adapter" that allows us to use custom ssl_context.'''
-
-    def __init__(self, ssl_context=None, **kwargs):
-        self.ssl_context = ssl_context
-        super().__init__(**kwargs)
-
-    def init_poolmanager(self, connections, maxsize, block=False):
-        self.poolmanager = urllib3.poolmanager.PoolManager(
-            num_pools=connections, maxsize=maxsize,
-            block=block, ssl_context=self.ssl_context)
-
 class Source:
     def __init__(self, uprn: str):
         self._uprn = uprn
@@ -50,12 +37,9 @@ class Source:
     def fetch(self):
         entries = []
 
-        s = requests.Session()
         # In openssl3 some context is needed to access this host
         # or an UNSAFE_LEGACY_RENEGOTIATION_DISABLED error will occur
-        ctx = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-        ctx.options |= 0x4
-        s.mount("https://", CustomHttpAdapter(ctx))
+        s = get_legacy_session()
 
         s.cookies.set(
             "COLLECTIONDATES", self._uprn, domain="onlineforms.bradford.gov.uk"
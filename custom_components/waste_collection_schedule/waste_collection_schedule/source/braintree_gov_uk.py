@@ -1,7 +1,6 @@
-import requests
 from bs4 import BeautifulSoup
 from dateutil import parser
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "Braintree District Council"
 DESCRIPTION = "Braintree District Council, UK - Waste Collection"
@@ -32,7 +31,7 @@ class Source:
         }
 
     def fetch(self):
-        address_lookup = requests.post("https://www.braintree.gov.uk/xfp/form/554", files=self.form_data)
+        address_lookup = http_client.post("https://www.braintree.gov.uk/xfp/form/554", files=self.form_data)
         address_lookup.raise_for_status()
         addresses = {}
         for address in BeautifulSoup(address_lookup.text, "html.parser").find_all('option'):
@@ -41,7 +40,7 @@ class Source:
         id = next(address for address in addresses if addresses[address].startswith(self.house_number))
         self.form_data["qe15dda0155d237d1ea161004d1839e3369ed4831_1_0"] = (None, id)
         self.form_data["next"] = (None, "Next")
-        collection_lookup = requests.post("https://www.braintree.gov.uk/xfp/form/554", files=self.form_data)
+        collection_lookup = http_client.post("https://www.braintree.gov.uk/xfp/form/554", files=self.form_data)
         collection_lookup.raise_for_status()
         entries = []
         for results in BeautifulSoup(collection_lookup.text, "html.parser").find_all('div', class_="date_display"):
@@ -1,8 +1,7 @@
 import json
 from datetime import date, timedelta
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Brisbane City Council"
 DESCRIPTION = "Source for Brisbane City Council rubbish collection."
@@ -43,7 +42,7 @@ class Source:
         nextmonth = today + timedelta(30)
 
         # Retrieve suburbs
-        r = requests.get(
+        r = http_client.get(
             "https://brisbane.waste-info.com.au/api/v1/localities.json", headers=HEADERS
         )
         data = json.loads(r.text)
@@ -58,7 +57,7 @@ class Source:
             return []
 
         # Retrieve the streets in our suburb
-        r = requests.get(
+        r = http_client.get(
             f"https://brisbane.waste-info.com.au/api/v1/streets.json?locality={suburb_id}",
             headers=HEADERS,
         )
@@ -74,7 +73,7 @@ class Source:
             return []
 
         # Retrieve the properties in our street
-        r = requests.get(
+        r = http_client.get(
             f"https://brisbane.waste-info.com.au/api/v1/properties.json?street={street_id}",
             headers=HEADERS,
         )
@@ -90,7 +89,7 @@ class Source:
             return []
 
         # Retrieve the upcoming collections for our property
-        r = requests.get(
+        r = http_client.get(
             f"https://brisbane.waste-info.com.au/api/v1/properties/{property_id}.json?start={today}&end={nextmonth}",
             headers=HEADERS,
         )
@@ -1,7 +1,6 @@
 import urllib.parse
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Berliner Stadtreinigungsbetriebe"
@@ -32,7 +31,7 @@ class Source:
 
     def fetch(self):
         # get cookie
-        r = requests.get("https://www.bsr.de/abfuhrkalender-20520.php")
+        r = http_client.get("https://www.bsr.de/abfuhrkalender-20520.php")
         cookies = r.cookies
 
         # get street name only (without PLZ)
@@ -40,13 +39,13 @@ class Source:
 
         # start search using string name (without PLZ)
         args = {"script": "dynamic_search", "step": 1, "q": street}
-        r = requests.get(
+        r = http_client.get(
             "https://www.bsr.de/abfuhrkalender_ajax.php", params=args, cookies=cookies
         )
 
         # retrieve house number list
         args = {"script": "dynamic_search", "step": 2, "q": self._abf_strasse}
-        r = requests.get(
+        r = http_client.get(
             "https://www.bsr.de/abfuhrkalender_ajax.php", params=args, cookies=cookies
         )
 
@@ -63,7 +62,7 @@ class Source:
             # "abf_datepicker": "28.04.2020",
             # "listitems":7,
         }
-        r = requests.post(
+        r = http_client.post(
             "https://www.bsr.de/abfuhrkalender_ajax.php?script=dynamic_kalender_ajax",
             data=args,
             cookies=cookies,
@@ -86,7 +85,7 @@ class Source:
         # create url using private url encoding
         encoded = map(lambda key: f"{key}={myquote(str(args[key]))}", args.keys())
         url = "https://www.bsr.de/abfuhrkalender_ajax.php?" + "&".join(encoded)
-        r = requests.get(url, cookies=cookies)
+        r = http_client.get(url, cookies=cookies)
 
         # parse ics file
         dates = self._ics.convert(r.text)
@@ -3,7 +3,8 @@ from datetime import datetime
 from typing import List, Literal, Optional, TypedDict, Union
 
 import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
+from waste_collection_schedule.exceptions import SourceArgumentNotFound
 
 TITLE = "Bürgerportal"
 URL = "https://www.c-trace.de"
@@ -102,7 +103,7 @@ class Source:
         self.number = number
 
     def fetch(self):
-        session = requests.session()
+        session = http_client.session()
         session.headers.update(API_HEADERS)
 
         year = datetime.now().year
@@ -171,9 +172,11 @@ class Source:
                 and entry["Ortsteilname"] == self.subdistrict
             )
         except StopIteration:
-            raise ValueError(
+            raise SourceArgumentNotFound(
+                "district",
+                self.district,
                 "District id cannot be fetched. "
-                "Please make sure that you entered a subdistrict if there is a comma on the website."
+                "Please make sure that you entered a subdistrict if there is a comma on the website.",
             )
 
     def fetch_street_id(self, session: requests.Session, district_id: int):
@@ -195,8 +198,10 @@ class Source:
                 if entry["Name"] == self.street
             )
         except StopIteration:
-            raise ValueError(
-                "Street ID cannot be fetched. Please verify your configuration."
+            raise SourceArgumentNotFound(
+                "street",
+                self.street,
+                "Street ID cannot be fetched. Please verify your configuration.",
             )
 
 
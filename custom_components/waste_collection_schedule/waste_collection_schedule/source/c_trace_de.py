@@ -1,5 +1,4 @@
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "C-Trace"
@@ -36,7 +35,7 @@ class Source:
         self._ics = ICS(regex=r"Abfuhr: (.*)")
 
     def fetch(self):
-        session = requests.session()
+        session = http_client.session()
 
         # get session url
         r = session.get(
@@ -60,8 +59,7 @@ class Source:
         r.raise_for_status()
 
         # parse ics file
-        r.encoding = "utf-8"
-        dates = self._ics.convert(r.text)
+        dates = self._ics.convert(r.content)
 
         entries = []
         for d in dates:
@@ -1,10 +1,9 @@
 import datetime
 import json
 
-import requests
 from bs4 import BeautifulSoup
 from requests.utils import requote_uri
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "Campbelltown City Council"
 DESCRIPTION = "Source for Campbelltown City Council rubbish collection."
@@ -63,7 +62,7 @@ class Source:
         q = requote_uri(str(API_URLS["address_search"]).format(address))
 
         # Retrieve suburbs
-        r = requests.get(q, headers=HEADERS)
+        r = http_client.get(q, headers=HEADERS)
 
         data = json.loads(r.text)
 
@@ -78,7 +77,7 @@ class Source:
         # Retrieve the upcoming collections for our property
         q = requote_uri(str(API_URLS["collection"]).format(locationId))
 
-        r = requests.get(q, headers=HEADERS)
+        r = http_client.get(q, headers=HEADERS)
 
         data = json.loads(r.text)
 
@@ -1,8 +1,7 @@
 import json
 from datetime import date, timedelta
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "City of Canada Bay Council"
 DESCRIPTION = "Source for City of Canada Bay Council rubbish collection."
@@ -43,7 +42,7 @@ class Source:
         nextmonth = today + timedelta(days=365)
 
         # Retrieve suburbs
-        r = requests.get(
+        r = http_client.get(
             f"{API_URL}/localities.json",
             headers=HEADERS,
         )
@@ -59,7 +58,7 @@ class Source:
             return []
 
         # Retrieve the streets in our suburb
-        r = requests.get(
+        r = http_client.get(
             f"{API_URL}/streets.json",
             params={"locality": suburb_id},
             headers=HEADERS,
@@ -76,7 +75,7 @@ class Source:
             return []
 
         # Retrieve the properties in our street
-        r = requests.get(
+        r = http_client.get(
             f"{API_URL}/properties.json",
             params={"street": street_id},
             headers=HEADERS,
@@ -93,7 +92,7 @@ class Source:
             return []
 
         # Retrieve the upcoming collections for our property
-        r = requests.get(
+        r = http_client.get(
             f"{API_URL}/properties/{property_id}.json",
             params={
                 "start": today,
@@ -2,8 +2,7 @@ import logging
 from datetime import datetime
 import json
 
-import requests
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "Canterbury City Council"
 DESCRIPTION = (
@@ -37,7 +36,7 @@ class Source:
 
     def fetch(self):
         # fetch location id
-        r = requests.get(
+        r = http_client.get(
             API_URLS["address_search"], params={
                 "postcode": self._post_code, "type": "standard"}
         )
@@ -54,7 +53,7 @@ class Source:
                 f"Could not find address {self._post_code} {self._number}")
 
         q = str(API_URLS["collection"])
-        r = requests.post(q, json={
+        r = http_client.post(q, json={
                           "uprn": address_ids[0]["LPI"]["UPRN"], "usrn": address_ids[0]["LPI"]["USRN"]})
         r.raise_for_status()
 
@@ -1,8 +1,7 @@
 from datetime import datetime
 
-import requests
 from bs4 import BeautifulSoup
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "Cheshire East Council"
 DESCRIPTION = "Source for cheshireeast.gov.uk services for Cheshire East"
@@ -26,7 +25,7 @@ class Source:
         self._name_number = name_number
 
     def fetch(self):
-        session = requests.Session()
+        session = http_client.session()
 
         if self._postcode and self._name_number:
             # Lookup postcode and number to get UPRN
@@ -1,9 +1,8 @@
 import json
 import logging
-import requests
 
 from datetime import datetime
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 # With verify=True the POST fails due to a SSLCertVerificationError.
 # Using verify=False works, but is not ideal. The following links may provide a better way of dealing with this:
@@ -51,7 +50,7 @@ class Source:
 
     def fetch(self):
 
-        s = requests.Session()
+        s = http_client.session()
         r = s.get(
             API_URLS["session"],
             headers=HEADERS,
@@ -1,8 +1,7 @@
 import json
 from datetime import datetime, timedelta
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Colchester Borough Council"
 DESCRIPTION = "Source for Colchester.gov.uk services for the borough of Colchester, UK."
@@ -31,7 +30,7 @@ class Source:
 
     def fetch(self):
         # get json file
-        r = requests.get(
+        r = http_client.get(
             f"https://new-llpg-app.azurewebsites.net/api/calendar/{self._llpgid}"
         )
 
@@ -1,8 +1,7 @@
 from datetime import date, datetime
 
-import requests
 from bs4 import BeautifulSoup
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "Cornwall Council"
 DESCRIPTION = "Source for cornwall.gov.uk services for Cornwall Council"
@@ -29,7 +28,7 @@ class Source:
 
     def fetch(self):
         entries = []
-        session = requests.Session()
+        session = http_client.session()
 
         # Find the UPRN based on the postcode and the property name/number
         if self._uprn is None:
@@ -1,8 +1,7 @@
 import logging
-import requests
 from datetime import datetime
 from xml.dom.minidom import parseString
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Umweltprofis"
@@ -37,7 +36,7 @@ class Source:
             return self.fetch_xml()
 
     def fetch_ics(self):
-        r = requests.get(self._url)
+        r = http_client.get(self._url)
         if r.status_code != 200:
             _LOGGER.error("Error querying calendar data")
             return []
@@ -52,7 +51,7 @@ class Source:
         return entries
 
     def fetch_xml(self):
-        r = requests.get(self._xmlurl)
+        r = http_client.get(self._xmlurl)
         r.raise_for_status()
 
         doc = parseString(r.text)
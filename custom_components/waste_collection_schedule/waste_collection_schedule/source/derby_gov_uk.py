@@ -2,9 +2,8 @@ import logging
 from datetime import datetime
 from urllib.parse import parse_qs, urlsplit
 
-import requests
 from bs4 import BeautifulSoup
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Derby City Council"
 DESCRIPTION = "Source for Derby.gov.uk services for Derby City Council, UK."
@@ -40,13 +39,13 @@ class Source:
             _LOGGER.error(
                 "premises_id or post_code and house number must be provided in config"
             )
-        self._session = requests.Session()
+        self._session = http_client.session()
 
     def fetch(self):
         entries = []
 
         if self._premises_id is not None:
-            r = requests.get(
+            r = http_client.get(
                 "https://secure.derby.gov.uk/binday/Binday",
                 params={
                     "PremisesId": self._premises_id,
@@ -55,7 +54,7 @@ class Source:
         else:
             # Property search endpoint redirects you to the page, so by caching
             # The premises_id in future, we save an extra request every check.
-            r = requests.get(
+            r = http_client.get(
                 "https://secure.derby.gov.uk/binday/StreetSearch",
                 params={
                     "StreetNamePostcode": self._post_code,
@@ -1,9 +1,8 @@
 import datetime
 import logging
 
-import requests
 from bs4 import BeautifulSoup
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "EGN Abfallkalender"
 DESCRIPTION = "Source for EGN Abfallkalender"
@@ -48,7 +47,7 @@ class Source:
         self._housenumber = housenumber
 
     def fetch(self):
-        s = requests.session()
+        s = http_client.session()
         r = s.get(API_URL)
 
         soup = BeautifulSoup(r.text, features="html.parser")
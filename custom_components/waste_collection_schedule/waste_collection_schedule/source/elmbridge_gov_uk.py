@@ -1,9 +1,8 @@
 import logging
 from datetime import datetime, timedelta
 
-import requests
 from bs4 import BeautifulSoup
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "Elmbridge Borough Council"
 DESCRIPTION = "Source for waste collection services for Elmbridge Borough Council"
@@ -67,7 +66,7 @@ class Source:
         today = today.replace(hour=0, minute=0, second=0, microsecond=0)
         year = today.year
 
-        s = requests.Session()
+        s = http_client.session()
 
         r0 = s.get(API_URLS["session"], headers=HEADERS)
         r0.raise_for_status()
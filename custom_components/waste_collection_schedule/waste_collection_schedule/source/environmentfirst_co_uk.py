@@ -1,9 +1,8 @@
 import logging
-import requests
 
 from bs4 import BeautifulSoup
 from dateutil.parser import parse
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "Environment First"
 URL = "https://environmentfirst.co.uk"
@@ -48,7 +47,7 @@ class Source:
 
     def fetch(self):
 
-        s = requests.Session()
+        s = http_client.session()
 
         if self._uprn:
             # GET request returns schedule for matching uprn
@@ -1,7 +1,6 @@
 import datetime
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Landkreis Erlangen-Höchstadt"
@@ -36,10 +35,9 @@ class Source:
         street = self._street
 
         payload = {"ort": city, "strasse": street, "abfallart": "Alle", "jahr": year}
-        r = requests.get(
+        r = http_client.get(
             "https://www.erlangen-hoechstadt.de/komx/surface/dfxabfallics/GetAbfallIcs",
             params=payload,
         )
         r.raise_for_status()
-        r.encoding = "utf-8"
-        return self._ics.convert(r.text)
+        return self._ics.convert(r.content)
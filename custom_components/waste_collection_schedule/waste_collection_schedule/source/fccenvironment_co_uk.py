@@ -1,9 +1,8 @@
 from urllib.parse import urlparse
 
-import requests
 from bs4 import BeautifulSoup
 from dateutil import parser
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "FCC Environment"
 DESCRIPTION = """
@@ -54,7 +53,7 @@ class Source:
 
     def getcollectiondetails(self, endpoint: str) -> list[Collection]:
         domain = urlparse(endpoint).netloc
-        session = requests.Session()
+        session = http_client.session()
         cookies = session.get(f"https://{domain}/")
         response = session.post(
             endpoint,
@@ -103,7 +102,7 @@ class Source:
             "RECYCLING COLLECTION": "mdi:recycle",
             "GARDEN WASTE COLLECTION": "mdi:leaf",
         }  # Custom icons to avoid a breaking change
-        r = requests.post("https://www.fccenvironment.co.uk/harborough/detail-address", data={"Uprn": self.uprn})
+        r = http_client.post("https://www.fccenvironment.co.uk/harborough/detail-address", data={"Uprn": self.uprn})
         soup = BeautifulSoup(r.text, "html.parser")
         services = soup.find("div", attrs={"class": "blocks block-your-next-scheduled-bin-collection-days"}).find_all(
             "li"
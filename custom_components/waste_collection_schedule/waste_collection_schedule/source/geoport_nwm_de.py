@@ -1,8 +1,7 @@
 import datetime
 import urllib
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Landkreis Nordwestmecklenburg"
@@ -45,7 +44,7 @@ class Source:
 
     def fetch_year(self, year):
         arg = convert_to_arg(self._district)
-        r = requests.get(
+        r = http_client.get(
             f"https://www.geoport-nwm.de/nwm-download/Abfuhrtermine/ICS/{year}/{arg}.ics"
         )
         r.raise_for_status()
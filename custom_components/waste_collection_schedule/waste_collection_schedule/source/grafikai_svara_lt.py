@@ -1,8 +1,7 @@
 import json
 from datetime import datetime
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Kauno švara"
 DESCRIPTION = 'Source for UAB "Kauno švara".'
@@ -55,7 +54,7 @@ class Source:
             "subDistrict": self._district,
             "matchHouseNumber": "true",
         }
-        r = requests.get(
+        r = http_client.get(
             self.API_URL + "contracts",
             params=address_query,
         )
@@ -72,7 +71,7 @@ class Source:
                 if self.check_if_waste_object_defined(collection["wasteObjectId"]):
                     waste_object_query = {"wasteObjectId": collection["wasteObjectId"]}
 
-                    rwo = requests.get(
+                    rwo = http_client.get(
                         self.API_URL + "schedule",
                         params=waste_object_query,
                     )
@@ -1,10 +1,9 @@
 import datetime
 import json
-import requests
 
 from bs4 import BeautifulSoup
 from requests.utils import requote_uri
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "Horowhenua District Council"
 DESCRIPTION = "Source for Horowhenua District Council Rubbish & Recycling collection."
@@ -62,7 +61,7 @@ class Source:
         locationId = 0
 
         # 'collection' api call seems to require an ASP.Net_sessionID, so obtain the relevant cookie
-        s = requests.Session()
+        s = http_client.session()
         q = requote_uri(str(API_URLS["session"]))
         r0 = s.get(q, headers = HEADERS)
 
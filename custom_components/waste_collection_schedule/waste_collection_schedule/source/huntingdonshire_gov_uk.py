@@ -1,8 +1,7 @@
 import json
 from datetime import datetime
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Huntingdonshire District Council"
 DESCRIPTION = "Source for Huntingdonshire.gov.uk services for Huntingdonshire District Council."
@@ -25,7 +24,7 @@ class Source:
 
     def fetch(self):
         # get json file
-        r = requests.get(
+        r = http_client.get(
             f"https://servicelayer3c.azure-api.net/wastecalendar/collection/search/{self._uprn}?authority=HDC&take=20"
         )
 
@@ -1,8 +1,7 @@
 import logging
 from datetime import datetime
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = None
 DESCRIPTION = "Source for the Dutch HVCGroep waste management."
@@ -128,7 +127,7 @@ class Source:
     def fetch(self):
 
         # Retrieve bagid (unique waste management identifier)
-        r = requests.get(f"{self._url}/adressen/{self.postal_code}:{self.house_number}")
+        r = http_client.get(f"{self._url}/adressen/{self.postal_code}:{self.house_number}")
         r.raise_for_status()
         data = r.json()
 
@@ -140,12 +139,12 @@ class Source:
         bag_id = data[0]["bagid"]
 
         # Retrieve the details about different waste management flows (for example, paper, plastic etc.)
-        r = requests.get(f"{self._url}/rest/adressen/{bag_id}/afvalstromen")
+        r = http_client.get(f"{self._url}/rest/adressen/{bag_id}/afvalstromen")
         r.raise_for_status()
         waste_flows = r.json()
 
         # Retrieve the coming pickup dates for waste.
-        r = requests.get(f"{self._url}/rest/adressen/{bag_id}/ophaaldata")
+        r = http_client.get(f"{self._url}/rest/adressen/{bag_id}/ophaaldata")
         r.raise_for_status()
         data = r.json()
 
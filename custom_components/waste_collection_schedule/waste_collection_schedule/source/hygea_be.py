@@ -2,8 +2,7 @@ import datetime
 import json
 import time
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Hygea"
 DESCRIPTION = "Source for Hygea garbage collection"
@@ -31,12 +30,12 @@ class Source:
         params = {"start": int(time.time()), "end": int(time.time() + 2678400)}
         if self._street_index is not None:
             params["street"] = self._street_index
-            response = requests.get(
+            response = http_client.get(
                 "https://www.hygea.be/displaycal.html", params=params
             )
         elif self._cp is not None:
             params["street"] = self._cp
-            response = requests.get(
+            response = http_client.get(
                 "https://www.hygea.be/displaycalws.html", params=params
             )
 
@@ -1,9 +1,10 @@
 import datetime
 import logging
+import mmap
 from pathlib import Path
 
 import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_cache, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 from waste_collection_schedule.service.ICS_v1 import ICS_v1
 
@@ -134,12 +135,17 @@ class Source:
         split_at=None,
         version=2,
         verify_ssl=True,
+        backend=None,
     ):
         self._url = url
         self._file = file
         if bool(self._url is not None) == bool(self._file is not None):
             raise RuntimeError("Specify either url or file")
-        if version == 1:
+        if backend is not None:
+            self._ics = ICS(
+                offset=offset, split_at=split_at, regex=regex, backend=backend
+            )
+        elif version == 1:
             self._ics = ICS_v1(offset=offset, split_at=split_at, regex=regex)
         else:
             self._ics = ICS(offset=offset, split_at=split_at, regex=regex)
@@ -185,18 +191,30 @@ class Source:
     def fetch_url(self, url, params=None):
         # get ics file
         if self._method == "GET":
-            r = requests.get(
-                url, params=params, headers=HEADERS, verify=self._verify_ssl
-            )
+            # calendar files rarely change: revalidate with a conditional GET
+            # and reuse the previous result if the file is unchanged
+            try:
+                return http_cache.get(
+                    url,
+                    self._convert_response,
+                    params=params,
+                    headers=HEADERS,
+                    verify=self._verify_ssl,
+                )
+            except requests.HTTPError as e:
+                _LOGGER.error(
+                    "Error: the response is not ok; need code 200, but got code %s"
+                    % e.response.status_code
+                )
+                return []
         elif self._method == "POST":
-            r = requests.post(
+            r = http_client.post(
                 url, data=params, headers=HEADERS, verify=self._verify_ssl
             )
         else:
             raise RuntimeError(
                 "Error: unknown method to fetch URL, use GET or POST; got {self._method}"
             )
-        r.encoding = "utf-8"  # requests doesn't guess the encoding correctly
 
         # check the return code
         if not r.ok:
@@ -206,11 +224,21 @@ class Source:
             )
             return []
 
-        return self._convert(r.text)
+        return self._convert_response(r)
+
+    def _convert_response(self, r):
+        # pass the raw bytes, they are decoded as utf-8 by the ics parser
+        # (requests doesn't guess the encoding correctly)
+        return self._convert(r.content)
 
     def fetch_file(self, file):
-        f = open(file)
-        return self._convert(f.read())
+        # map the file instead of reading it, the ics parser decodes it
+        with open(file, "rb") as f:
+            if f.seek(0, 2) == 0:
+                # empty files can't be mapped
+                return self._convert(b"")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                return self._convert(m)
 
     def _convert(self, data):
         dates = self._ics.convert(data)
@@ -1,7 +1,6 @@
 import json
 import logging
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 _LOGGER = logging.getLogger(__name__)
@@ -35,7 +34,7 @@ class Source:
     
         # get the available published calendar years
         url = f"{baseUrl}/calendars"
-        response = requests.get(url, params=params)
+        response = http_client.get(url, params=params)
 
         # data validation
         if(response.status_code != 200):
@@ -60,7 +59,7 @@ class Source:
 
             # get available zones for calendar year
             url = f"{baseUrl}/zones"
-            response = requests.get(url, params=params)
+            response = http_client.get(url, params=params)
 
             # data validation
             if(response.status_code != 200):
@@ -91,7 +90,7 @@ class Source:
 
             # get ical data for year and zone
             url = f"{baseUrl}/v2/export"
-            response = requests.get(url, params=params)
+            response = http_client.get(url, params=params)
 
             # data validation
             if(response.status_code != 200):
@@ -1,8 +1,7 @@
 import json
 from datetime import date, timedelta
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Inner West Council (NSW)"
 DESCRIPTION = "Source for Inner West Council (NSW) rubbish collection."
@@ -33,7 +32,7 @@ class Source:
         nextmonth = today + timedelta(30)
 
         # Retrieve suburbs
-        r = requests.get(
+        r = http_client.get(
             "https://marrickville.waste-info.com.au/api/v1/localities.json", headers=HEADERS
         )
         data = json.loads(r.text)
@@ -48,7 +47,7 @@ class Source:
             return []
 
         # Retrieve the streets in our suburb
-        r = requests.get(
+        r = http_client.get(
             f"https://marrickville.waste-info.com.au/api/v1/streets.json?locality={suburb_id}",
             headers=HEADERS,
         )
@@ -64,7 +63,7 @@ class Source:
             return []
 
         # Retrieve the properties in our street
-        r = requests.get(
+        r = http_client.get(
             f"https://marrickville.waste-info.com.au/api/v1/properties.json?street={street_id}",
             headers=HEADERS,
         )
@@ -80,7 +79,7 @@ class Source:
             return []
 
         # Retrieve the upcoming collections for our property
-        r = requests.get(
+        r = http_client.get(
             f"https://marrickville.waste-info.com.au/api/v1/properties/{property_id}.json?start={today}&end={nextmonth}",
             headers=HEADERS,
         )
@@ -2,8 +2,7 @@ import datetime
 import urllib
 from html.parser import HTMLParser
 
-import requests
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "Ipswich City Council"
 DESCRIPTION = "Source for Ipswich City Council rubbish collection."
@@ -112,7 +111,7 @@ class Source:
             "address": f"{address}+QLD%2C+Australia",
         }
 
-        r = requests.get("https://console.whatbinday.com/api/search", params=params)
+        r = http_client.get("https://console.whatbinday.com/api/search", params=params)
         p = IpswichGovAuParser()
         p.feed(r.text)
         return p.entries
@@ -1,8 +1,7 @@
 import datetime
 import json
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Jumomind"
 DESCRIPTION = "Source for Jumomind.de waste collection."
@@ -28,7 +27,7 @@ class Source:
         args = {"r": "dates/0", "city_id": self._city_id, "area_id": self._area_id}
 
         # get json file
-        r = requests.get(
+        r = http_client.get(
             f"https://{self._service_id}.jumomind.com/mmapp/api.php", params=args
         )
 
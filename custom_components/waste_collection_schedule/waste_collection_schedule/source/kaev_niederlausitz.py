@@ -1,8 +1,7 @@
-import requests
 import html
 import json
 
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "KAEV Niederlausitz"
@@ -24,7 +23,7 @@ TEST_CASES = {
 API_URL = 'https://www.kaev.de/Templates/Content/DetailTourenplanWebsite/ajax.aspx/getAddress'
 
 def get_kalender_id(search):
-    s=requests.Session()
+    s=http_client.session()
     s.get('https://www.kaev.de/')
     payload={"query": search}
     resp = s.post(API_URL, json=payload).json()
@@ -54,10 +53,8 @@ class Source:
         if len(abf_kalender) == 0:
             raise Exception("Error: Keine Einträge gefunden")
         
-        r=requests.get(calurl)
-        r.encoding = "utf-8"
-
-        dates = self._ics.convert(r.text)
+        r=http_client.get(calurl)
+        dates = self._ics.convert(r.content)
         entries = []
         for d in dates:
             entries.append(Collection(d[0], d[1].removesuffix(", ")))
@@ -2,8 +2,7 @@ import logging
 import time
 from datetime import datetime
 
-import requests
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "The Royal Borough of Kingston Council"
 DESCRIPTION = (
@@ -37,7 +36,7 @@ class Source:
         self._uprn = str(uprn)
 
     def fetch(self):
-        s = requests.Session()
+        s = http_client.session()
 
         # This request sets up the cookies
         r0 = s.get(API_URLS["session"], headers=HEADERS)
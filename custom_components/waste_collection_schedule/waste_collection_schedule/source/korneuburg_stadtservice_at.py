@@ -1,9 +1,8 @@
 import json
 from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_cache, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS  # type: ignore[attr-defined]
 
 TITLE = 'Stadtservice Korneuburg'
@@ -84,7 +83,7 @@ class Source:
 
         # request address selection form
         url = urljoin(URL, "Rathaus/Buergerservice/Muellabfuhr")
-        page = requests.get(url=url, headers=self._headers, cookies=self._cookies)
+        page = http_client.get(url=url, headers=self._headers, cookies=self._cookies)
         soup = BeautifulSoup(page.content, "html.parser")
 
         # extract possible street and number combinations from html source
@@ -110,7 +109,7 @@ class Source:
 
         # request overview with address selection to get the region
         url = urljoin(URL, "system/web/kalender.aspx")
-        page = requests.get(url=url, headers=self._headers, cookies=self._cookies,
+        page = http_client.get(url=url, headers=self._headers, cookies=self._cookies,
                             params={"sprache": "1", "menuonr": "225991280", "typids": street_number_link})
         soup = BeautifulSoup(page.content, "html.parser")
 
@@ -129,7 +128,7 @@ class Source:
         urls = [urljoin(URL, u) for u in WASTE_TYPE_URLS.get(self.region)]
 
         for u in urls:
-            r = requests.get(url=u, headers=self._headers, cookies=self._cookies)
+            r = http_client.get(url=u, headers=self._headers, cookies=self._cookies)
             soup = BeautifulSoup(r.content, "html.parser")
             download_link = soup.findAll("a", {"class": "piwik_download_tracker", "data-trackingtyp": "iCal/Kalender"})
             if len(download_link):
@@ -140,7 +139,10 @@ class Source:
     def process_waste_type(self, url):
         """downloads one calendar and returns list with entries"""
 
-        r = requests.get(url=url, headers=self._headers, cookies=self._cookies)
+        # unchanged calendars are revalidated with a conditional GET and not parsed again
+        return http_cache.get(url, self._convert_ical, headers=self._headers, cookies=self._cookies)
+
+    def _convert_ical(self, r):
         r.encoding = r.apparent_encoding
 
         dates = self._ics.convert(r.text)
@@ -1,5 +1,4 @@
-import requests
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Kreiswirtschaftsbetriebe Goslar"
@@ -26,7 +25,7 @@ class Source:
         self.pois = pois
 
     def fetch(self):
-        r = requests.get(
+        r = http_client.get(
             url="https://www.kwb-goslar.de/output/options.php",
             params={
                 "ModID": "48",
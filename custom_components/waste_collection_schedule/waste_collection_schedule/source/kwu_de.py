@@ -1,7 +1,6 @@
-import requests
 from bs4 import BeautifulSoup
 from datetime import date
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "KWU Entsorgung Landkreis Oder-Spree"
@@ -29,7 +28,7 @@ class Source:
         self._ics = ICS()
 
     def fetch(self):
-        session = requests.Session()
+        session = http_client.session()
 
         params = {
             "city": self._city,
@@ -38,7 +37,7 @@ class Source:
             "direct": "true",
         }
 
-        r = requests.get("https://www.kwu-entsorgung.de/inc/wordpress/kal_objauswahl.php", headers=HEADERS)
+        r = http_client.get("https://www.kwu-entsorgung.de/inc/wordpress/kal_objauswahl.php", headers=HEADERS)
         parsed_html = BeautifulSoup(r.text, "html.parser")
         Orte = parsed_html.find_all('option')
 
@@ -47,7 +46,7 @@ class Source:
                 OrtValue = Ort['value']
                 break
 
-        r = requests.get("https://www.kwu-entsorgung.de/inc/wordpress/kal_str2ort.php", params={"ort": OrtValue}, headers=HEADERS)
+        r = http_client.get("https://www.kwu-entsorgung.de/inc/wordpress/kal_str2ort.php", params={"ort": OrtValue}, headers=HEADERS)
         parsed_html = BeautifulSoup(r.text, "html.parser")
         Strassen = parsed_html.find_all('option')
 
@@ -56,7 +55,7 @@ class Source:
                 StrasseValue = Strasse['value']
                 break
 
-        r = requests.get("https://www.kwu-entsorgung.de/inc/wordpress/kal_str2ort.php", params={"ort": OrtValue, "strasse": StrasseValue}, headers=HEADERS)
+        r = http_client.get("https://www.kwu-entsorgung.de/inc/wordpress/kal_str2ort.php", params={"ort": OrtValue, "strasse": StrasseValue}, headers=HEADERS)
         parsed_html = BeautifulSoup(r.text, "html.parser")
         Objekte = parsed_html.find_all('option')
 
@@ -65,7 +64,7 @@ class Source:
                 ObjektValue = Objekt['value']
                 break
 
-        r = requests.post("https://www.kwu-entsorgung.de/inc/wordpress/kal_uebersicht-2020.php", data={"ort": OrtValue, "strasse": StrasseValue, "objekt": ObjektValue, "jahr": date.today().year}, headers=HEADERS)
+        r = http_client.post("https://www.kwu-entsorgung.de/inc/wordpress/kal_uebersicht-2020.php", data={"ort": OrtValue, "strasse": StrasseValue, "objekt": ObjektValue, "jahr": date.today().year}, headers=HEADERS)
 
         parsed_html = BeautifulSoup(r.text, "html.parser")
         Links = parsed_html.find_all('a')
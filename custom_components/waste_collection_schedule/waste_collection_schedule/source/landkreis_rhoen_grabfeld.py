@@ -1,7 +1,6 @@
 import datetime
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Landkreis Rhön Grabfeld"
 DESCRIPTION = "Source for Rhönn Grabfeld uses service by offizium."
@@ -36,7 +35,7 @@ class Source:
     def fetch(self):
         now = datetime.datetime.now().date()
 
-        r = requests.get(API_URL, params={
+        r = http_client.get(API_URL, params={
             "stadt": self._city,
             "ortsteil": self._district
         })
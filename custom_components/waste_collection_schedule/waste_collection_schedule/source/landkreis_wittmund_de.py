@@ -1,6 +1,5 @@
-import requests
 import json
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 from bs4 import BeautifulSoup
 
@@ -38,7 +37,7 @@ class Source:
         return tag['value'] != "" and tag.string == self._city
 
     def fetch_city_id(self, cityName):
-        r = requests.get(API_URL)
+        r = http_client.get(API_URL)
         if not r.ok:
             raise Exception(
                 "Error: failed to fetch url: {}".format(
@@ -65,7 +64,7 @@ class Source:
         return citySelection[0]['value']
 
     def fetch_street_id(self, cityId, streetName):
-        r = requests.get(AUTOCOMPLETE_URL.format(cityId, streetName), headers={
+        r = http_client.get(AUTOCOMPLETE_URL.format(cityId, streetName), headers={
             "Referer": API_URL
         })
 
@@ -101,7 +100,7 @@ class Source:
         return streetId[0]
 
     def fetch_ics(self, url):
-        r = requests.get(url, headers={
+        r = http_client.get(url, headers={
             "Referer": API_URL
         })
 
@@ -113,8 +112,7 @@ class Source:
             )
 
         # parse ics file
-        r.encoding = "utf-8"
-        dates = self._ics.convert(r.text)
+        dates = self._ics.convert(r.content)
 
         entries = []
         for d in dates:
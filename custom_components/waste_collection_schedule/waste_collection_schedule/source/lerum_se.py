@@ -3,8 +3,7 @@ from datetime import datetime
 import json
 from urllib.parse import urlencode
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Lerum Vatten och Avlopp"
 DESCRIPTION = "Source for Lerum Vatten och Avlopp waste collection."
@@ -20,7 +19,7 @@ class Source:
         self._street_address = street_address
 
     def fetch(self):
-        response = requests.post(
+        response = http_client.post(
             "https://vatjanst.lerum.se/FutureWeb/SimpleWastePickup/SearchAdress",
             {"searchText": self._street_address}
         )
@@ -35,7 +34,7 @@ class Source:
             return []
 
         query_params = urlencode({"address": address})
-        response = requests.get(
+        response = http_client.get(
             "https://vatjanst.lerum.se/FutureWeb/SimpleWastePickup/GetWastePickupSchedule?{}"
             .format(query_params)
         )
@@ -2,8 +2,7 @@ import datetime
 import logging
 import re
 
-import requests
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "London Borough of Lewisham"
 DESCRIPTION = (
@@ -60,7 +59,7 @@ class Source:
             
             # look up the UPRN for the address
             p = {'postcodeOrStreet': self._post_code}
-            r = requests.post(API_URLS["address_search"], params=p)
+            r = http_client.post(API_URLS["address_search"], params=p)
             r.raise_for_status()
             addresses = r.json()
 
@@ -80,7 +79,7 @@ class Source:
             'item': URPN_DATA_ITEM,
             'uprn': self._uprn
             }
-        r = requests.post(API_URLS["collection"], params=p)
+        r = http_client.post(API_URLS["collection"], params=p)
         r.raise_for_status()
         
         entries = []
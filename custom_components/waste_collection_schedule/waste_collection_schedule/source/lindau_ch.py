@@ -1,9 +1,8 @@
 import json
 from datetime import datetime
 
-import requests
 from bs4 import BeautifulSoup
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Lindau"
 DESCRIPTION = "Source for Lindau waste collection."
@@ -28,7 +27,7 @@ class Source:
         self._city = city
 
     def fetch(self):
-        response = requests.get("https://www.lindau.ch/abfalldaten")
+        response = http_client.get("https://www.lindau.ch/abfalldaten")
 
         html = BeautifulSoup(response.text, "html.parser")
 
@@ -1,6 +1,5 @@
 import datetime
-import requests
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 from waste_collection_schedule.service.ICS import ICS
 
 
@@ -23,12 +22,11 @@ class Source:
     def fetch(self):
         # get ics file
         full_url = API_URL + str(self._location)
-        r = requests.get(full_url, headers=HEADERS)
+        r = http_client.get(full_url, headers=HEADERS)
         r.raise_for_status()
         
         # parse ics file
-        r.encoding = "utf-8"
-        dates = self._ics.convert(r.text)
+        dates = self._ics.convert(r.content)
         
         entries = []
         for d in dates:
@@ -1,7 +1,6 @@
 from datetime import datetime
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 from bs4 import BeautifulSoup
 from urllib.parse import urlsplit, parse_qs
@@ -34,12 +33,12 @@ class Source:
             _LOGGER.error(
                 "uprn must be provided in config"
             )
-        self._session = requests.Session()
+        self._session = http_client.session()
 
     def fetch(self):
         entries = []
 
-        r = requests.post(
+        r = http_client.post(
             API_URL,
             data={
                 "mcc_bin_dates_uprn": self._uprn,
@@ -1,7 +1,6 @@
 import datetime
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
-import requests
 import json
 from datetime import datetime
 
@@ -43,7 +42,7 @@ class Source:
           'X-Requested-With': 'XMLHttpRequest'
         }
 
-        response = requests.request("POST", url, headers=headers, data=payload, params=params)
+        response = http_client.request("POST", url, headers=headers, data=payload, params=params)
         sessionid = response.headers['X-IntraMaps-Session']
 
 
@@ -59,7 +58,7 @@ class Source:
             "IntraMapsSession": sessionid
         }
 
-        response = requests.request("POST", url, headers=headers, data=payload, params=params)
+        response = http_client.request("POST", url, headers=headers, data=payload, params=params)
 
 
 
@@ -80,7 +79,7 @@ class Source:
             "IntraMapsSession": sessionid
         }
 
-        response = requests.request("POST", url, headers=headers, data=payload, params=params)
+        response = http_client.request("POST", url, headers=headers, data=payload, params=params)
         #this request may return multiple addresses. Use the first one.
         address_map_key = response.json()
         address_map_key = address_map_key['fullText'][0]['mapKey']
@@ -102,7 +101,7 @@ class Source:
             "IntraMapsSession": sessionid
         }
 
-        response = requests.request("POST", url, headers=headers, data=payload, params=params)
+        response = http_client.request("POST", url, headers=headers, data=payload, params=params)
         response = response.json()
 
         # Rubbish (green lid) - Happens on each recyclables and garden organics
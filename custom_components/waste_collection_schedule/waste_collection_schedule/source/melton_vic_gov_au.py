@@ -2,9 +2,8 @@ import logging
 import re
 from datetime import datetime
 
-import requests
 from bs4 import BeautifulSoup
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Melton City Council"
 DESCRIPTION = "Source for Melton City Council rubbish collection."
@@ -30,7 +29,7 @@ class Source:
         self._street_address = street_address
 
     def fetch(self):
-        session = requests.Session()
+        session = http_client.session()
 
         response = session.get("https://www.melton.vic.gov.au/My-Area")
         response.raise_for_status()
@@ -1,9 +1,8 @@
 import logging
-import requests
 import time
 
 from datetime import datetime
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = 'Middlesbrough Council'
 DESCRIPTION = 'Source for waste collection services for Middlesbrough Council'
@@ -34,7 +33,7 @@ class Source:
     def __init__(self, uprn: str):
         self._uprn = str(uprn)
     def fetch(self):
-        s = requests.Session()
+        s = http_client.session()
 
         #This request sets up the cookies
         r0 = s.get(API_URLS['session'], headers=HEADERS)
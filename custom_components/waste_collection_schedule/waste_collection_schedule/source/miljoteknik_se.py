@@ -1,9 +1,8 @@
 import json
 import re
-import requests
 from bs4 import BeautifulSoup as bs
 from datetime import datetime
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 # Ronneby Miljöteknik, Blekinge Sweden
 #
@@ -57,7 +56,7 @@ class Source:
             'Accept-Language': 'sv-SE,sv;q=0.9',
             'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8'
         }
-        response = requests.post(
+        response = http_client.post(
             "http://35.228.122.136/search_suggestions.php",
             data=data,
             headers=headers
@@ -80,7 +79,7 @@ class Source:
             "chosen_address": "{} {}".format(self._street_address, self._city),
             "chosen_address_pickupid": pickup_id
         }
-        response = requests.post(
+        response = http_client.post(
             "http://35.228.122.136/get_data.php",
             data=data,
             headers=headers
@@ -1,10 +1,9 @@
-import requests
 import urllib.parse
 import json
 import datetime
 import re
 
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from pprint import pprint
 
 TITLE = "Min Renovasjon"
@@ -67,7 +66,7 @@ class Source:
         }
         args = {}
 
-        r = requests.get(API_URL + 'fraksjoner', params = args, headers = headers)
+        r = http_client.get(API_URL + 'fraksjoner', params = args, headers = headers)
 
         type = {}
         for f in json.loads(r.content):
@@ -86,7 +85,7 @@ class Source:
             'gatekode': self._street_code,
         }
 
-        r = requests.get(API_URL + 'tommekalender', params = args, headers = headers)
+        r = http_client.get(API_URL + 'tommekalender', params = args, headers = headers)
 
         entries = []
         for f in json.loads(r.content):
@@ -2,9 +2,8 @@ import logging
 from datetime import datetime
 import re
 
-import requests
 from bs4 import BeautifulSoup
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Macedon Ranges Shire Council"
 DESCRIPTION = "Source for Macedon Ranges Shire Council rubbish collection."
@@ -28,7 +27,7 @@ class Source:
         self._street_address = street_address
 
     def fetch(self):
-        session = requests.Session()
+        session = http_client.session()
 
         response = session.get(
             "https://www.mrsc.vic.gov.au/Live-Work/Bins-Rubbish-Recycling/Bins-and-collection-days/Bin-collection-days"
@@ -1,7 +1,6 @@
 from html.parser import HTMLParser
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Müllmax"
@@ -69,12 +68,12 @@ class Source:
         mm_ses = InputTextParser(name="mm_ses")
 
         url = f"https://www.muellmax.de/abfallkalender/{self._service.lower()}/res/{self._service}Start.php"
-        r = requests.get(url)
+        r = http_client.get(url)
         mm_ses.feed(r.text)
 
         # select "Abfuhrtermine", returns ort or an empty street search field
         args = {"mm_ses": mm_ses.value, "mm_aus_ort.x": 0, "mm_aus_ort.x": 0}
-        r = requests.post(url, data=args)
+        r = http_client.post(url, data=args)
         mm_ses.feed(r.text)
 
         if self._mm_frm_ort_sel is not None:
@@ -85,7 +84,7 @@ class Source:
                 "mm_frm_ort_sel": self._mm_frm_ort_sel,
                 "mm_aus_ort_submit": "weiter",
             }
-            r = requests.post(url, data=args)
+            r = http_client.post(url, data=args)
             mm_ses.feed(r.text)
 
         if self._mm_frm_str_sel is not None:
@@ -96,7 +95,7 @@ class Source:
                 "mm_frm_str_name": "",
                 "mm_aus_str_txt_submit": "suchen",
             }
-            r = requests.post(url, data=args)
+            r = http_client.post(url, data=args)
             mm_ses.feed(r.text)
 
             # select street
@@ -106,7 +105,7 @@ class Source:
                 "mm_frm_str_sel": self._mm_frm_str_sel,
                 "mm_aus_str_sel_submit": "weiter",
             }
-            r = requests.post(url, data=args)
+            r = http_client.post(url, data=args)
             mm_ses.feed(r.text)
 
         if self._mm_frm_hnr_sel is not None:
@@ -117,12 +116,12 @@ class Source:
                 "mm_frm_hnr_sel": self._mm_frm_hnr_sel,
                 "mm_aus_hnr_sel_submit": "weiter",
             }
-            r = requests.post(url, data=args)
+            r = http_client.post(url, data=args)
             mm_ses.feed(r.text)
 
         # select to get ical
         args = {"mm_ses": mm_ses.value, "xxx": 1, "mm_ica_auswahl": "iCalendar-Datei"}
-        r = requests.post(url, data=args)
+        r = http_client.post(url, data=args)
         mm_ses.feed(r.text)
 
         mm_frm_fra = InputCheckboxParser(startswith="mm_frm_fra")
@@ -132,7 +131,7 @@ class Source:
         args = {"mm_ses": mm_ses.value, "xxx": 1, "mm_frm_type": "termine"}
         args.update(mm_frm_fra.value)
         args.update({"mm_ica_gen": "iCalendar-Datei laden"})
-        r = requests.post(url, data=args)
+        r = http_client.post(url, data=args)
         mm_ses.feed(r.text)
 
         entries = []
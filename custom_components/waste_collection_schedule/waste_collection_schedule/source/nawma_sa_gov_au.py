@@ -1,8 +1,7 @@
 import datetime
 from html.parser import HTMLParser
 
-import requests
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "North Adelaide Waste Management Authority"
 DESCRIPTION = (
@@ -106,7 +105,7 @@ class Source:
             "pid": self._pid,
         }
 
-        r = requests.post(
+        r = http_client.post(
             "http://www.nawma.sa.gov.au/wp-admin/admin-ajax.php",
             headers=HEADERS,
             data=params,  # The parameters are sent as the body of the post
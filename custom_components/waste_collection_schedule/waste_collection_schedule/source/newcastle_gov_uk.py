@@ -1,11 +1,10 @@
 import logging
 from datetime import datetime
 import re
-import requests
 # These lines are needed to suppress the InsecureRequestWarning resulting from the POST verify=False option
 # With verify=True the POST fails due to a SSLCertVerificationError.
 import urllib3
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 urllib3.disable_warnings()
 # The following links may provide a better way of dealing with this, as using verify=False is not ideal:
@@ -42,11 +41,11 @@ class Source:
                 "uprn must be provided in config"
             )
         self._uprn = self._uprn.zfill(12)
-        self._session = requests.Session()
+        self._session = http_client.session()
 
     def fetch(self):
         entries = []
-        res = requests.get(f"{URL}?uprn={self._uprn}")
+        res = http_client.get(f"{URL}?uprn={self._uprn}")
         collections = re.findall(REGEX, res.text)
 
         for collection in collections:
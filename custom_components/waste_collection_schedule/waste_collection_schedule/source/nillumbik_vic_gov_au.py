@@ -2,9 +2,8 @@ import logging
 import re
 from datetime import datetime
 
-import requests
 from bs4 import BeautifulSoup
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Nillumbik Shire Council"
 DESCRIPTION = "Source for Nillumbik Shire Council rubbish collection."
@@ -27,7 +26,7 @@ class Source:
         self._street_address = street_address
 
     def fetch(self):
-        session = requests.Session()
+        session = http_client.session()
 
         response = session.get("https://www.nillumbik.vic.gov.au/Residents/Waste-and-recycling/Bin-collection/Check-my-bin-day")
         response.raise_for_status()
@@ -2,8 +2,7 @@ import json
 import datetime
 import time
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Nottingham City Council"
 DESCRIPTION = "Source for nottinghamcity.gov.uk services for the city of Nottingham, UK."
@@ -38,7 +37,7 @@ class Source:
 
     def fetch(self):
         # get json file
-        r = requests.get(
+        r = http_client.get(
             f"https://geoserver.nottinghamcity.gov.uk/myproperty/handler/proxy.ashx?http://geoserver.nottinghamcity.gov.uk/wcf/BinCollection.svc/livebin/{self._uprn}"
         )
 
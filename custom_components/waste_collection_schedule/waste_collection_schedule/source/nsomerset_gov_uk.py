@@ -1,9 +1,8 @@
 import logging
 from datetime import datetime
 
-import requests
 from bs4 import BeautifulSoup
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "North Somerset Council"
 DESCRIPTION = "Source for n-somerset.gov.uk services for North Somerset, UK."
@@ -32,7 +31,7 @@ class Source:
         self._postcode = postcode
 
     def fetch(self):
-        request = requests.post(
+        request = http_client.post(
             "https://forms.n-somerset.gov.uk/Waste/CollectionSchedule",
             data={
                 "PreviousHouse": "",
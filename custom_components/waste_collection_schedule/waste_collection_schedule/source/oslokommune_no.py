@@ -1,10 +1,9 @@
-import requests
 import urllib.parse
 import json
 import datetime
 import re
 
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from pprint import pprint
 
 TITLE = "Oslo Kommune"
@@ -56,7 +55,7 @@ class Source:
             'street_id': self._street_id,
         }
 
-        r = requests.get(API_URL, params = args, headers = headers)
+        r = http_client.get(API_URL, params = args, headers = headers)
 
         entries = []
         res = json.loads(r.content)['data']['result'][0]['HentePunkts']
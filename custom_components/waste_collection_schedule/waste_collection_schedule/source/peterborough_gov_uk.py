@@ -1,8 +1,7 @@
 import logging
 import datetime
 
-import requests
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "Peterborough City Council"
 DESCRIPTION = (
@@ -40,7 +39,7 @@ class Source:
         if not self._uprn:
             # look up the UPRN for the address
             q = str(API_URLS["address_search"]).format(postcode=self._post_code)
-            r = requests.get(q)
+            r = http_client.get(q)
             r.raise_for_status()
             addresses = r.json()["premises"]
 
@@ -61,7 +60,7 @@ class Source:
                 end=(now + datetime.timedelta(14)),
                 uprn=self._uprn
             )
-        r = requests.get(q)
+        r = http_client.get(q)
         r.raise_for_status()
 
         collections = r.json()["jobs_FeatureScheduleDates"]
@@ -2,8 +2,7 @@ import datetime
 import json
 from urllib.parse import quote
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "City of Pittsburgh"
 DESCRIPTION = "Source for PGH.ST services for the city of Pittsburgh, PA, USA."
@@ -26,7 +25,7 @@ class Source:
 
     def fetch(self):
         # get json file
-        r = requests.get(
+        r = http_client.get(
             f"http://pgh.st/locate/{self._house_number}/{quote(self._street_name)}/{self._zipcode}"
         )
 
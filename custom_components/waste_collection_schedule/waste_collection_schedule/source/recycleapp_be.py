@@ -1,8 +1,7 @@
 import logging
 from datetime import datetime, timedelta
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Recycle!"
 DESCRIPTION = "Source for RecycleApp.be"
@@ -50,18 +49,18 @@ class Source:
             "User-Agent": "",
             "Authorization": "",
         }
-        r = requests.get(f"{url}/access-token", headers=headers)
+        r = http_client.get(f"{url}/access-token", headers=headers)
         headers["Authorization"] = r.json()["accessToken"]
 
         params = {"q": self._postcode}
-        r = requests.get(f"{url}/zipcodes", params=params, headers=headers)
+        r = http_client.get(f"{url}/zipcodes", params=params, headers=headers)
         if r.status_code != 200:
             _LOGGER.error("Get zip code failed")
             return []
         zipcodeId = r.json()["items"][0]["id"]
 
         params = {"q": self._street, "zipcodes": zipcodeId}
-        r = requests.post(f"{url}/streets", params=params, headers=headers)
+        r = http_client.post(f"{url}/streets", params=params, headers=headers)
         if r.status_code != 200:
             _LOGGER.error("Get street id failed")
             return []
@@ -84,7 +83,7 @@ class Source:
             "untilDate": untilDate,
             #            "size":100,
         }
-        r = requests.get(f"{url}/collections", params=params, headers=headers)
+        r = http_client.get(f"{url}/collections", params=params, headers=headers)
         if r.status_code != 200:
             _LOGGER.error("Get data failed")
             return []
@@ -1,8 +1,7 @@
 import json
 from datetime import datetime
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "RecycleSmart"
 DESCRIPTION = "Source for RecycleSmart collection."
@@ -23,7 +22,7 @@ class Source:
 
     def fetch(self):
         # login is via Google Identity Toolkit, providing username and password.
-        r = requests.post(
+        r = http_client.post(
             "https://identitytoolkit.googleapis.com/v1/accounts:signInWithPassword",
             json={
                 "returnSecureToken": True,
@@ -35,7 +34,7 @@ class Source:
         data = json.loads(r.text)
 
         # take the token returned from Google Identity Toolkit to get the API auth token (JWT) from Firebase
-        r = requests.post(
+        r = http_client.post(
             "https://www.app.recyclesmart.com/api/sessions/firebase",
             json={"id_token": data["idToken"]},
             headers={"content-type": "application/json"},
@@ -43,7 +42,7 @@ class Source:
         data = json.loads(r.text)
 
         # use the auth token (jwt) from firebase to get pickups
-        r = requests.get(
+        r = http_client.get(
             "https://www.app.recyclesmart.com/api/pickups",
             # retrieves future pickups (if scheduled), then past pickups, until per_page is reached
             # the average user is scheduled for monthly pickups
@@ -1,5 +1,4 @@
-import requests
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "RegioEntsorgung Städteregion Aachen"
@@ -25,7 +24,7 @@ class Source:
 
     def fetch(self):
         # Use a session to keep cookies
-        session = requests.Session()
+        session = http_client.session()
 
         payload = {
             'SubmitAction': 'wasteDisposalServices',
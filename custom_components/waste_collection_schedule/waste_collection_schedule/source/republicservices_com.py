@@ -1,8 +1,7 @@
-import requests
 import json
 
 from datetime import datetime
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Republic Services"
 DESCRIPTION = "Source for Republic Services Collection."
@@ -19,14 +18,14 @@ class Source:
         self._street_address = street_address
 
     def fetch(self):
-        response1 = requests.get(
+        response1 = http_client.get(
             "https://www.republicservices.com/api/v1/addresses",
             params={"addressLine1": self._street_address},
         )
 
         address_hash = json.loads(response1.text)["data"][0]["addressHash"]
 
-        response2 = requests.get(
+        response2 = http_client.get(
             "https://www.republicservices.com/api/v1/publicPickup",
             params={"siteAddressHash": address_hash},
         )
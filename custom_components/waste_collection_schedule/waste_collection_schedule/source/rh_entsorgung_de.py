@@ -1,7 +1,6 @@
 from html.parser import HTMLParser
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Rhein-Hunsrück Entsorgung (RHE)"
@@ -50,7 +49,7 @@ class Source:
         self._ics = ICS()
 
     def fetch(self):
-        session = requests.session()
+        session = http_client.session()
 
         r = session.get(
             "https://aao.rh-entsorgung.de/WasteManagementRheinhunsrueck/WasteManagementServlet",
@@ -1,7 +1,6 @@
 from datetime import datetime
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Richmondshire District Council"
 DESCRIPTION = "To find your UPRN, visit the Richmondshire page and use the address search. Right-click your entry in the house dropdown, choose Inspect, and copy the UPRN from the value"
@@ -26,7 +25,7 @@ class Source:
         self._uprn = uprn
 
     def fetch(self):
-        r = requests.get(
+        r = http_client.get(
             f"https://www.richmondshire.gov.uk/Umbraco/Api/MyAreaApi/GetBinRoundData?uprn={self._uprn}"
         )
         ids = r.json()
@@ -1,5 +1,4 @@
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Rushmoor Borough Council"
@@ -26,7 +25,7 @@ class Source:
 
     def fetch(self):
         params = {"uprn": self._uprn, "weeks": "16"}
-        r = requests.post(API_URL, params=params)
+        r = http_client.post(API_URL, params=params)
         r.raise_for_status()
 
         dates = self._ics.convert(r.text)
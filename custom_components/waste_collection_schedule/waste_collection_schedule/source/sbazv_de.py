@@ -1,8 +1,7 @@
 from datetime import datetime
 import logging
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Südbrandenburgischer Abfallzweckverband"
@@ -59,7 +58,7 @@ class Source:
 
         # get ics file
         # https://www.sbazv.de/entsorgungstermine/klein.ics?city=Wildau&district=Wildau&street=Miersdorfer+Str.
-        r = requests.get("https://www.sbazv.de/entsorgungstermine/klein.ics", params=args)
+        r = http_client.get("https://www.sbazv.de/entsorgungstermine/klein.ics", params=args)
 
         # parse ics file
         dates = self._ics.convert(r.text)
@@ -1,8 +1,7 @@
 import logging
 from datetime import datetime
 
-import requests
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "South Cambridgeshire District Council"
 DESCRIPTION = (
@@ -39,7 +38,7 @@ class Source:
 
     def fetch(self):
         # fetch location id
-        r = requests.get(
+        r = http_client.get(
             API_URLS["address_search"], params={"postCode": self._post_code}
         )
         r.raise_for_status()
@@ -52,7 +51,7 @@ class Source:
             raise Exception(f"Could not find address {self._post_code} {self._number}")
 
         q = str(API_URLS["collection"]).format(address_ids[0])
-        r = requests.get(q)
+        r = http_client.get(q)
         r.raise_for_status()
 
         collections = r.json()["collections"]
@@ -1,8 +1,7 @@
 import datetime
 import json
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Seattle Public Utilities"
 DESCRIPTION = "Source for Seattle Public Utilities waste collection."
@@ -41,7 +40,7 @@ class Source:
                 "address": {"addressLine1": self._street_address, "city": "", "zip": ""}
             }
 
-            r = requests.post(
+            r = http_client.post(
                 "https://myutilities.seattle.gov/rest/serviceorder/findaddress",
                 json=find_address_payload,
             )
@@ -54,7 +53,7 @@ class Source:
         # step 2
         find_account_payload = {"address": {"premCode": prem_code}}
 
-        r = requests.post(
+        r = http_client.post(
             "https://myutilities.seattle.gov/rest/serviceorder/findAccount",
             json=find_account_payload,
         )
@@ -69,7 +68,7 @@ class Source:
             "password": "guest",
         }
 
-        r = requests.post(
+        r = http_client.post(
             "https://myutilities.seattle.gov/rest/auth/guest", data=token_payload
         )
 
@@ -89,7 +88,7 @@ class Source:
             },
         }
 
-        r = requests.post(
+        r = http_client.post(
             "https://myutilities.seattle.gov/rest/guest/swsummary",
             json=swsummary_payload,
             headers=headers,
@@ -117,7 +116,7 @@ class Source:
         for service in swServices:
             waste_calendar_payload["servicePoints"].append(service["servicePointId"])
 
-        r = requests.post(
+        r = http_client.post(
             "https://myutilities.seattle.gov/rest/solidwastecalendar",
             json=waste_calendar_payload,
             headers=headers,
@@ -3,8 +3,7 @@ import json
 import logging
 import re
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Sector 27 - Datteln, Marl, Oer-Erkenschwick"
 DESCRIPTION = "Source for Muellkalender in Kreis RE."
@@ -59,7 +58,7 @@ class Source:
         args = city
         args["searchFor"] = self._street
 
-        r = requests.get(
+        r = http_client.get(
             "https://muellkalender.sector27.de/web/searchForStreets",
             params=args,
             headers=HEADERS,
@@ -84,7 +83,7 @@ class Source:
         for dt in self.getviewYearRange():
             args["viewdate"] = dt
 
-            r = requests.get(
+            r = http_client.get(
                 "https://muellkalender.sector27.de/web/fetchPickups",
                 params=args,
                 headers=HEADERS,
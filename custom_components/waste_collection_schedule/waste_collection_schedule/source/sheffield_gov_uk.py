@@ -1,8 +1,7 @@
-import urllib.request
 from bs4 import BeautifulSoup
 from dateutil import parser
 import logging
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Sheffield City Council"
 DESCRIPTION = "Source for waste collection services from Sheffield City Council (SCC)"
@@ -41,9 +40,9 @@ class Source:
         if self._uprn:
             # Get the page containing bin details
             # /calendar gives further future informaion over just the "Services" page
-            req = urllib.request.Request(f"{API_URL}/property/{self._uprn}/calendar",headers=HEADERS)
-            with urllib.request.urlopen(req) as response:
-                html_doc = response.read()
+            r = http_client.get(f"{API_URL}/property/{self._uprn}/calendar",headers=HEADERS)
+            r.raise_for_status()
+            html_doc = r.content
 
             # Parse the page to get the data required (collection date and type)
             soup = BeautifulSoup(html_doc, 'html.parser')
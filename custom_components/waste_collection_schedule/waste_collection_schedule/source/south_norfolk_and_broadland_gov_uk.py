@@ -5,9 +5,8 @@ from time import strptime
 from typing import List
 from urllib.parse import quote
 
-import requests
 from bs4 import BeautifulSoup as soup
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "South Norfolk and Broadland Council"
 DESCRIPTION = "Source for southnorfolkandbroadland.gov.uk services for South Norfolk and Broadland, UK"
@@ -64,7 +63,7 @@ class Source:
         self._address_payload = address_payload
 
     def fetch(self) -> List[Collection]:
-        r = requests.get(URL, headers={"Cookie": f"MyArea.Data={quote(json.dumps(self._address_payload))}"})
+        r = http_client.get(URL, headers={"Cookie": f"MyArea.Data={quote(json.dumps(self._address_payload))}"})
         r.raise_for_status()
 
         page = soup(r.text, "html.parser")
@@ -1,8 +1,7 @@
 import logging
 from datetime import datetime
 
-import requests
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "SRV Återvinning"
 DESCRIPTION = "Source for SRV återvinning AB, Sweden"
@@ -28,7 +27,7 @@ class Source:
             "city": "",
         }
         url = "https://www.srvatervinning.se/rest-api/srv-slamsok-rest-new/search"
-        r = requests.get(url, params)
+        r = http_client.get(url, params)
 
         if r.status_code != 200:
             _LOGGER.error("Error querying calendar data")
@@ -1,8 +1,7 @@
 import json
 from datetime import datetime
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "SSAM"
 DESCRIPTION = "Source for SSAM waste collection."
@@ -19,7 +18,7 @@ class Source:
 
     def fetch(self):
         params = {"searchText": self._street_address}
-        response = requests.post(
+        response = http_client.post(
             "https://edpfuture.ssam.se/FutureWeb/SimpleWastePickup/SearchAdress",
             params=params,
         )
@@ -34,7 +33,7 @@ class Source:
             return []
 
         params = {"address": address}
-        response = requests.get(
+        response = http_client.get(
             "https://edpfuture.ssam.se/FutureWeb/SimpleWastePickup/GetWastePickupSchedule",
             params=params,
         )
@@ -1,6 +1,5 @@
-import requests
 from bs4 import BeautifulSoup
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Stadt Willich"
@@ -27,7 +26,7 @@ class Source:
 
     def fetch(self):
         # get Bezirk/area ID
-        r = requests.get(
+        r = http_client.get(
             'https://www.stadt-willich.de/de/dienstleistungen/abfallkalender-als-ical-datei/',
         )
         r.raise_for_status()
@@ -45,7 +44,7 @@ class Source:
             "path": "/sys/dienstleistungslayout-abfallservice-ausgabe-2/",
             "Bezirk": area_id,
         }
-        r = requests.get(
+        r = http_client.get(
             f"https://www.stadt-willich.de/www/web_io.nsf/index.xsp",
             params=params,
         )
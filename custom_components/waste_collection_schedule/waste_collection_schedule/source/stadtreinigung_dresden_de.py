@@ -1,7 +1,6 @@
 import datetime
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Stadtreinigung Dresden"
@@ -21,7 +20,7 @@ class Source:
 
         now = datetime.datetime.now().date()
 
-        r = requests.get(
+        r = http_client.get(
             "https://stadtplan.dresden.de/project/cardo3Apps/IDU_DDStadtplan/abfall/ical.ashx",
             params={
                 "STANDORT": self._standort,
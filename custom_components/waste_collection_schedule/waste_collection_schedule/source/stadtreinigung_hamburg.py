@@ -1,5 +1,4 @@
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Stadtreinigung Hamburg"
@@ -19,7 +18,7 @@ class Source:
         args = {"hnIds": self._hnId, "adresse": "MeineAdresse"}
 
         # get ics file
-        r = requests.get(
+        r = http_client.get(
             "https://backend.stadtreinigung.hamburg/kalender/abholtermine.ics",
             params=args,
         )
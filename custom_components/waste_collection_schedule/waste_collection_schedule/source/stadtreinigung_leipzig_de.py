@@ -1,8 +1,7 @@
 import json
 import logging
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 _LOGGER = logging.getLogger(__name__)
@@ -25,7 +24,7 @@ class Source:
         }
 
         # get list of streets and house numbers
-        r = requests.get(
+        r = http_client.get(
             "https://stadtreinigung-leipzig.de/rest/wastecalendarstreets", params=params
         )
 
@@ -47,7 +46,7 @@ class Source:
         params = {
             "position_nos": id,
         }
-        r = requests.get(
+        r = http_client.get(
             "https://stadtreinigung-leipzig.de/wir-kommen-zu-ihnen/abfallkalender/ical.ics",
             params=params,
         )
@@ -1,9 +1,8 @@
 import datetime
 import logging
 
-import requests
 from bs4 import BeautifulSoup
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "StadtService Brühl"
@@ -31,7 +30,7 @@ class Source:
             "send_street_and_nummber_data": "",
         }
 
-        r = requests.post(
+        r = http_client.post(
             "https://services.stadtservice-bruehl.de/abfallkalender/", data=data
         )
 
@@ -70,7 +69,7 @@ class Source:
             "send_ics_download_configurator_data": "",
         }
 
-        r = requests.post(
+        r = http_client.post(
             "https://services.stadtservice-bruehl.de/abfallkalender/individuellen-abfuhrkalender-herunterladen/",
             data=data,
         )
@@ -1,7 +1,7 @@
 import requests
 import datetime
 
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Städteservice Raunheim Rüsselsheim"
@@ -37,7 +37,7 @@ class Source:
         year = currentDateTime.year
         month = currentDateTime.month
 
-        session = requests.Session()
+        session = http_client.session()
 
         dates = self.get_dates(session, year, month)
 
@@ -3,6 +3,7 @@ import datetime
 from dateutil import parser
 
 from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule.recurrence import get_recurrence
 
 TITLE = "Static Source"
 DESCRIPTION = "Source for static waste collection schedules."
@@ -30,6 +31,9 @@ TEST_CASES = {
 
 FREQNAMES = ["YEARLY", "MONTHLY", "WEEKLY", "DAILY"]
 
+# recurrences without until are expanded up to this many days ahead
+HORIZON_DAYS = 365
+
 
 class Source:
     def __init__(
@@ -55,16 +59,23 @@ class Source:
         dates = []
 
         if self._recurrence is not None:
-            ruledates = rrule(
-                freq=self._recurrence,
-                interval=self._interval,
-                dtstart=self._start,
-                until=self._until,
-            )
+            today = datetime.date.today()
+            start = self._start or today
+            until = self._until or today + datetime.timedelta(days=HORIZON_DAYS)
 
-            for ruleentry in ruledates:
-                date = ruleentry.date()
+            # the rule is compiled once and only expanded beyond the dates
+            # of previous fetches, see recurrence
+            recurrence = get_recurrence(
+                ("static", self._recurrence, self._interval, start, self._until),
+                lambda: rrule(
+                    freq=self._recurrence,
+                    interval=self._interval,
+                    dtstart=start,
+                    until=self._until,
+                ),
+            )
 
+            for date in recurrence.between(start, until):
                 if self._excludes is not None and date in self._excludes:
                     continue
 
@@ -1,8 +1,7 @@
 import json
-import requests
 from datetime import datetime
 
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Stevenage Borough Council"
 DESCRIPTION = "Source for stevenage.gov.uk services for Stevenage, UK."
@@ -31,7 +30,7 @@ class Source:
 
     def fetch(self):
         entries = []
-        session = requests.Session()
+        session = http_client.session()
 
         # Get Round ID and Round Code
         # Don't fully understand significance of all of the fields, but API borks if they are not present
@@ -44,7 +43,7 @@ class Source:
         }
 
         headers = {"Content-type": "application/json", "Accept": "text/plain"}
-        roundRequest = requests.post(
+        roundRequest = http_client.post(
             SEARCH_URLS["round_search"], data=json.dumps(roundData), headers=headers
         )
         roundJson = json.loads(roundRequest.text)
@@ -70,7 +69,7 @@ class Source:
             ],
         }
 
-        collectionRequest = requests.post(
+        collectionRequest = http_client.post(
             SEARCH_URLS["collection_search"],
             data=json.dumps(collectionData),
             headers=headers,
@@ -1,8 +1,7 @@
 import datetime
 from html.parser import HTMLParser
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Abfall Stuttgart"
 DESCRIPTION = "Source for waste collections for the city of Stuttgart, Germany."
@@ -98,7 +97,7 @@ class Source:
 
     def fetch(self):
         # get waste types
-        r = requests.get("https://service.stuttgart.de/lhs-services/aws/abfuhrtermine")
+        r = http_client.get("https://service.stuttgart.de/lhs-services/aws/abfuhrtermine")
         wastetypes = InputCheckboxParser(name="calendar[wastetype][]")
         wastetypes.feed(r.text)
 
@@ -113,7 +112,7 @@ class Source:
             args.append(("calendar[wastetype][]", w))
         args.append(("calendar[submit]", ""))
 
-        r = requests.post(
+        r = http_client.post(
             "https://service.stuttgart.de/lhs-services/aws/abfuhrtermine", data=args
         )
         entries_parser = TableParser()
@@ -1,8 +1,7 @@
 import json
 from datetime import datetime
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Sysav Sophämntning"
 DESCRIPTION = "Source for Sysav waste collection."
@@ -19,7 +18,7 @@ class Source:
 
     def fetch(self):
         params = {"address": self._street_address}
-        response = requests.get(
+        response = http_client.get(
             "https://www.sysav.se/api/my-pages/PickupSchedule/findAddress",
             params=params,
         )
@@ -33,7 +32,7 @@ class Source:
             return []
 
         params = {"address": address}
-        response = requests.get(
+        response = http_client.get(
             "https://www.sysav.se/api/my-pages/PickupSchedule/ScheduleForAddress",
             params=params,
         )
@@ -1,8 +1,7 @@
 from datetime import datetime
 from urllib.parse import quote as urlquote
 
-import requests
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "Tewkesbury Borough Council"
 DESCRIPTION = "Home waste collection schedule for Tewkesbury Borough Council"
@@ -32,7 +31,7 @@ class Source:
 
         encoded_postcode = urlquote(self._postcode)
         request_url = API_URL % encoded_postcode
-        response = requests.get(request_url)
+        response = http_client.get(request_url)
 
         response.raise_for_status()
         data = response.json()
@@ -2,8 +2,7 @@ import datetime
 import json
 import logging
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "The Hills Shire Council, Sydney"
 DESCRIPTION = "Source for Hills Shire Council, Sydney, Australia waste collection."
@@ -28,7 +27,7 @@ class Source:
 
     def fetch(self):
         # get list of suburbs
-        r = requests.get(f"{self._url}/suburbs/get")
+        r = http_client.get(f"{self._url}/suburbs/get")
         data = json.loads(r.text)
 
         suburbs = {}
@@ -42,7 +41,7 @@ class Source:
         suburbKey = suburbs[self._suburb]
 
         # get list of streets for selected suburb
-        r = requests.get(f"{self._url}/streets/{suburbKey}")
+        r = http_client.get(f"{self._url}/streets/{suburbKey}")
         data = json.loads(r.text)
 
         streets = {}
@@ -57,7 +56,7 @@ class Source:
 
         # get list of house numbers for selected street
         params = {"streetkey": streetKey, "suburbKey": suburbKey}
-        r = requests.get(
+        r = http_client.get(
             f"{self._url}/properties/GetPropertiesByStreetAndSuburbKey", params=params,
         )
         data = json.loads(r.text)
@@ -75,7 +74,7 @@ class Source:
         propertyKey = houseNos[self._houseNo]
 
         # get collection schedule
-        r = requests.get(f"{self._url}/services/{propertyKey}")
+        r = http_client.get(f"{self._url}/services/{propertyKey}")
         data = json.loads(r.text)
 
         entries = []
@@ -1,8 +1,9 @@
-import requests
 import csv
 import json
 
+from .. import http_cache, http_client
 from ..collection import Collection
+from ..exceptions import SourceArgumentNotFound
 
 from datetime import datetime, timedelta
 
@@ -33,6 +34,39 @@ PICTURE_MAP = {
     'YardWaste': 'https://www.toronto.ca/resources/swm_collection_calendar/img/yardwaste.png',
 }
 
+
+class _ScheduleRows:
+    """Parse function for the schedule csv, keeps only the rows of the given schedules.
+
+    All rows are kept if schedule_keys is None.
+
+    The csv is decoded and parsed line by line while it is read, so the
+    city wide file is never held in memory as a whole.
+    """
+
+    def __init__(self, schedule_keys):
+        self.schedule_keys = None if schedule_keys is None else frozenset(schedule_keys)
+
+    def __eq__(self, other):
+        return isinstance(other, _ScheduleRows) and other.schedule_keys == self.schedule_keys
+
+    def __hash__(self):
+        return hash(self.schedule_keys)
+
+    def __call__(self, response):
+        reader = csv.reader(http_client.iter_lines(response, encoding='utf-8'), delimiter=',')
+        dbkey_row = next(reader, [])
+        if 'Calendar' not in dbkey_row:
+            return [dbkey_row]
+
+        schedule_index = dbkey_row.index('Calendar')
+        rows = [dbkey_row]
+        for row in reader:
+            if len(row) > schedule_index and (self.schedule_keys is None or row[schedule_index] in self.schedule_keys):
+                rows.append(row)
+        return rows
+
+
 class Source:
     def __init__(self, street_address):
         self._street_address = street_address
@@ -51,9 +85,7 @@ class Source:
         
         return rows[0][key]
             
-    def fetch(self):
-        session = requests.Session()
-
+    def get_schedule_key(self, session):
         # lookup the address key for a particular property address
         property_download = session.get(PROPERTY_LOOKUP_URL, 
                                         params=dict(f='json', matchAddress=1, matchPlaceName=1,matchPostalCode=1,addressOnly=0,retRowLimit=100,searchString=self._street_address))
@@ -62,7 +94,7 @@ class Source:
         
         property_address_key = self.get_first_result(property_json, 'KEYSTRING')
         if property_address_key == '':
-            return
+            return None
         
         # lookup the schedule key for the above property key
         schedule_download = session.get(SCHEDULE_LOOKUP_URL, 
@@ -71,15 +103,26 @@ class Source:
         
         schedule_first_result = self.get_first_result(schedule_json, 'AREACURSOR1')
         if schedule_first_result == '':
-            return
-        
-        schedule_key = schedule_first_result['array'][0]['AREA_NAME'].replace(' ', '')
+            return None
         
-        # download schedule csv and figure out what column format
-        csv_content = session.get(CSV_URL).content.decode('utf-8')
+        return schedule_first_result['array'][0]['AREA_NAME'].replace(' ', '')
 
-        csv_lines = list(csv.reader(csv_content.splitlines(), delimiter=','))
+    @staticmethod
+    def download_csv(session, schedule_keys):
+        # download schedule csv, revalidated with a conditional GET
+        return http_cache.get(CSV_URL, _ScheduleRows(schedule_keys), session=session)
+
+    def fetch(self, csv_lines=None):
+        session = http_client.session()
+
+        schedule_key = self.get_schedule_key(session)
+        if schedule_key is None:
+            raise SourceArgumentNotFound('street_address', self._street_address)
         
+        if csv_lines is None:
+            csv_lines = self.download_csv(session, [schedule_key])
+
+        # figure out what column format
         dbkey_row = csv_lines[0]
         
         if ('_id' not in dbkey_row) or ('Calendar' not in dbkey_row) or ('WeekStarting') not in dbkey_row:
@@ -117,3 +160,9 @@ class Source:
                     entries.append(Collection(waste_day.date(), waste_type, picture=pic, icon=icon))
         
         return entries
+
+    @classmethod
+    def prepare_many(cls, args_list):
+        """Download the city wide csv only once for many addresses."""
+        csv_lines = cls.download_csv(http_client.session(), None)
+        return [csv_lines] * len(args_list)
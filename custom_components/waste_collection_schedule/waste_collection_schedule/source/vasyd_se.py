@@ -1,8 +1,7 @@
 import json
 from datetime import datetime
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "VA Syd Sophämntning"
 DESCRIPTION = "Source for VA Syd waste collection."
@@ -19,7 +18,7 @@ class Source:
 
     def fetch(self):
         data = {"query": self._street_address}
-        response = requests.post(
+        response = http_client.post(
             "https://www.vasyd.se/api/sitecore/MyPagesApi/BuildingAddressSearch",
             data=data,
         )
@@ -33,7 +32,7 @@ class Source:
             return []
 
         data = {"query": building_id, "street": self._street_address}
-        response = requests.post(
+        response = http_client.post(
             "https://www.vasyd.se/api/sitecore/MyPagesApi/WastePickupByAddress",
             data=data,
         )
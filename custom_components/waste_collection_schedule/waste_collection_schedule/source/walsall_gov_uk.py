@@ -1,10 +1,9 @@
 import logging
-import requests
 
 from bs4 import BeautifulSoup
 from datetime import datetime
 
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "Walsall Council"
 DESCRIPTION = "Source for waste collection services from Walsall Council"
@@ -36,7 +35,7 @@ class Source:
 
     def fetch(self):
 
-        s = requests.Session()
+        s = http_client.session()
 
         if self._uprn:
             # GET request returns page containing links to separate collection schedules
@@ -1,8 +1,7 @@
 import logging
 from datetime import datetime
 
-import requests
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "Warsaw"
 DESCRIPTION = "Source for Warsaw city garbage collection"
@@ -54,7 +53,7 @@ class Source:
         self._geolocation_id = geolocation_id
 
     def get_geolocation_id(self, street_address) -> str:
-        geolocation_session = requests.Session()
+        geolocation_session = http_client.session()
         geolocation_request = geolocation_session.get(OC_URL)
         geolocation_request.raise_for_status()
 
@@ -97,7 +96,7 @@ class Source:
             self._geolocation_id = self.get_geolocation_id(self._street_address)
 
         # Calendar lookup cares about a cookie, so a Session must be used
-        calendar_session = requests.Session()
+        calendar_session = http_client.session()
         calendar_request = calendar_session.get(OC_URL)
         calendar_request.raise_for_status()
 
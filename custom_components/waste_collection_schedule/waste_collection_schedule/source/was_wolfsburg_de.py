@@ -1,8 +1,7 @@
 import datetime
 import re
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Wolfsburger Abfallwirtschaft und Straßenreinigung"
@@ -20,7 +19,7 @@ class Source:
     def fetch(self):
         # fetch "Gelber Sack"
         args = {"g": self._city}
-        r = requests.get(
+        r = http_client.get(
             "https://was-wolfsburg.de/subgelberweihgarten/php/abfuhrgelber.php",
             params=args,
         )
@@ -33,7 +32,7 @@ class Source:
 
         # fetch remaining collections
         args = {"ortabf": self._street}
-        r = requests.post(
+        r = http_client.post(
             "https://was-wolfsburg.de/subabfuhrtermine/ics_abfuhrtermine3.php",
             data=args,
         )
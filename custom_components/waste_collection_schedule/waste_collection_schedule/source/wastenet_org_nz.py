@@ -2,8 +2,7 @@ import datetime
 import re
 from html.parser import HTMLParser
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Gore, Invercargill & Southland"
 DESCRIPTION = "Source for Wastenet.org.nz."
@@ -90,7 +89,7 @@ class Source:
         # get token
         params = {"view": 1, "address": self._address}
 
-        r = requests.get(
+        r = http_client.get(
             "http://www.wastenet.org.nz/RecycleRubbish/WasteCollectionSearch.aspx",
             params=params,
         )
@@ -1,8 +1,7 @@
 import datetime
 import json
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Wellington City Council"
@@ -38,7 +37,7 @@ class Source:
         if self._streetName:
             url = "https://wellington.govt.nz/layouts/wcc/GeneralLayout.aspx/GetRubbishCollectionStreets"
             data = {"partialStreetName": self._streetName}
-            r = requests.post(url, json=data)
+            r = http_client.post(url, json=data)
             data = json.loads(r.text)
             if len(data["d"]) == 0:
                 raise Exception(f"No result found for streetName {self._streetName}")
@@ -57,7 +56,7 @@ class Source:
             "streetId": self._streetId,
             "forDate": datetime.date.today(),
         }
-        r = requests.get(url, params=params)
+        r = http_client.get(url, params=params)
 
         if not r.text.startswith("BEGIN:VCALENDAR"):
             raise Exception(f"{self._streetId} is not a valid streetID")
@@ -1,7 +1,6 @@
 from datetime import datetime
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Wermelskirchen"
@@ -71,11 +70,10 @@ class Source:
             "tx_citkoabfall_abfallkalender[abfallarten][8]": 75,
             "tx_citkoabfall_abfallkalender[abfallarten][9]": 74,
         }
-        r = requests.get(url, params=params)
+        r = http_client.get(url, params=params)
         r.raise_for_status()
 
-        r.encoding = "utf-8"
-        dates = self._ics.convert(r.text)
+        dates = self._ics.convert(r.content)
 
         entries = []
         for d in dates:
@@ -2,9 +2,8 @@ from datetime import date, datetime
 
 import time
 import json
-import requests
 
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "West Berkshire Council"
 DESCRIPTION = "Source for westberks.gov.uk services for West Berkshire Council"
@@ -38,14 +37,14 @@ class Source:
 
     def fetch(self):
         entries = []
-        session = requests.Session()
+        session = http_client.session()
 
         # Find the UPRN based on the postcode and the property name/number
         if self._uprn is None:
             self._postcode = self._postcode.strip()
             jsonrpc = {"id": str(int(time.time())),"method": "location.westberks.echoPostcodeFinder","params": {"provider": "",  "postcode": self._postcode}}
             args = { "callback": "HomeAssistant", "jsonrpc": json.dumps(jsonrpc), "_": 0 }
-            r = requests.get(SEARCH_URLS["uprn_search"], params = args)
+            r = http_client.get(SEARCH_URLS["uprn_search"], params = args)
             
             # I don't really know python so there *must* be a better way to do these four lines!
             response_str = r.content.decode("utf-8")
@@ -1,8 +1,7 @@
 from datetime import date, datetime
 
-import requests
 from bs4 import BeautifulSoup
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "Wiltshire Council"
 DESCRIPTION = "Source for wiltshire.gov.uk services for Wiltshire Council"
@@ -55,7 +54,7 @@ class Source:
             "Year": fetch_month.year,
         }
 
-        r = requests.post(SEARCH_URLS["collection_search"], params=args)
+        r = http_client.post(SEARCH_URLS["collection_search"], params=args)
         r.raise_for_status()
 
         soup = BeautifulSoup(r.text, "html.parser")
@@ -1,8 +1,7 @@
 import datetime
 import json
 
-import requests
-from waste_collection_schedule import Collection
+from waste_collection_schedule import Collection, http_client
 
 TITLE = "WSZ Moosburg"
 DESCRIPTION = (
@@ -57,7 +56,7 @@ class Source:
             raise Exception("Invalid argument count")
 
     def fetch(self):
-        r = requests.get(f"https://wsz-moosburg.at/api/trash/{self._address_id}")
+        r = http_client.get(f"https://wsz-moosburg.at/api/trash/{self._address_id}")
         r.raise_for_status()
 
         trashResponse = json.loads(r.text)
@@ -76,7 +75,7 @@ class Source:
     def get_address_id_from_address(self, municipal, address, street):
         municipal_id = MUNICIPAL_CHOICES[municipal]
 
-        r = requests.get(f"https://wsz-moosburg.at/api/address/{municipal_id}")
+        r = http_client.get(f"https://wsz-moosburg.at/api/address/{municipal_id}")
         addressData = json.loads(r.text)["address"]
         address = [x for x in addressData if x["address"]["name"] == address][0][
             "address"
@@ -86,7 +85,7 @@ class Source:
         # Additional request only needed if at least one street will be there to select,
         # otherwise the final area ID is already returned in the address request.
         if int(address["sub"]) > 0:
-            r = requests.get(
+            r = http_client.get(
                 f"https://wsz-moosburg.at/api/address/{municipal_id}/{address['id']}"
             )
             streetData = json.loads(r.text)["address"]
@@ -1,8 +1,7 @@
 import datetime
 
-import requests
 from bs4 import BeautifulSoup
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Abfallkalender Würzburg"
 DESCRIPTION = "Source for waste collection in the city of Würzburg, Germany."
@@ -33,7 +32,7 @@ class Source:
         if not district and not street:
             raise ValueError("One of ['district', 'street'] is required.")
 
-        r = requests.get(API_URL, headers=HEADERS)
+        r = http_client.get(API_URL, headers=HEADERS)
         r.raise_for_status()
         selects = BeautifulSoup(r.content, "html.parser").body.find_all("select")
 
@@ -79,7 +78,7 @@ class Source:
 
         now = datetime.datetime.now().date()
 
-        r = requests.get(
+        r = http_client.get(
             API_URL,
             headers=HEADERS,
             params={
@@ -1,8 +1,7 @@
 import logging
 
-import requests
 from bs4 import BeautifulSoup
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from datetime import datetime
 
 TITLE = "Wyndham City Council, Melbourne"
@@ -30,7 +29,7 @@ class Source:
         self._street_address = street_address
 
     def fetch(self):
-        session = requests.Session()
+        session = http_client.session()
         response = session.get(API_URL)
         response.raise_for_status()
         response = session.get("https://digital.wyndham.vic.gov.au/myWyndham/ajax/address-search-suggestions.asp?",
@@ -1,7 +1,6 @@
 from datetime import datetime, timedelta
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "Ximmio"
 DESCRIPTION = "Source for Ximmio B.V. waste collection."
@@ -131,7 +130,7 @@ class Source:
             "houseNumber": self._house_number,
             "companyCode": self._company_code,
         }
-        r = requests.post(f"{self._url}/api/FetchAdress", data=data)
+        r = http_client.post(f"{self._url}/api/FetchAdress", data=data)
         d = r.json()
 
         dataList = d["dataList"][0]
@@ -142,7 +141,7 @@ class Source:
             "companyCode": self._company_code,
             "community": dataList.get("Community", ""),
         }
-        r = requests.post(f"{self._url}/api/GetCalendar", data=data)
+        r = http_client.post(f"{self._url}/api/GetCalendar", data=data)
         d = r.json()
 
         entries = []
@@ -1,8 +1,7 @@
 import json
 from datetime import datetime
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 
 TITLE = "City of York Council"
 DESCRIPTION = "Source for York.gov.uk services for the city of York, UK."
@@ -25,7 +24,7 @@ class Source:
 
     def fetch(self):
         # get json file
-        r = requests.get(
+        r = http_client.get(
             f"https://waste-api.york.gov.uk/api/Collections/GetBinCalendarDataForUprn/{self._uprn}"
         )
 
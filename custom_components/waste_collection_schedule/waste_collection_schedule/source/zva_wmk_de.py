@@ -1,7 +1,6 @@
 import datetime
 
-import requests
-from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule import Collection, http_client  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
 
 TITLE = "Abfallwirtschaft Werra-Meißner-Kreis"
@@ -41,7 +40,7 @@ class Source:
 
         params = {"city": self._city, "street": street, "type": "all", "link": "ical"}
 
-        r = requests.get(
+        r = http_client.get(
             f"https://www.zva-wmk.de/termine/schnellsuche{yearstr}", params=params
         )
         r.raise_for_status()
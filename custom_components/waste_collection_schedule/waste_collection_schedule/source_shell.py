@@ -1,10 +1,21 @@
+import asyncio
+import concurrent.futures
+import copy
 import datetime
 import importlib
 import logging
+import threading
 import traceback
 from typing import Dict, List, Optional
 
+from . import deadline, http_client
 from .collection import Collection
+from .deadline import DEFAULT_FETCH_TIMEOUT, fetch_deadline
+from .exceptions import CircuitOpenError, FetchTimeoutError
+from .network_stats import get_network_stats
+from .resilience import get_resilience
+from .single_flight import get_single_flight
+from .snapshot_store import SnapshotStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -92,6 +103,9 @@ class SourceShell:
         url: Optional[str],
         calendar_title: Optional[str],
         unique_id: str,
+        snapshot_store: Optional[SnapshotStore] = None,
+        fetch_timeout: Optional[float] = DEFAULT_FETCH_TIMEOUT,
+        source_args: Optional[Dict] = None,
     ):
         self._source = source
         self._customize = customize
@@ -101,7 +115,14 @@ class SourceShell:
         self._calendar_title = calendar_title
         self._unique_id = unique_id
         self._refreshtime = None
+        self._last_error: Optional[Exception] = None
+        self._last_failure: Optional[datetime.datetime] = None
+        self._refresh_lock = threading.Lock()
+        self._refresh_future: Optional[concurrent.futures.Future] = None
         self._entries: List[Collection] = []
+        self._snapshot_store = snapshot_store
+        self._fetch_timeout = fetch_timeout
+        self._source_args = source_args
 
     @property
     def refreshtime(self):
@@ -123,21 +144,283 @@ class SourceShell:
     def calendar_title(self):
         return self._calendar_title or self._title
 
+    @property
+    def source(self):
+        return self._source
+
+    @property
+    def source_args(self):
+        return self._source_args
+
     @property
     def unique_id(self):
         return self._unique_id
 
-    def fetch(self):
-        """Fetch data from source."""
+    @property
+    def snapshot_store(self) -> Optional[SnapshotStore]:
+        return self._snapshot_store
+
+    @property
+    def entries(self) -> List[Collection]:
+        """Return the customized entries of the last successful fetch."""
+        return self._entries
+
+    def network_stats(self) -> Dict[str, Dict]:
+        """Return request statistics per host of this source, see network_stats."""
+        return get_network_stats().stats(self._unique_id)
+
+    @property
+    def last_error(self):
+        """Return the exception raised by the last fetch, None on success."""
+        return self._last_error
+
+    @property
+    def last_success(self):
+        """Return timestamp of the last successful fetch (same as refreshtime)."""
+        return self._refreshtime
+
+    @property
+    def last_failure(self):
+        """Return timestamp of the last failed fetch."""
+        return self._last_failure
+
+    @property
+    def age(self) -> Optional[datetime.timedelta]:
+        """Return age of the served entries, None if there are none yet."""
+        if self._refreshtime is None:
+            return None
+        return datetime.datetime.now() - self._refreshtime
+
+    @property
+    def stale(self):
+        """Return True if the last fetch failed and old entries are served."""
+        return self._last_failure is not None and (
+            self._refreshtime is None or self._last_failure > self._refreshtime
+        )
+
+    @property
+    def refreshing(self):
+        """Return True if a background refresh is in progress."""
+        future = self._refresh_future
+        return future is not None and not future.done()
+
+    def needs_refresh(
+        self,
+        max_age: datetime.timedelta,
+        retry_interval: Optional[datetime.timedelta] = None,
+    ):
+        """Return True if the entries are stale or older than max_age.
+
+        After a failed fetch, no refresh is needed before retry_interval
+        has passed.
+        """
+        if self.stale and retry_interval is not None:
+            if datetime.datetime.now() - self._last_failure < retry_interval:
+                return False
+            return True
+        age = self.age
+        return self.stale or age is None or age > max_age
+
+    def fetch_in_background(self, executor: concurrent.futures.Executor):
+        """Schedule a fetch on executor, unless one is already in progress.
+
+        The current entries are served until the fetch succeeds and are
+        kept if it fails. Returns the future of the (already) running fetch.
+        """
+        with self._refresh_lock:
+            if self.refreshing:
+                return self._refresh_future
+            self._refresh_future = executor.submit(self.fetch)
+            return self._refresh_future
+
+    def fetch(self, prepared=None):
+        """Fetch data from source.
+
+        prepared is passed to Source.fetch(), see prepare_batch().
+        """
         try:
-            # fetch returns a list of Collection's
-            entries = self._source.fetch()
-        except Exception:
+            entries = self._fetch_shared(prepared)
+        except Exception as error:
+            self._fetch_failed(error)
+            return
+        self._fetch_succeeded(entries)
+
+    @property
+    def batchable(self):
+        """Return True if the source can prepare many addresses at once."""
+        return self._source_args is not None and hasattr(
+            type(self._source), "prepare_many"
+        )
+
+    @property
+    def batch_key(self):
+        """Return key of shells which can be prepared in the same batch."""
+        return type(self._source)
+
+    @staticmethod
+    def prepare_batch(shells: List["SourceShell"]) -> Dict[str, object]:
+        """Run the shared setup of shells with the same batchable source class.
+
+        Source.prepare_many() is called once with the args of all shells
+        (identical configurations and known permanent failures excluded)
+        and returns a value per args, which is passed to Source.fetch() by
+        fetch(). Returns the prepared values by unique_id, which is empty
+        if the preparation failed: the shells then fetch without.
+        """
+        source_class = shells[0].batch_key
+        module = source_class.__module__.rsplit(".", 1)[-1]
+        resilience = get_resilience()
+
+        leaders: Dict[str, SourceShell] = {}
+        for shell in shells:
+            if resilience.cached_failure(shell.unique_id) is None:
+                leaders.setdefault(shell.unique_id, shell)
+        if not leaders:
+            return {}
+
+        timeouts = [s._fetch_timeout for s in leaders.values()]
+        timeout = None if None in timeouts else min(timeouts)
+
+        def prepare():
+            with fetch_deadline(timeout), http_client.source_context(*leaders):
+                prepared = source_class.prepare_many(
+                    [s._source_args for s in leaders.values()]
+                )
+            if len(prepared) != len(leaders):
+                raise RuntimeError(
+                    f"{module}.prepare_many returned {len(prepared)} values for {len(leaders)} args"
+                )
+            return prepared
+
+        try:
+            prepared = resilience.call(None, prepare)
+        except Exception as error:
+            _LOGGER.warning(
+                f"preparing {len(leaders)} sources of {module} failed, fetching them one by one: {error}"
+            )
+            return {}
+        return dict(zip(leaders.keys(), prepared))
+
+    def _fetch_shared(self, prepared=None):
+        """Fetch from source, sharing in-flight fetches of identical sources.
+
+        Shells with the same unique_id (same source and args) which fetch
+        concurrently only cause one upstream fetch. The returned list is
+        shared and must not be modified.
+
+        All requests of the fetch, including retries, share one deadline of
+        fetch_timeout seconds.
+        """
+
+        def fetch_source():
+            if prepared is None:
+                return self._source.fetch()
+            return self._source.fetch(prepared)
+
+        def fetch():
+            with fetch_deadline(self._fetch_timeout), http_client.source_context(
+                self._unique_id
+            ):
+                # fetch returns a list of Collection's
+                return get_resilience().call(self._unique_id, fetch_source)
+
+        entries, _ = get_single_flight().do(self._unique_id, fetch)
+        return entries
+
+    async def _fetch_shared_async(self):
+        """Await fetch_async() of the source, see _fetch_shared().
+
+        The fetch gets the same deadline, retries, negative cache and
+        sharing of in-flight fetches as the fetches of sync sources.
+        """
+
+        async def fetch_source():
+            try:
+                return await asyncio.wait_for(
+                    self._source.fetch_async(), deadline.remaining()
+                )
+            except asyncio.TimeoutError as error:
+                raise FetchTimeoutError() from error
+
+        async def fetch():
+            with fetch_deadline(self._fetch_timeout), http_client.source_context(
+                self._unique_id
+            ):
+                return await get_resilience().call_async(self._unique_id, fetch_source)
+
+        entries, _ = await get_single_flight().do_async(self._unique_id, fetch)
+        return entries
+
+    async def fetch_async(self, executor=None):
+        """Fetch data from source without blocking the event loop.
+
+        Sources implementing fetch_async() are awaited directly, legacy
+        sources are run in the given executor (default executor if None).
+        """
+        try:
+            if hasattr(self._source, "fetch_async"):
+                entries = await self._fetch_shared_async()
+            else:
+                loop = asyncio.get_running_loop()
+                entries = await loop.run_in_executor(executor, self._fetch_shared)
+        except Exception as error:
+            self._fetch_failed(error)
+            return
+        self._fetch_succeeded(entries)
+
+    def _fetch_failed(self, error):
+        self._last_error = error
+        self._last_failure = datetime.datetime.now()
+        if isinstance(error, CircuitOpenError):
+            _LOGGER.warning(f"fetch skipped for source {self._title}: {error}")
+            return
+        if isinstance(error, FetchTimeoutError):
             _LOGGER.error(
-                f"fetch failed for source {self._title}:\n{traceback.format_exc()}"
+                f"fetch timed out for source {self._title} after {self._fetch_timeout}s"
             )
             return
+        tb = "".join(
+            traceback.format_exception(type(error), error, error.__traceback__)
+        )
+        _LOGGER.error(f"fetch failed for source {self._title}:\n{tb}")
+
+    def _fetch_succeeded(self, entries):
+        self._last_error = None
         self._refreshtime = datetime.datetime.now()
+        self._set_entries(entries)
+
+        if self._snapshot_store is not None:
+            try:
+                self._snapshot_store.save(self._unique_id, self._refreshtime, entries)
+            except Exception:
+                _LOGGER.warning(
+                    f"saving snapshot failed for source {self._title}:\n{traceback.format_exc()}"
+                )
+
+    def restore_snapshot(self):
+        """Load last fetched entries from snapshot store.
+
+        Returns True if a snapshot has been found.
+        """
+        if self._snapshot_store is None:
+            return False
+        try:
+            snapshot = self._snapshot_store.load(self._unique_id)
+        except Exception:
+            _LOGGER.warning(
+                f"loading snapshot failed for source {self._title}:\n{traceback.format_exc()}"
+            )
+            return False
+        if snapshot is None:
+            return False
+        self._refreshtime, entries = snapshot
+        self._set_entries(entries)
+        return True
+
+    def _set_entries(self, entries):
+        """Apply customization to raw source entries and store them."""
+        # entries might be shared with other shells, customize a copy
+        entries = [copy.copy(e) for e in entries]
 
         # strip whitespaces
         for e in entries:
@@ -182,6 +465,7 @@ class SourceShell:
         customize: Dict[str, Customize],
         source_args,
         calendar_title: Optional[str] = None,
+        snapshot_store: Optional[SnapshotStore] = None,
     ):
         # load source module
         try:
@@ -204,8 +488,13 @@ class SourceShell:
             url=source_module.URL,  # type: ignore[attr-defined]
             calendar_title=calendar_title,
             unique_id=calc_unique_source_id(source_name, source_args),
+            snapshot_store=snapshot_store,
+            source_args=source_args,
         )
 
+        # warm start: serve last known entries until the first fetch
+        g.restore_snapshot()
+
         return g
 
 
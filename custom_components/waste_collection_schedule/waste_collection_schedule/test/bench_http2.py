@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""Compare HTTP/1.1 and HTTP/2 for multi-step source flows.
+
+Starts a local stand-in server which speaks HTTP/1.1 and HTTP/2 (prior
+knowledge, without TLS) and delays every connection setup and every
+response to simulate a remote server. Then runs a number of concurrent
+flows, each a sequence of dependent requests like the ones of seattle_gov
+or regioentsorgung_de, once with the default HTTP/1.1 adapter and once with
+the HTTP/2 adapter.
+
+Requires httpx with HTTP/2 support: pip install httpx[http2]
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import logging
+import multiprocessing
+import site
+import time
+from pathlib import Path
+
+H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+
+class StandInServer:
+    """Minimal HTTP/1.1 and HTTP/2 server with artificial latency.
+
+    Runs in its own process, so that it doesn't compete with the client for
+    the GIL.
+    """
+
+    def __init__(self, rtt: float, handshake_rtts: int, size: int):
+        self._rtt = rtt
+        self._handshake_rtts = handshake_rtts
+        self._body = b"x" * size
+        self._connections = multiprocessing.Value("q", 0, lock=False)
+        self._bytes_received = multiprocessing.Value("q", 0, lock=False)
+        self._process = None
+        self.port = None
+
+    @property
+    def connections(self) -> int:
+        return self._connections.value
+
+    @property
+    def bytes_received(self) -> int:
+        return self._bytes_received.value
+
+    def start(self):
+        ports = multiprocessing.Queue()
+        self._process = multiprocessing.Process(
+            target=self._serve, args=(ports,), daemon=True
+        )
+        self._process.start()
+        self.port = ports.get(timeout=10)
+
+    def stop(self):
+        self._process.terminate()
+
+    def _serve(self, ports):
+        loop = asyncio.new_event_loop()
+        server = loop.run_until_complete(
+            asyncio.start_server(self._handle, "127.0.0.1", 0)
+        )
+        ports.put(server.sockets[0].getsockname()[1])
+        loop.run_forever()
+
+    def reset(self):
+        self._connections.value = 0
+        self._bytes_received.value = 0
+
+    async def _read(self, reader, n=65536):
+        data = await reader.read(n)
+        self._bytes_received.value += len(data)
+        return data
+
+    async def _handle(self, reader, writer):
+        self._connections.value += 1
+        # TCP and TLS handshake
+        await asyncio.sleep(self._handshake_rtts * self._rtt)
+        try:
+            data = await reader.readexactly(len(H2_PREFACE))
+            self._bytes_received.value += len(data)
+            if data == H2_PREFACE:
+                await self._handle_h2(reader, writer, data)
+            else:
+                await self._handle_h1(reader, writer, data)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_h1(self, reader, writer, buffer):
+        while True:
+            while b"\r\n\r\n" not in buffer:
+                data = await self._read(reader)
+                if not data:
+                    return
+                buffer += data
+            head, buffer = buffer.split(b"\r\n\r\n", 1)
+            length = 0
+            for line in head.split(b"\r\n")[1:]:
+                name, _, value = line.partition(b":")
+                if name.strip().lower() == b"content-length":
+                    length = int(value)
+            while len(buffer) < length:
+                buffer += await self._read(reader)
+            buffer = buffer[length:]
+
+            await asyncio.sleep(self._rtt)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: text/plain\r\n"
+                b"Set-Cookie: session=0123456789abcdef; Path=/\r\n"
+                + f"Content-Length: {len(self._body)}\r\n\r\n".encode()
+                + self._body
+            )
+            await writer.drain()
+
+    async def _handle_h2(self, reader, writer, preface):
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False)
+        )
+        conn.initiate_connection()
+
+        async def respond(stream_id):
+            await asyncio.sleep(self._rtt)
+            conn.send_headers(
+                stream_id,
+                [
+                    (":status", "200"),
+                    ("content-type", "text/plain"),
+                    ("set-cookie", "session=0123456789abcdef; Path=/"),
+                    ("content-length", str(len(self._body))),
+                ],
+            )
+            conn.send_data(stream_id, self._body, end_stream=True)
+            writer.write(conn.data_to_send())
+
+        data = preface
+        while data:
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.DataReceived):
+                    conn.acknowledge_received_data(
+                        event.flow_controlled_length, event.stream_id
+                    )
+                elif isinstance(event, h2.events.StreamEnded):
+                    asyncio.ensure_future(respond(event.stream_id))
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            writer.write(conn.data_to_send())
+            await writer.drain()
+            data = await self._read(reader)
+
+
+def run_flows(client, url: str, flows: int, steps: int) -> float:
+    """Run flows concurrently, return the wall time."""
+
+    def flow(i):
+        with client.session() as s:
+            for step in range(steps):
+                if step % 2:
+                    r = s.post(
+                        url, data={"flow": i, "step": step, "payload": "y" * 200}
+                    )
+                else:
+                    r = s.get(url, params={"flow": i, "step": step})
+                r.raise_for_status()
+
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=flows) as executor:
+        list(executor.map(flow, range(flows)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTTP/1.1 vs. HTTP/2.")
+    parser.add_argument(
+        "--flows", type=int, default=20, help="Number of concurrent flows"
+    )
+    parser.add_argument(
+        "--steps", type=int, default=6, help="Number of requests per flow"
+    )
+    parser.add_argument(
+        "--rtt", type=float, default=0.05, help="Simulated round trip time in seconds"
+    )
+    parser.add_argument(
+        "--handshake-rtts",
+        type=int,
+        default=3,
+        help="Round trips per connection setup (TCP + TLS)",
+    )
+    parser.add_argument(
+        "--size", type=int, default=2000, help="Response body size in bytes"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Number of runs per protocol"
+    )
+    args = parser.parse_args()
+
+    package_dir = Path(__file__).resolve().parents[2]
+    site.addsitedir(str(package_dir))
+    from waste_collection_schedule import http2, http_client
+    from waste_collection_schedule.rate_limiter import get_rate_limiter
+
+    if not http2.is_available():
+        parser.error("httpx with HTTP/2 support is not installed")
+
+    # pool overflow warnings of urllib3 are expected with many flows
+    logging.getLogger("urllib3").setLevel(logging.ERROR)
+
+    server = StandInServer(args.rtt, args.handshake_rtts, args.size)
+    server.start()
+    url = f"http://127.0.0.1:{server.port}/api"
+    # measure the protocols, not the politeness limits for real servers
+    get_rate_limiter().configure("127.0.0.1", rate=None, max_connections=None)
+
+    print(
+        f"{args.flows} flows x {args.steps} requests, rtt {args.rtt * 1000:.0f}ms, "
+        f"{args.handshake_rtts} rtt per connection setup"
+    )
+    for protocol in ("HTTP/1.1", "HTTP/2"):
+        times = []
+        for _ in range(args.repeat):
+            client = http_client.HttpClient()
+            if protocol == "HTTP/2":
+                client.register_adapter(
+                    http_client.DEFAULT_ADAPTER,
+                    http2.Http2Adapter(
+                        prior_knowledge=True, default_timeout=client.timeout
+                    ),
+                )
+            server.reset()
+            times.append(run_flows(client, url, args.flows, args.steps))
+            client.close()
+        print(
+            f"{protocol:<9} best {min(times):.3f}s  mean {sum(times) / len(times):.3f}s  "
+            f"connections {server.connections}  bytes sent {server.bytes_received}"
+        )
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""Benchmark and compare the ICS parser backends.
+
+Runs every registered backend of service/ICS.py over a corpus of calendars
+and prints parse time, peak memory and the number of calendars whose events
+differ from the reference backend.
+
+The corpus consists of the calendars recorded in the cassettes of the given
+sources (see test_sources.py --record) and the given .ics files. Without
+either, calendars of standin_server and the .ics files of this directory
+are used.
+
+Example:
+    test_sources.py -s abfall_io --record cassettes
+    bench_ics.py --cassettes cassettes
+"""
+
+import argparse
+import datetime
+import site
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+
+DEFAULT_SOURCES = ["abfall_io", "muellmax_de", "ics"]
+
+
+def load_calendars(cassette_dir, sources):
+    """Return calendar bodies per source recorded in the cassettes."""
+    from waste_collection_schedule import cassette
+
+    calendars = {}
+    for source in sources:
+        filename = Path(cassette_dir) / f"{source}.json.gz"
+        if not filename.exists():
+            print(f"no cassette {filename}, skipped")
+            continue
+        for c in cassette.load_cassettes(str(filename)).values():
+            for interaction in c.interactions:
+                body = cassette._decode_body(interaction["response"]["body"])
+                if b"BEGIN:VCALENDAR" in body:
+                    calendars.setdefault(source, []).append(body)
+    return calendars
+
+
+def generate_calendars(count):
+    """Return calendars of the stand-in server, one and two years long."""
+    from standin_server import collection_dates, render_ics
+
+    year = datetime.date.today().year
+    return {
+        "standin 1 year": [
+            render_ics(collection_dates(str(i), year)).encode("utf-8")
+            for i in range(count)
+        ],
+        "standin 2 years": [
+            render_ics(
+                collection_dates(str(i), year) + collection_dates(str(i), year + 1)
+            ).encode("utf-8")
+            for i in range(count)
+        ],
+    }
+
+
+def _normalize(events):
+    """Return events as sorted (date, summary) list, independent of the order."""
+    return sorted(
+        (start.date() if isinstance(start, datetime.datetime) else start, summary)
+        for start, summary in events
+    )
+
+
+def run(parse, bodies, start, end):
+    """Return normalized events (or the exception) per calendar."""
+    results = []
+    for body in bodies:
+        try:
+            results.append(_normalize(parse(body, start, end)))
+        except Exception as error:
+            results.append(error)
+    return results
+
+
+def best_time(parse, bodies, start, end, repeat):
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        run(parse, bodies, start, end)
+        times.append(time.perf_counter() - t)
+    return min(times)
+
+
+def peak_memory(parse, bodies, start, end):
+    """Return the peak of memory allocated while parsing a calendar."""
+    peak = 0
+    for body in bodies:
+        tracemalloc.start()
+        try:
+            parse(body, start, end)
+        except Exception:
+            pass
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the ICS backends.")
+    parser.add_argument("--cassettes", help="Directory with recorded cassettes")
+    parser.add_argument(
+        "--sources",
+        default=",".join(DEFAULT_SOURCES),
+        help="Comma separated sources whose cassettes are used",
+    )
+    parser.add_argument("files", nargs="*", help="Additional .ics files")
+    parser.add_argument(
+        "--backends", help="Comma separated backends to run, default all"
+    )
+    parser.add_argument(
+        "--reference",
+        default="icalevents",
+        help="Backend the others are compared with",
+    )
+    parser.add_argument(
+        "--count", type=int, default=50, help="Number of generated calendars"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Number of runs per backend"
+    )
+    parser.add_argument(
+        "--diff", type=int, default=0, help="Print up to N differing events"
+    )
+    args = parser.parse_args()
+
+    package_dir = Path(__file__).resolve().parents[2]
+    site.addsitedir(str(package_dir))
+    from waste_collection_schedule.service import ICS
+
+    names = args.backends.split(",") if args.backends else ICS.backends()
+    if args.reference not in names:
+        names.insert(0, args.reference)
+    backends = {name: ICS.get_backend(name) for name in names}
+
+    calendars = {}
+    if args.cassettes:
+        calendars.update(load_calendars(args.cassettes, args.sources.split(",")))
+    files = args.files
+    if not calendars and not files:
+        calendars.update(generate_calendars(args.count))
+        files = sorted(str(p) for p in Path(__file__).parent.glob("*.ics"))
+    for filename in files:
+        calendars.setdefault("files", []).append(Path(filename).read_bytes())
+
+    start = datetime.datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    end = start.replace(year=start.year + 1)
+
+    print(
+        f"{'calendars':<18} {'backend':<22} {'count':>5} {'events':>7} "
+        f"{'time':>9} {'peak mem':>9} {'errors':>6} {'differ':>6}"
+    )
+    totals: Counter = Counter()
+    for group, bodies in calendars.items():
+        reference = run(backends[args.reference], bodies, start, end)
+        for name, parse in backends.items():
+            results = (
+                reference if name == args.reference else run(parse, bodies, start, end)
+            )
+            elapsed = best_time(parse, bodies, start, end, args.repeat)
+            peak = peak_memory(parse, bodies, start, end)
+            events = sum(len(r) for r in results if isinstance(r, list))
+            errors = sum(isinstance(r, Exception) for r in results)
+            differ = [
+                (i, r, ref)
+                for i, (r, ref) in enumerate(zip(results, reference))
+                if r != ref
+            ]
+            totals[name] += elapsed
+            print(
+                f"{group:<18} {name:<22} {len(bodies):>5} {events:>7} "
+                f"{elapsed * 1000:>7.1f}ms {peak / 1024:>7.0f}kB {errors:>6} "
+                f"{len(differ):>6}"
+            )
+            shown = 0
+            for i, r, ref in differ:
+                if shown >= args.diff:
+                    break
+                if isinstance(r, Exception) or isinstance(ref, Exception):
+                    print(f"  calendar {i}: {r!r} vs. {ref!r}")
+                    shown += 1
+                    continue
+                for event in sorted(set(r) ^ set(ref)):
+                    side = "only" if event in r else "missing"
+                    print(f"  calendar {i}: {side} {event[0]} {event[1]}")
+                    shown += 1
+
+    print("total: " + ", ".join(f"{n} {t * 1000:.1f}ms" for n, t in totals.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Refresh many generated addresses against the local stand-in server.
+
+Creates a SourceShell per address, spread over the provider families of
+standin_server, and refreshes all of them with a FetchExecutor. All requests
+are sent to the stand-in server, nothing leaves the machine.
+
+Example, 10000 addresses with 50ms latency and 1% errors:
+    load_test.py --addresses 10000 --latency 0.05 --error-rate 0.01
+"""
+
+import argparse
+import logging
+import site
+import time
+from collections import Counter
+from pathlib import Path
+
+# hosts of the emulated providers, see standin_server
+STANDIN_HOSTS = [
+    "abfall.io",
+    "regioit.de",
+    "azurewebsites.net",
+    "muellmax.de",
+    "standin.test",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Load test source refreshes against the stand-in server."
+    )
+    parser.add_argument(
+        "--addresses", type=int, default=1000, help="Number of sources to refresh"
+    )
+    parser.add_argument(
+        "--families",
+        default=None,
+        help="Comma separated provider families, default all",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=2, help="Number of server processes"
+    )
+    parser.add_argument(
+        "--max-workers", type=int, default=16, help="Fetch threads of the client"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=1, help="Max batch size of prepare_many()"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Response delay in seconds"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="Random +/- variation of latency"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Share of 503 responses"
+    )
+    parser.add_argument(
+        "--polite",
+        action="store_true",
+        help="Keep the rate limits for the emulated hosts",
+    )
+    parser.add_argument(
+        "--report", type=int, default=10, help="Print the N heaviest sources"
+    )
+    args = parser.parse_args()
+
+    package_dir = Path(__file__).resolve().parents[2]
+    site.addsitedir(str(package_dir))
+    from standin_server import (
+        FAMILIES,
+        StandInConfig,
+        StandInServer,
+        generate_source_args,
+        use_standin,
+    )
+
+    from waste_collection_schedule.fetch_executor import FetchExecutor
+    from waste_collection_schedule.network_stats import get_network_stats
+    from waste_collection_schedule.rate_limiter import get_rate_limiter
+    from waste_collection_schedule.source_shell import SourceShell
+
+    families = args.families.split(",") if args.families else FAMILIES
+    for family in families:
+        if family not in FAMILIES:
+            parser.error(f"unknown provider family: {family}")
+
+    logging.basicConfig(level=logging.ERROR)
+    # expected with many fetch threads
+    logging.getLogger("urllib3").setLevel(logging.CRITICAL)
+
+    # large enough to give every address its own schedule
+    streets = max(1, args.addresses // (10 * 20 * len(families)) + 1)
+    config = StandInConfig(
+        cities=10,
+        streets=streets,
+        house_numbers=20,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+    )
+    if not args.polite:
+        for host in STANDIN_HOSTS:
+            get_rate_limiter().configure(host, rate=None, max_connections=None)
+
+    start = time.perf_counter()
+    shells = []
+    for i in range(args.addresses):
+        family = families[i % len(families)]
+        shells.append(
+            SourceShell.create(
+                family,
+                customize={},
+                source_args=generate_source_args(family, config, i // len(families)),
+            )
+        )
+    print(
+        f"created {len(shells)} sources in {time.perf_counter() - start:.2f}s, "
+        f"{config.addresses} addresses per family"
+    )
+
+    with StandInServer(config, workers=args.workers) as server, use_standin(
+        server.address
+    ):
+        with FetchExecutor(
+            max_workers=args.max_workers,
+            max_batch_size=args.batch_size,
+            # all hosts are emulated, there's nothing to resolve
+            prewarm=False,
+        ) as executor:
+            start = time.perf_counter()
+            results = executor.fetch_all(shells)
+            elapsed = time.perf_counter() - start
+        requests = server.requests
+
+    print(
+        f"refreshed {len(results)} sources in {elapsed:.2f}s "
+        f"({len(results) / elapsed:.0f} sources/s, {requests} requests, "
+        f"{requests / elapsed:.0f} requests/s)"
+    )
+    for family in families:
+        family_results = [
+            r for i, r in enumerate(results) if families[i % len(families)] == family
+        ]
+        ok = sum(r.success for r in family_results)
+        durations = sorted(r.duration or 0.0 for r in family_results)
+        p50 = durations[len(durations) // 2] if durations else 0.0
+        p95 = durations[int(len(durations) * 0.95)] if durations else 0.0
+        print(
+            f"  {family:<18} {ok:>6}/{len(family_results):<6} ok  "
+            f"p50 {p50:.3f}s  p95 {p95:.3f}s"
+        )
+
+    errors = Counter(
+        f"{type(r.error).__name__}: {r.error}"[:120] for r in results if not r.success
+    )
+    for error, n in errors.most_common(5):
+        print(f"  {n:>6} x {error}")
+
+    if args.report:
+        report = get_network_stats().report(shell.unique_id for shell in shells)
+        print("\n".join(report.splitlines()[: args.report + 1]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,712 @@
+#!/usr/bin/env python3
+"""Local stand-in for the servers of the most common provider families.
+
+The server impersonates the protocols of:
+- abfall.io (abfall_io): init form with a hidden token, ICS export
+- ICS file hosts (ics): any other host, with ETag and conditional requests
+- regioit AbfallnaviDe (abfallnavi_de): REST API for cities, streets,
+  house numbers, waste types and dates
+- buergerportal (buergerportal_de): OData style JSON API
+- muellmax (muellmax_de): form flow with a session id
+
+All data is generated: every service has `cities` cities with `streets`
+streets and `house_numbers` house numbers each, named by generate_address().
+Collection dates are derived from the address, so every address gets its
+own, stable schedule.
+
+Requests are routed by their Host header, use_standin() redirects all
+requests of http_client to the stand-in while keeping the original host.
+Responses are delayed by latency (+/- jitter) seconds and fail with 503 at
+error_rate.
+
+Run standalone:
+    standin_server.py --port 8080 --workers 4 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import base64
+import datetime
+import gzip
+import hashlib
+import json
+import multiprocessing
+import random
+import re
+import socket
+import uuid
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse, urlunparse
+
+WASTE_TYPES = [
+    # id, name, interval in days
+    (1, "Restmüll", 14),
+    (2, "Bioabfall", 7),
+    (3, "Papier", 28),
+    (4, "Gelber Sack", 14),
+]
+
+ABFALL_IO_HOST = "api.abfall.io"
+MUELLMAX_HOST = "www.muellmax.de"
+REGIOIT_SUFFIX = "-abfallapp.regioit.de"
+BUERGERPORTAL_HOSTS = ("azurewebsites.net", "buergerportal.digital")
+
+# source name per provider family, see generate_source_args()
+FAMILIES = ["abfall_io", "ics", "abfallnavi_de", "buergerportal_de", "muellmax_de"]
+
+
+class StandInConfig:
+    """Scale and behaviour of the stand-in server."""
+
+    def __init__(
+        self,
+        cities: int = 10,
+        streets: int = 100,
+        house_numbers: int = 20,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.cities = cities
+        self.streets = streets
+        self.house_numbers = house_numbers
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.seed = seed
+
+    @property
+    def addresses(self) -> int:
+        return self.cities * self.streets * self.house_numbers
+
+
+def city_name(city: int) -> str:
+    return f"Ort {city}"
+
+
+def street_name(city: int, street: int) -> str:
+    return f"Straße {city}-{street}"
+
+
+def city_id(city: int) -> int:
+    return 1000 + city
+
+
+def street_id(city: int, street: int) -> int:
+    return city_id(city) * 10000 + street
+
+
+def house_number_id(city: int, street: int, number: int) -> int:
+    return street_id(city, street) * 1000 + number
+
+
+def _parse_street_id(value) -> Tuple[int, int]:
+    value = int(value)
+    return value // 10000 - 1000, value % 10000
+
+
+def _parse_house_number_id(value) -> Tuple[int, int, int]:
+    value = int(value)
+    return _parse_street_id(value // 1000) + (value % 1000,)
+
+
+def generate_address(config: StandInConfig, index: int) -> Tuple[int, int, int]:
+    """Return (city, street, house number) of the index-th address."""
+    index %= config.addresses
+    number = index % config.house_numbers + 1
+    index //= config.house_numbers
+    return index // config.streets, index % config.streets, number
+
+
+def generate_source_args(family: str, config: StandInConfig, index: int) -> Dict:
+    """Return source arguments for the index-th address of a provider family."""
+    city, street, number = generate_address(config, index)
+    if family == "abfall_io":
+        return {
+            "key": f"standin{config.seed}",
+            "f_id_kommune": city_id(city),
+            "f_id_strasse": street_id(city, street),
+            "f_id_strasse_hnr": house_number_id(city, street, number),
+        }
+    if family == "ics":
+        return {"url": f"https://ics.standin.test/{city}/{street}/{number}.ics"}
+    if family == "abfallnavi_de":
+        return {
+            "service": "aachen",
+            "ort": city_name(city),
+            "strasse": street_name(city, street),
+            "hausnummer": str(number),
+        }
+    if family == "buergerportal_de":
+        return {
+            "operator": "cochem_zell",
+            "district": city_name(city),
+            "street": street_name(city, street),
+            "number": number,
+        }
+    if family == "muellmax_de":
+        return {
+            "service": "Rsa",
+            "mm_frm_ort_sel": city_name(city),
+            "mm_frm_str_sel": street_name(city, street),
+            "mm_frm_hnr_sel": str(number),
+        }
+    raise ValueError(f"unknown provider family: {family}")
+
+
+def collection_dates(seed: str, year: int) -> List[Tuple[datetime.date, int, str]]:
+    """Return (date, waste type id, waste type name) of an address in year."""
+    rng = random.Random(seed)
+    entries = []
+    for type_id, name, interval in WASTE_TYPES:
+        date = datetime.date(year, 1, 1) + datetime.timedelta(
+            days=rng.randrange(interval)
+        )
+        while date.year == year:
+            entries.append((date, type_id, name))
+            date += datetime.timedelta(days=interval)
+    entries.sort()
+    return entries
+
+
+def render_ics(entries) -> str:
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//standin//EN"]
+    for date, type_id, name in entries:
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{date:%Y%m%d}-{type_id}@standin",
+            f"DTSTART;VALUE=DATE:{date:%Y%m%d}",
+            f"SUMMARY:{name}",
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines) + "\r\n"
+
+
+class Request:
+    def __init__(self, method: str, target: str, headers: Dict[str, str], body: bytes):
+        self.method = method
+        url = urlparse(target)
+        self.path = url.path
+        self.query = parse_qs(url.query, keep_blank_values=True)
+        self.headers = headers
+        self.host = headers.get("host", "").split(":")[0]
+        self.body = body
+
+    @property
+    def form(self) -> Dict[str, List[str]]:
+        return parse_qs(self.body.decode("utf-8"), keep_blank_values=True)
+
+    def arg(self, name: str, default=None):
+        """Return a query or form argument."""
+        values = self.query.get(name) or self.form.get(name)
+        return values[0] if values else default
+
+
+class Response:
+    def __init__(
+        self,
+        body,
+        status: int = 200,
+        content_type: str = "text/html; charset=utf-8",
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        self.body = body.encode("utf-8") if isinstance(body, str) else body
+        self.status = status
+        self.headers = {"Content-Type": content_type}
+        self.headers.update(headers or {})
+
+
+def _json(data) -> Response:
+    return Response(json.dumps(data), content_type="application/json; charset=utf-8")
+
+
+def _not_found(request: Request) -> Response:
+    return Response(f"not found: {request.path}", status=404)
+
+
+class StandInApp:
+    """Route requests to the provider family of their host."""
+
+    def __init__(self, config: StandInConfig):
+        self._config = config
+
+    def _valid(self, city: int, street: int = 0, number: int = 1) -> bool:
+        c = self._config
+        return (
+            0 <= city < c.cities
+            and 0 <= street < c.streets
+            and 1 <= number <= c.house_numbers
+        )
+
+    def __call__(self, request: Request) -> Response:
+        host = request.host
+        if host == ABFALL_IO_HOST:
+            return self.abfall_io(request)
+        if host == MUELLMAX_HOST:
+            return self.muellmax(request)
+        if host.endswith(REGIOIT_SUFFIX):
+            return self.regioit(request)
+        if host.endswith(BUERGERPORTAL_HOSTS):
+            return self.buergerportal(request)
+        return self.ics_file(request)
+
+    # abfall.io
+
+    def abfall_io(self, request: Request) -> Response:
+        action = request.arg("waction")
+        if action == "init":
+            token = uuid.uuid4().hex
+            return Response(
+                "<form>"
+                f'<input type="hidden" name="f_token_{token[:8]}" value="{token}">'
+                '<input type="hidden" name="f_modus" value="export">'
+                '<select name="f_id_kommune"></select>'
+                "</form>"
+            )
+        if action == "export_ics":
+            form = request.form
+            if not any(k.startswith("f_token_") for k in form):
+                return Response("<b>Fehler:</b> ungültiges Token")
+            city, street = _parse_street_id(request.arg("f_id_strasse", 0))
+            number = 1
+            if request.arg("f_id_strasse_hnr"):
+                number = _parse_house_number_id(request.arg("f_id_strasse_hnr"))[2]
+            if not self._valid(city, street, number):
+                return Response("<b>Fehler:</b> keine Termine gefunden")
+            start, _, end = request.arg("f_zeitraum", "").partition("-")
+            years = range(int(start[:4]), int(end[:4]) + 1) if start else [2024]
+            seed = f"{city}/{street}/{number}"
+            entries = [e for y in years for e in collection_dates(seed, y)]
+            return Response(render_ics(entries), content_type="text/calendar")
+        return _not_found(request)
+
+    # ICS file hosts
+
+    def ics_file(self, request: Request) -> Response:
+        match = re.fullmatch(r"/(\d+)/(\d+)/(\d+)\.ics", request.path)
+        if match is None:
+            return _not_found(request)
+        city, street, number = map(int, match.groups())
+        if not self._valid(city, street, number):
+            return _not_found(request)
+        year = datetime.date.today().year
+        body = render_ics(
+            collection_dates(f"{city}/{street}/{number}", year)
+            + collection_dates(f"{city}/{street}/{number}", year + 1)
+        ).encode("utf-8")
+        etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+        headers = {
+            "ETag": etag,
+            "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+            "Cache-Control": "max-age=0",
+        }
+        if request.headers.get("if-none-match") == etag:
+            return Response(b"", status=304, headers=headers)
+        return Response(body, content_type="text/calendar", headers=headers)
+
+    # regioit AbfallnaviDe
+
+    def regioit(self, request: Request) -> Response:
+        path = re.sub(r"^/abfall-app-[^/]+/rest/", "", request.path)
+        c = self._config
+        if path == "orte":
+            return _json(
+                [{"id": city_id(i), "name": city_name(i)} for i in range(c.cities)]
+            )
+        if path == "fraktionen":
+            return _json([{"id": i, "name": name} for i, name, _ in WASTE_TYPES])
+
+        match = re.fullmatch(r"orte/(\d+)/strassen", path)
+        if match:
+            city = int(match.group(1)) - 1000
+            if not self._valid(city):
+                return _not_found(request)
+            return _json(
+                [
+                    {"id": street_id(city, j), "name": street_name(city, j)}
+                    for j in range(c.streets)
+                ]
+            )
+
+        match = re.fullmatch(r"strassen/(\d+)", path)
+        if match:
+            city, street = _parse_street_id(match.group(1))
+            if not self._valid(city, street):
+                return _not_found(request)
+            return _json(
+                {
+                    "id": street_id(city, street),
+                    "name": street_name(city, street),
+                    "hausNrList": [
+                        {"id": house_number_id(city, street, k), "nr": str(k)}
+                        for k in range(1, c.house_numbers + 1)
+                    ],
+                }
+            )
+
+        match = re.fullmatch(r"(strassen|hausnummern)/(\d+)/termine", path)
+        if match:
+            if match.group(1) == "strassen":
+                city, street = _parse_street_id(match.group(2))
+                number = 1
+            else:
+                city, street, number = _parse_house_number_id(match.group(2))
+            if not self._valid(city, street, number):
+                return _not_found(request)
+            types = {int(f) for f in request.query.get("fraktion", [])}
+            entries = collection_dates(
+                f"{city}/{street}/{number}", datetime.date.today().year
+            )
+            return _json(
+                [
+                    {"datum": date.isoformat(), "bezirk": {"fraktionId": type_id}}
+                    for date, type_id, _ in entries
+                    if not types or type_id in types
+                ]
+            )
+        return _not_found(request)
+
+    # buergerportal
+
+    def buergerportal(self, request: Request) -> Response:
+        c = self._config
+        if request.path == "/api/OrteMitOrtsteilen":
+            return _json(
+                {
+                    "d": [
+                        {
+                            "OrteId": city_id(i),
+                            "Ortsname": city_name(i),
+                            "Ortsteilname": None,
+                        }
+                        for i in range(c.cities)
+                    ]
+                }
+            )
+        if request.path == "/api/Strassen":
+            match = re.search(r"OrteId eq (\d+)", request.arg("$filter", ""))
+            city = int(match.group(1)) - 1000 if match else -1
+            if not self._valid(city):
+                return _json({"d": []})
+            return _json(
+                {
+                    "d": [
+                        {
+                            "StrassenId": street_id(city, j),
+                            "Name": street_name(city, j),
+                            "Plz": f"{10000 + city}",
+                        }
+                        for j in range(c.streets)
+                    ]
+                }
+            )
+        if request.path == "/api/AbfuhrtermineAbJahr":
+            city = int(request.arg("orteId", 0)) - 1000
+            _, street = _parse_street_id(request.arg("strassenId", 0))
+            number = int(request.arg("hausNr", "'1'").strip("'") or 1)
+            if not self._valid(city, street, number):
+                return _json({"d": []})
+            entries = collection_dates(
+                f"{city}/{street}/{number}", int(request.arg("jahr", 2024))
+            )
+            epoch = datetime.date(1970, 1, 1)
+            return _json(
+                {
+                    "d": [
+                        {
+                            "AbfuhrtermineId": i,
+                            "Termin": f"/Date({(date - epoch).days * 86400000})/",
+                            "Abfuhrplan": {
+                                "GefaesstarifArt": {"Abfallart": {"Name": name}}
+                            },
+                        }
+                        for i, (date, _, name) in enumerate(entries)
+                    ]
+                }
+            )
+        return _not_found(request)
+
+    # muellmax
+
+    def muellmax(self, request: Request) -> Response:
+        # the session state is kept in mm_ses itself, so that any worker
+        # process can serve any step of the flow
+        try:
+            state = json.loads(base64.urlsafe_b64decode(request.arg("mm_ses", "")))
+        except ValueError:
+            state = {}
+        for field in ("mm_frm_ort_sel", "mm_frm_str_sel", "mm_frm_hnr_sel"):
+            if request.arg(field) is not None:
+                state[field] = request.arg(field)
+        ses = base64.urlsafe_b64encode(json.dumps(state).encode()).decode()
+        session_input = f'<input type="hidden" name="mm_ses" value="{ses}">'
+
+        if request.arg("mm_ica_gen") is not None:
+            city = street = -1
+            match = re.fullmatch(r"Ort (\d+)", state.get("mm_frm_ort_sel", ""))
+            if match:
+                city = int(match.group(1))
+            match = re.fullmatch(r"Straße (\d+)-(\d+)", state.get("mm_frm_str_sel", ""))
+            if match and int(match.group(1)) == city:
+                street = int(match.group(2))
+            number = int(state.get("mm_frm_hnr_sel") or 1)
+            if not self._valid(city, street, number):
+                return Response(f"<html>{session_input}Keine Termine</html>")
+            types = {
+                int(v)
+                for k, v in request.form.items()
+                if k.startswith("mm_frm_fra")
+                for v in v
+            }
+            entries = [
+                e
+                for e in collection_dates(
+                    f"{city}/{street}/{number}", datetime.date.today().year
+                )
+                if e[1] in types
+            ]
+            return Response(render_ics(entries), content_type="text/calendar")
+
+        body = session_input
+        if request.arg("mm_ica_auswahl") is not None:
+            body += "".join(
+                f'<input type="checkbox" name="mm_frm_fra_{i}" value="{i}">'
+                for i, _, _ in WASTE_TYPES
+            )
+        return Response(f"<html><form>{body}</form></html>")
+
+
+def _encode_response(response: Response, head: bool, gzip_ok: bool) -> bytes:
+    body = response.body
+    headers = dict(response.headers)
+    if gzip_ok and len(body) > 1024:
+        body = gzip.compress(body, compresslevel=1)
+        headers["Content-Encoding"] = "gzip"
+    headers["Content-Length"] = str(len(body))
+    reason = {200: "OK", 304: "Not Modified", 404: "Not Found"}.get(
+        response.status, "Service Unavailable"
+    )
+    lines = [f"HTTP/1.1 {response.status} {reason}"]
+    lines += [f"{k}: {v}" for k, v in headers.items()]
+    head_bytes = ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8")
+    return head_bytes if head or response.status == 304 else head_bytes + body
+
+
+class StandInServer:
+    """Serve StandInApp with HTTP/1.1 from one or more worker processes.
+
+    With several workers, each process accepts connections on the same port
+    (SO_REUSEPORT, Linux only).
+    """
+
+    def __init__(
+        self,
+        config: Optional[StandInConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        workers: int = 1,
+    ):
+        self._config = config or StandInConfig()
+        self._host = host
+        self._port = port
+        self._workers = workers
+        self._processes: List[multiprocessing.Process] = []
+        self._requests = multiprocessing.Value("q", 0)
+
+    @property
+    def address(self) -> str:
+        return f"{self._host}:{self._port}"
+
+    @property
+    def requests(self) -> int:
+        """Return number of requests served by all workers."""
+        return self._requests.value
+
+    def start(self):
+        sock = None
+        if self._port == 0 or self._workers > 1:
+            # bind the port before the workers start, so that they share it
+            sock = self._socket()
+            self._port = sock.getsockname()[1]
+        ready = multiprocessing.Queue()
+        for _ in range(self._workers):
+            process = multiprocessing.Process(
+                target=self._serve, args=(ready,), daemon=True
+            )
+            process.start()
+            self._processes.append(process)
+        for _ in range(self._workers):
+            ready.get(timeout=10)
+        if sock is not None:
+            sock.close()
+
+    def stop(self):
+        for process in self._processes:
+            process.terminate()
+        for process in self._processes:
+            process.join()
+        self._processes = []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.stop()
+
+    def _socket(self) -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if self._workers > 1:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind((self._host, self._port))
+        return sock
+
+    def _serve(self, ready):
+        app = StandInApp(self._config)
+        loop = asyncio.new_event_loop()
+        sock = self._socket()
+        sock.listen(1024)
+
+        async def handle(reader, writer):
+            try:
+                await self._handle_connection(app, reader, writer)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                pass
+            finally:
+                writer.close()
+
+        loop.run_until_complete(asyncio.start_server(handle, sock=sock))
+        ready.put(True)
+        loop.run_forever()
+
+    async def _handle_connection(self, app: StandInApp, reader, writer):
+        config = self._config
+        rng = random.Random()
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except asyncio.IncompleteReadError:
+                return
+            request_line, *header_lines = head.decode("latin-1").split("\r\n")
+            method, target, _ = request_line.split(" ", 2)
+            headers = {}
+            for line in header_lines:
+                if line:
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+            with self._requests.get_lock():
+                self._requests.value += 1
+            delay = config.latency + config.jitter * (2 * rng.random() - 1)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if rng.random() < config.error_rate:
+                response = Response("try again later", status=503)
+            else:
+                response = app(Request(method, target, headers, body))
+            writer.write(
+                _encode_response(
+                    response,
+                    head=method == "HEAD",
+                    gzip_ok="gzip" in headers.get("accept-encoding", ""),
+                )
+            )
+            await writer.drain()
+            if headers.get("connection", "").lower() == "close":
+                return
+
+
+@contextmanager
+def use_standin(address: str):
+    """Send all requests of http_client to the stand-in server at address."""
+    from waste_collection_schedule import http_client, tls
+
+    class StandInAdapter(http_client.SourceAdapter):
+        """Rewrite request URLs to the stand-in, keeping the Host header."""
+
+        def transport_send(self, request, **kwargs):
+            url = urlparse(request.url)
+            original = request
+            request = request.copy()
+            request.headers["Host"] = url.netloc
+            request.url = urlunparse(
+                ("http", address, url.path, url.params, url.query, "")
+            )
+            response = super().transport_send(request, **kwargs)
+            response.request = original
+            response.url = original.url
+            return response
+
+    client = http_client.HttpClient()
+    for name in (
+        http_client.DEFAULT_ADAPTER,
+        http_client.LEGACY_SSL_ADAPTER,
+        http_client.HTTP2_ADAPTER,
+    ):
+        client.register_adapter(
+            name,
+            StandInAdapter(
+                default_timeout=client.timeout,
+                tls_profile=(
+                    tls.LEGACY
+                    if name == http_client.LEGACY_SSL_ADAPTER
+                    else tls.DEFAULT
+                ),
+            ),
+        )
+    previous = http_client.get_http_client()
+    http_client.set_http_client(client)
+    try:
+        yield client
+    finally:
+        http_client.set_http_client(previous)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the provider stand-in server.")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on")
+    parser.add_argument("--port", type=int, default=8080, help="Port to listen on")
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Number of server processes"
+    )
+    parser.add_argument("--cities", type=int, default=10, help="Cities per service")
+    parser.add_argument("--streets", type=int, default=100, help="Streets per city")
+    parser.add_argument(
+        "--house-numbers", type=int, default=20, help="House numbers per street"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Response delay in seconds"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="Random +/- variation of latency"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Share of 503 responses"
+    )
+    args = parser.parse_args()
+
+    config = StandInConfig(
+        cities=args.cities,
+        streets=args.streets,
+        house_numbers=args.house_numbers,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+    )
+    server = StandInServer(config, args.host, args.port, args.workers)
+    server.start()
+    print(f"serving {config.addresses} addresses per service on {server.address}")
+    try:
+        for process in server._processes:
+            process.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ import datetime
 import importlib
 import re
 import site
+import time
 import traceback
 from pathlib import Path
 
@@ -25,7 +26,36 @@ def main():
     parser.add_argument(
         "-i", "--icon", action="store_true", help="Show waste type icon"
     )
+    parser.add_argument(
+        "--record",
+        metavar="DIR",
+        help="Record HTTP traffic of all test cases into cassettes in DIR",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="DIR",
+        help="Replay HTTP traffic from cassettes in DIR instead of using the network",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Artificial latency per replayed response in seconds",
+    )
+    parser.add_argument(
+        "--latency-scale",
+        type=float,
+        default=0.0,
+        help="Delay replayed responses by this factor of the recorded response time",
+    )
+    parser.add_argument(
+        "--network",
+        action="store_true",
+        help="Show requests, bytes and response times per test case and host",
+    )
     args = parser.parse_args()
+    if args.record is not None and args.replay is not None:
+        parser.error("--record and --replay are mutually exclusive")
 
     # read secrets.yaml
     secrets = {}
@@ -45,6 +75,13 @@ def main():
     # add module directory to path
     site.addsitedir(str(package_dir))
 
+    from waste_collection_schedule import cassette, http_cache, http_client
+    from waste_collection_schedule.network_stats import get_network_stats
+
+    cassette_dir = args.record or args.replay
+    if args.record is not None:
+        Path(args.record).mkdir(parents=True, exist_ok=True)
+
     if args.source is not None:
         files = args.source
     else:
@@ -67,15 +104,39 @@ def main():
         assert "URL" in names
         assert "TEST_CASES" in names
 
+        cassettes = {}
+        cassette_file = None
+        if cassette_dir is not None:
+            cassette_file = Path(cassette_dir) / f"{f}.json.gz"
+            if args.replay is not None:
+                if not cassette_file.exists():
+                    print(f"  no cassette {cassette_file}, skipped")
+                    continue
+                cassettes = cassette.load_cassettes(str(cassette_file))
+
         # run through all test-cases
         for name, tc in module.TEST_CASES.items():
             # replace secrets in arguments
             replace_secret(secrets, tc)
 
-            # create source
-            source = module.Source(**tc)
+            # every test case starts with an empty http cache, so that
+            # recorded and replayed requests are the same
+            http_cache.set_http_cache(http_cache.HttpCache())
+
             try:
-                result = source.fetch()
+                if cassette_file is None:
+                    with http_client.source_context(f"{f}/{name}"):
+                        result = module.Source(**tc).fetch()
+                else:
+                    mode = cassette.RECORD if args.record else cassette.REPLAY
+                    c = cassettes.setdefault(name, cassette.Cassette())
+                    with cassette.use_cassette(
+                        c, mode, latency=args.latency, latency_scale=args.latency_scale
+                    ), http_client.source_context(f"{f}/{name}"):
+                        start = time.perf_counter()
+                        result = module.Source(**tc).fetch()
+                        duration = time.perf_counter() - start
+                    print(f"  {mode}: {len(c)} requests in {duration:.3f}s")
                 print(f"  found {len(result)} entries for {name}")
 
                 # test if source is returning the correct date format
@@ -100,6 +161,16 @@ def main():
             except Exception:
                 print(traceback.format_exc())
 
+        if args.network:
+            print(
+                get_network_stats().report(
+                    f"{f}/{name}" for name in module.TEST_CASES.keys()
+                )
+            )
+
+        if args.record is not None:
+            cassette.save_cassettes(str(cassette_file), cassettes)
+
 
 def replace_secret(secrets, d):
     for key in d.keys():
@@ -0,0 +1,170 @@
+"""Process wide registry of pre-built TLS contexts.
+
+Building an SSLContext and loading the CA bundle is expensive, urllib3 does
+it for every new connection unless a context is passed in. The registry
+builds every profile once per process and counts the TLS handshakes done
+with it.
+
+Profiles:
+- default: certificate verification with the CA bundle of requests
+- legacy: like default, but allows unsafe legacy renegotiation, which some
+  outdated servers still require
+Every profile is built per value of requests' verify argument: True (CA
+bundle of requests), a path to a CA bundle or directory, or False
+(verification disabled).
+"""
+
+import logging
+import os
+import ssl
+import threading
+import time
+from typing import Callable, Dict, Tuple, Union
+
+from requests.utils import DEFAULT_CA_BUNDLE_PATH
+from urllib3.util.ssl_ import create_urllib3_context
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT = "default"
+LEGACY = "legacy"
+
+OP_LEGACY_SERVER_CONNECT = 0x4
+
+# verify argument of requests: bool or path to CA bundle or directory
+Verify = Union[bool, str]
+
+
+class _TimedSSLSocket(ssl.SSLSocket):
+    """SSLSocket which reports the duration of its handshake to the registry."""
+
+    def do_handshake(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return super().do_handshake(*args, **kwargs)
+        finally:
+            key = getattr(self.context, "wcs_profile", None)
+            if key is not None:
+                get_tls_registry().record_handshake(key, time.perf_counter() - start)
+
+
+def create_default_context(verify: Verify = True) -> ssl.SSLContext:
+    """Return context configured like the ones urllib3 creates per connection."""
+    ctx = create_urllib3_context()
+    if verify:
+        ca = DEFAULT_CA_BUNDLE_PATH if verify is True else verify
+        if os.path.isdir(ca):
+            ctx.load_verify_locations(capath=ca)
+        else:
+            ctx.load_verify_locations(cafile=ca)
+    else:
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+
+def create_legacy_context(verify: Verify = True) -> ssl.SSLContext:
+    """Return context which allows unsafe legacy renegotiation.
+
+    Works around SSL UNSAFE_LEGACY_RENEGOTIATION_DISABLED errors, see
+    https://stackoverflow.com/questions/71603314/ssl-error-unsafe-legacy-renegotiation-disabled
+    """
+    ctx = create_default_context(verify)
+    if verify:
+        ctx.load_default_certs(ssl.Purpose.SERVER_AUTH)
+    ctx.options |= OP_LEGACY_SERVER_CONNECT
+    return ctx
+
+
+class TlsContextRegistry:
+    """Build TLS contexts once per profile and count their handshakes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._factories: Dict[str, Callable[[Verify], ssl.SSLContext]] = {
+            DEFAULT: create_default_context,
+            LEGACY: create_legacy_context,
+        }
+        self._contexts: Dict[Tuple[str, Verify], ssl.SSLContext] = {}
+
+        # statistics per context key: [count, total time, max time, build time]
+        self._stats: Dict[str, list] = {}
+
+    @staticmethod
+    def key(profile: str, verify: Verify) -> str:
+        if verify is True:
+            return profile
+        if verify is False:
+            return f"{profile} (no verify)"
+        return f"{profile} ({verify})"
+
+    def register(self, profile: str, factory: Callable[[Verify], ssl.SSLContext]):
+        """Add or replace a profile. factory(verify) returns a new context."""
+        with self._lock:
+            self._factories[profile] = factory
+            self._contexts = {
+                k: ctx for k, ctx in self._contexts.items() if k[0] != profile
+            }
+
+    def _build(self, profile: str, verify: Verify) -> ssl.SSLContext:
+        factory = self._factories.get(profile)
+        if factory is None:
+            raise KeyError(f"unknown tls profile: {profile}")
+
+        start = time.perf_counter()
+        ctx = factory(verify)
+        build_time = time.perf_counter() - start
+        ctx.sslsocket_class = _TimedSSLSocket
+        ctx.wcs_profile = self.key(profile, verify)
+        self._stats.setdefault(ctx.wcs_profile, [0, 0.0, 0.0, 0.0])[3] = build_time
+        _LOGGER.debug(f"built tls context {ctx.wcs_profile} in {build_time:.3f}s")
+        return ctx
+
+    def context(self, profile: str = DEFAULT, verify: Verify = True) -> ssl.SSLContext:
+        """Return the shared context of a profile, build it on first use."""
+        with self._lock:
+            ctx = self._contexts.get((profile, verify))
+            if ctx is None:
+                ctx = self._contexts[(profile, verify)] = self._build(profile, verify)
+            return ctx
+
+    def new_context(
+        self, profile: str = DEFAULT, verify: Verify = True
+    ) -> ssl.SSLContext:
+        """Return a new context of a profile which is not shared.
+
+        For HTTP stacks which modify the context, e.g. to set the ALPN
+        protocols. Its handshakes are counted like the ones of the shared
+        context.
+        """
+        with self._lock:
+            return self._build(profile, verify)
+
+    def record_handshake(self, key: str, duration: float):
+        with self._lock:
+            stats = self._stats.setdefault(key, [0, 0.0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += duration
+            stats[2] = max(stats[2], duration)
+
+    def stats(self) -> Dict[str, Dict]:
+        """Return number and duration of handshakes per profile."""
+        with self._lock:
+            return {
+                key: {
+                    "handshakes": count,
+                    "total_time": total,
+                    "avg_time": total / count if count else 0.0,
+                    "max_time": max_time,
+                    "build_time": build_time,
+                }
+                for key, (count, total, max_time, build_time) in self._stats.items()
+            }
+
+
+_tls_registry = TlsContextRegistry()
+
+
+def get_tls_registry() -> TlsContextRegistry:
+    """Return the process wide TLS context registry."""
+    return _tls_registry
@@ -0,0 +1,8 @@
+import sys
+from pathlib import Path
+
+# make the waste_collection_schedule package importable without Home Assistant
+sys.path.insert(
+    0,
+    str(Path(__file__).parents[1] / "custom_components" / "waste_collection_schedule"),
+)
@@ -0,0 +1,39 @@
+import concurrent.futures
+
+from waste_collection_schedule import fetch_executor
+from waste_collection_schedule.fetch_executor import FetchExecutor
+
+
+class FakeShell:
+    batchable = True
+    batch_key = "fake"
+    last_error = None
+    snapshot_store = None
+
+    def __init__(self, unique_id):
+        self.unique_id = unique_id
+        self.title = unique_id
+        self.prepared = None
+
+    def prepare_batch(self, shells):
+        return {shell.unique_id: "prepared" for shell in shells}
+
+    def fetch(self, prepared=None):
+        self.prepared = prepared
+
+
+def test_batch_prepared_right_after_timeout_is_reported_timed_out(monkeypatch):
+    def as_completed_timing_out(futures, timeout=None):
+        # the prepare task finishes between the timeout and its check
+        concurrent.futures.wait(futures)
+        raise concurrent.futures.TimeoutError()
+
+    monkeypatch.setattr(
+        fetch_executor.concurrent.futures, "as_completed", as_completed_timing_out
+    )
+    shells = [FakeShell("a"), FakeShell("b")]
+    with FetchExecutor(max_batch_size=2, prewarm=False) as executor:
+        results = executor.fetch_all(shells, timeout=1)
+
+    assert [r.timed_out for r in results] == [True, True]
+    assert [shell.prepared for shell in shells] == [None, None]
@@ -0,0 +1,67 @@
+import http.server
+import threading
+
+import pytest
+
+from waste_collection_schedule import http_cache
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        etag = f'"{self.path}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = self.path.encode()
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def _text(response):
+    return response.content.decode()
+
+
+def test_least_recently_used_entries_are_evicted(base_url):
+    cache = http_cache.HttpCache(max_entries=2)
+    for path in ["/a", "/b", "/a", "/c", "/a", "/b"]:
+        assert cache.get(base_url + path, _text) == path
+
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    # /a stayed cached and was revalidated, /b was evicted by /c
+    assert stats["revalidated"] == 2
+    assert stats["misses"] == 4
+
+
+def test_evicted_entries_are_reloaded_from_disk(base_url, tmp_path):
+    cache = http_cache.HttpCache(directory=str(tmp_path), max_entries=1)
+    for path in ["/a", "/b", "/a"]:
+        assert cache.get(base_url + path, _text) == path
+
+    stats = cache.stats()
+    assert stats["entries"] == 1
+    assert stats["revalidated"] == 1
+    assert stats["misses"] == 2
+
+    cache.clear()
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,61 @@
+import time
+
+import pytest
+import requests
+
+from waste_collection_schedule import deadline, http_client
+from waste_collection_schedule.exceptions import CircuitOpenError, FetchTimeoutError
+from waste_collection_schedule.resilience import get_resilience
+
+
+class SlowAdapter(http_client.SourceAdapter):
+    """Adapter whose requests time out like a server which doesn't answer."""
+
+    def transport_send(self, request, timeout=None, **kwargs):
+        time.sleep(min(timeout) if isinstance(timeout, tuple) else timeout)
+        raise requests.ReadTimeout()
+
+
+def _request(host):
+    return requests.Request("GET", f"http://{host}/").prepare()
+
+
+def _half_open(host):
+    breaker = get_resilience().host_breaker(host)
+    for _ in range(5):
+        breaker.record_failure()
+    assert breaker.state == "open"
+    # pretend the reset timeout has passed
+    breaker._opened_at -= 3600
+    assert breaker.state == "half-open"
+    return breaker
+
+
+def test_half_open_trial_released_after_fetch_timeout():
+    host = "trial-timeout.invalid"
+    breaker = _half_open(host)
+    adapter = SlowAdapter()
+
+    with deadline.fetch_deadline(0.2):
+        with pytest.raises(FetchTimeoutError):
+            adapter.send(_request(host))
+
+    # the deadline was the fetch's fault: the next request is the new trial
+    assert breaker.state == "half-open"
+    with pytest.raises(requests.ReadTimeout):
+        adapter.send(_request(host), timeout=0.01)
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        adapter.send(_request(host))
+
+
+def test_half_open_trial_released_if_deadline_passed_before_request():
+    host = "trial-expired.invalid"
+    breaker = _half_open(host)
+    adapter = SlowAdapter()
+
+    with deadline.fetch_deadline(0):
+        with pytest.raises(FetchTimeoutError):
+            adapter.send(_request(host))
+
+    assert breaker.before_call() is True
@@ -0,0 +1,40 @@
+import time
+
+import pytest
+
+from waste_collection_schedule import deadline
+from waste_collection_schedule.exceptions import FetchTimeoutError
+from waste_collection_schedule.rate_limiter import HostLimit
+
+
+def test_token_is_refunded_if_wait_exceeds_deadline():
+    limit = HostLimit("example.com", rate=1.0, burst=1)
+    with limit.acquire():
+        pass
+
+    # the next token is available in 1s, more than the fetch has left
+    for _ in range(3):
+        with deadline.fetch_deadline(0.1):
+            with pytest.raises(FetchTimeoutError):
+                with limit.acquire():
+                    pass
+
+    # the aborted requests didn't borrow tokens from the future
+    start = time.monotonic()
+    with limit.acquire():
+        pass
+    assert time.monotonic() - start < 1.5
+
+
+def test_token_is_refunded_if_no_connection_slot_is_free():
+    limit = HostLimit("example.com", rate=1.0, burst=2, max_connections=1)
+    with limit.acquire():
+        with deadline.fetch_deadline(0.05):
+            with pytest.raises(FetchTimeoutError):
+                with limit.acquire():
+                    pass
+
+    start = time.monotonic()
+    with limit.acquire():
+        pass
+    assert time.monotonic() - start < 0.5